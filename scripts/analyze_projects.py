@@ -2,42 +2,58 @@
 """
 Comprehensive project analysis script for comparing local and remote repositories,
 identifying technology stacks, and ranking maturity
+
+Usage:
+    analyze_projects.py                 # analyse everything in this process
+    analyze_projects.py --shard 2/4     # analyse shard 2 of 4 into analysis/shards/
+    analyze_projects.py --merge [N]     # combine shard results into the normal outputs
+    analyze_projects.py --spawn 4       # run 4 shard processes locally, then merge
+
+Shards split projects deterministically (crc32 of root/category/name), so
+separate machines sharing the Projects export can each run one shard.
 """
 import json
 import os
+import re
 import subprocess
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import hashlib
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+import json_io
+from tree_walk import WalkBudget, walk_project
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
 
 # Configuration
 PROJECTS_DIR = Path('/Users/dalerogers/Projects')
 GITHUB_REPOS_FILE = PROJECTS_DIR / 'github_repos_duds.json'
+SHARDS_DIR = PROJECTS_DIR / 'analysis' / 'shards'
+GIT_WORKERS = 8
 
 
 def load_github_repos() -> List[Dict[str, Any]]:
     """Load GitHub repository metadata"""
-    with open(GITHUB_REPOS_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return json_io.load(GITHUB_REPOS_FILE)
 
 
 def get_local_projects() -> List[Dict[str, Any]]:
     """Get list of local projects with basic info"""
-    projects = []
-    exclude_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 
-                   'dist', 'build', '.next', 'uploads', 'test-results',
-                   'storybook-static', 'playwright-report', '.cursor'}
-    
-    for item in PROJECTS_DIR.iterdir():
-        if item.is_dir() and not item.name.startswith('.') and item.name not in exclude_dirs:
-            projects.append({
-                'name': item.name,
-                'path': str(item),
-                'exists': True
-            })
-    
-    return projects
+    from discovery import discover_projects
+    
+    return [{
+        'name': proj['name'],
+        'path': proj['path'],
+        'root': proj['root'],
+        'category': proj['category'],
+        'exists': True
+    } for proj in discover_projects()]
 
 
 def get_git_info(project_path: Path) -> Dict[str, Any]:
@@ -96,8 +112,328 @@ def get_git_info(project_path: Path) -> Dict[str, Any]:
         }
 
 
-def detect_tech_stack(project_path: Path) -> Dict[str, Any]:
-    """Detect technology stack for a project"""
+def parse_track(track: str) -> Dict[str, Any]:
+    """Parse for-each-ref %(upstream:track,nobracket) output, e.g. 'ahead 2, behind 1'"""
+    counts = {'ahead': 0, 'behind': 0}
+    if track == 'gone':
+        return {**counts, 'gone': True}
+    
+    for part in filter(None, (p.strip() for p in track.split(','))):
+        direction, count = part.split()
+        counts[direction] = int(count)
+    
+    return {**counts, 'gone': False}
+
+
+def get_divergence(project_path: Path) -> Dict[str, Any]:
+    """Get ahead/behind counts for every local branch from its tracking ref.
+    
+    Uses a single for-each-ref call; counts are relative to the last fetched
+    state of the upstream, so nothing touches the network.
+    """
+    if not (project_path / '.git').exists():
+        return {'state': 'not_git', 'branches': []}
+    
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(project_path), 'for-each-ref',
+             '--format=%(HEAD)%09%(refname:short)%09%(upstream:short)%09%(upstream:track,nobracket)',
+             'refs/heads'],
+            capture_output=True, text=True, timeout=10
+        )
+    except subprocess.TimeoutExpired:
+        return {'state': 'error', 'error': 'timeout', 'branches': []}
+    
+    if result.returncode != 0:
+        return {'state': 'error', 'error': result.stderr.strip(), 'branches': []}
+    
+    branches = []
+    current = None
+    for line in result.stdout.splitlines():
+        head, name, upstream, track = (line.split('\t') + ['', '', '', ''])[:4]
+        branch = {'branch': name, 'upstream': upstream or None, **parse_track(track)}
+        if not upstream:
+            branch['state'] = 'no_upstream'
+        elif branch['gone']:
+            branch['state'] = 'upstream_gone'
+        elif branch['ahead'] and branch['behind']:
+            branch['state'] = 'diverged'
+        elif branch['ahead']:
+            branch['state'] = 'ahead'
+        elif branch['behind']:
+            branch['state'] = 'behind'
+        else:
+            branch['state'] = 'up_to_date'
+        branches.append(branch)
+        if head == '*':
+            current = branch
+    
+    if current is None:
+        return {'state': 'detached', 'branches': branches}
+    
+    return {
+        'state': current['state'],
+        'branch': current['branch'],
+        'upstream': current['upstream'],
+        'ahead': current['ahead'],
+        'behind': current['behind'],
+        'branches': branches
+    }
+
+
+def collect_divergence(project_paths: List[Path], max_workers: int = GIT_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """Collect divergence for many repos concurrently, keyed by path"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(get_divergence, project_paths)
+        return {str(path): divergence for path, divergence in zip(project_paths, results)}
+
+
+# Marker files recorded in tech_stack['found_files']
+MARKER_FILES = {
+    'package.json': 'Node.js/JavaScript',
+    'requirements.txt': 'Python',
+    'pyproject.toml': 'Python',
+    'Cargo.toml': 'Rust',
+    'go.mod': 'Go',
+    'pom.xml': 'Java',
+    'build.gradle': 'Java/Kotlin',
+    'Gemfile': 'Ruby',
+    'composer.json': 'PHP',
+    'Dockerfile': 'Docker',
+    'docker-compose.yml': 'Docker',
+    '.cursorrules': 'Cursor',
+}
+
+# Ecosystem rules, evaluated in order against a single directory listing.
+# An ecosystem is active when one of its manifests is present and parses
+# (or merely present, with 'active_on_presence'). The order is the
+# precedence: a later active ecosystem overrides the primary language of an
+# earlier one, and overrides its framework only when one of its own rules
+# names a framework. Node and Python keep the original checks, so a Next.js
+# app with a requirements.txt is Python/Next.js and one with a manage.py is
+# Python/Django, exactly as before the table existed.
+#
+# Framework rules are (kind, value, framework, category), first match wins:
+#   dependency        - exact dependency name from the parsed manifests
+#   dependency_prefix - dependency name equal to or starting with value
+#   file              - file present in the project root
+TECH_STACK_RULES = [
+    {
+        'manifests': ['Cargo.toml'],
+        'language': 'Rust',
+        'frameworks': [
+            ('dependency', 'tauri', 'Tauri', 'Desktop'),
+            ('dependency', 'axum', 'Axum', 'Backend/API'),
+            ('dependency', 'actix-web', 'Actix Web', 'Backend/API'),
+            ('dependency', 'rocket', 'Rocket', 'Backend/API'),
+        ],
+        'package_managers': [('Cargo.toml', 'cargo')],
+    },
+    {
+        'manifests': ['go.mod'],
+        'language': 'Go',
+        'frameworks': [
+            ('dependency_prefix', 'github.com/gin-gonic/gin', 'Gin', 'Backend/API'),
+            ('dependency_prefix', 'github.com/labstack/echo', 'Echo', 'Backend/API'),
+            ('dependency_prefix', 'github.com/gofiber/fiber', 'Fiber', 'Backend/API'),
+        ],
+        'package_managers': [('go.mod', 'go modules')],
+    },
+    {
+        'manifests': ['pom.xml', 'build.gradle', 'build.gradle.kts'],
+        'language': 'Java',
+        'frameworks': [
+            ('dependency_prefix', 'spring-boot', 'Spring Boot', 'Backend/API'),
+            ('dependency_prefix', 'quarkus', 'Quarkus', 'Backend/API'),
+            ('dependency_prefix', 'micronaut', 'Micronaut', 'Backend/API'),
+        ],
+        'package_managers': [('pom.xml', 'maven'), ('build.gradle', 'gradle'), ('build.gradle.kts', 'gradle')],
+    },
+    {
+        'manifests': ['package.json'],
+        'language': 'JavaScript',
+        'language_if_dependency': {'typescript': 'TypeScript'},
+        'frameworks': [
+            ('dependency', 'next', 'Next.js', 'Web/Frontend'),
+            ('dependency', 'react', 'React', 'Web/Frontend'),
+            ('dependency', 'vue', 'Vue', 'Web/Frontend'),
+            ('dependency', 'astro', 'Astro', 'Web/Frontend'),
+            ('dependency', 'express', 'Express', 'Backend/API'),
+        ],
+        'build_tools': {'vite': 'Vite', 'webpack': 'Webpack'},
+        'package_managers': [('pnpm-lock.yaml', 'pnpm'), ('yarn.lock', 'yarn'), ('package-lock.json', 'npm')],
+    },
+    {
+        'manifests': ['requirements.txt', 'pyproject.toml'],
+        'language': 'Python',
+        'active_on_presence': True,
+        'frameworks': [
+            ('file', 'manage.py', 'Django', 'Backend/API'),
+            # Could be Flask, FastAPI, etc.
+            ('file', 'app.py', None, 'Backend/API'),
+            ('file', 'main.py', None, 'Backend/API'),
+        ],
+    },
+]
+
+REQUIREMENT_NAME = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._\-]*)')
+
+
+def _normalise_requirement(line: str) -> Optional[str]:
+    """Extract a normalised package name from a requirement specifier"""
+    line = line.split('#', 1)[0].strip()
+    if not line or line.startswith('-'):
+        return None
+    match = REQUIREMENT_NAME.match(line)
+    return match.group(1).lower().replace('_', '-') if match else None
+
+
+def _load_toml(path: Path) -> Optional[Dict[str, Any]]:
+    if tomllib is None:
+        return None
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
+
+def _parse_package_json(path: Path) -> Set[str]:
+    with open(path, 'r', encoding='utf-8') as f:
+        pkg_data = json.load(f)
+    return {**pkg_data.get('dependencies', {}), **pkg_data.get('devDependencies', {})}.keys()
+
+
+def _parse_requirements_txt(path: Path) -> Set[str]:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return {name for name in map(_normalise_requirement, f) if name}
+
+
+def _parse_pyproject_toml(path: Path) -> Set[str]:
+    data = _load_toml(path)
+    if data is None:
+        return set()
+    project = data.get('project', {})
+    specs = list(project.get('dependencies', []))
+    for extra in project.get('optional-dependencies', {}).values():
+        specs.extend(extra)
+    names = {name for name in map(_normalise_requirement, specs) if name}
+    poetry = data.get('tool', {}).get('poetry', {})
+    names.update(n.lower() for n in poetry.get('dependencies', {}) if n.lower() != 'python')
+    return names
+
+
+def _parse_cargo_toml(path: Path) -> Set[str]:
+    data = _load_toml(path)
+    if data is None:
+        return set()
+    names = set()
+    for section in ('dependencies', 'dev-dependencies', 'build-dependencies'):
+        names.update(data.get(section, {}))
+    return names
+
+
+def _parse_go_mod(path: Path) -> Set[str]:
+    names = set()
+    in_require = False
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            line = line.split('//', 1)[0].strip()
+            if line.startswith('require ('):
+                in_require = True
+            elif in_require and line == ')':
+                in_require = False
+            elif in_require and line:
+                names.add(line.split()[0])
+            elif line.startswith('require '):
+                names.add(line.split()[1])
+    return names
+
+
+def _parse_maven_or_gradle(path: Path) -> Set[str]:
+    text = path.read_text(encoding='utf-8', errors='replace')
+    if path.name == 'pom.xml':
+        return set(re.findall(r'<artifactId>\s*([^<\s]+)\s*</artifactId>', text))
+    # 'group:artifact:version' coordinates and plugin ids
+    names = {m.split(':')[1] for m in re.findall(r'["\']([\w.\-]+:[\w.\-]+)(?::[^"\']*)?["\']', text)}
+    names.update(p.split('.')[-1] for p in re.findall(r'id\s*\(?\s*["\']([\w.\-]+)["\']', text))
+    return names
+
+
+MANIFEST_PARSERS = {
+    'package.json': _parse_package_json,
+    'requirements.txt': _parse_requirements_txt,
+    'pyproject.toml': _parse_pyproject_toml,
+    'Cargo.toml': _parse_cargo_toml,
+    'go.mod': _parse_go_mod,
+    'pom.xml': _parse_maven_or_gradle,
+    'build.gradle': _parse_maven_or_gradle,
+    'build.gradle.kts': _parse_maven_or_gradle,
+}
+
+
+def _entry_kind(entry: os.DirEntry) -> Optional[str]:
+    """'dir' or 'file' with symlinks followed (like Path.exists), None if broken or neither"""
+    try:
+        if entry.is_dir():
+            return 'dir'
+        if entry.is_file():
+            return 'file'
+    except OSError:
+        pass
+    return None
+
+
+class ProjectListing:
+    """One scandir of a project root, with manifests parsed at most once"""
+    
+    def __init__(self, project_path: Path, entries: Optional[List[os.DirEntry]] = None):
+        self.path = project_path
+        self.entries: Dict[str, Optional[str]] = {}
+        self._manifests: Dict[str, Optional[Set[str]]] = {}
+        if entries is not None:
+            # Reuse entries already read by a tree walk
+            for entry in entries:
+                self.entries[entry.name] = _entry_kind(entry)
+            return
+        try:
+            with os.scandir(project_path) as it:
+                for entry in it:
+                    self.entries[entry.name] = _entry_kind(entry)
+        except OSError:
+            pass
+    
+    def has(self, name: str) -> bool:
+        return self.entries.get(name) is not None
+    
+    def has_file(self, name: str) -> bool:
+        return self.entries.get(name) == 'file'
+    
+    def has_suffix(self, suffix: str) -> bool:
+        return any(name.endswith(suffix) and kind is not None for name, kind in self.entries.items())
+    
+    def dependencies(self, manifest: str) -> Optional[Set[str]]:
+        """Dependency names declared in a manifest (None if absent or unparseable)"""
+        if manifest not in self._manifests:
+            deps = None
+            if self.has_file(manifest):
+                try:
+                    deps = set(MANIFEST_PARSERS[manifest](self.path / manifest))
+                except Exception:
+                    deps = None
+            self._manifests[manifest] = deps
+        return self._manifests[manifest]
+
+
+def _rule_matches(kind: str, value: str, deps: Set[str], listing: ProjectListing) -> bool:
+    if kind == 'file':
+        return listing.has(value)
+    if kind == 'dependency':
+        return value in deps
+    if kind == 'dependency_prefix':
+        return any(d == value or d.startswith(value + '/') or d.startswith(value + '-') for d in deps)
+    raise ValueError(f"Unknown rule kind: {kind}")
+
+
+def detect_tech_stack(project_path: Path, listing: Optional[ProjectListing] = None) -> Dict[str, Any]:
+    """Detect technology stack for a project from a single directory listing"""
     stack_info = {
         'primary_language': None,
         'framework': None,
@@ -106,321 +442,350 @@ def detect_tech_stack(project_path: Path) -> Dict[str, Any]:
         'categories': []
     }
     
-    # Check for various config files
-    files_to_check = {
-        'package.json': 'Node.js/JavaScript',
-        'requirements.txt': 'Python',
-        'pyproject.toml': 'Python',
-        'Cargo.toml': 'Rust',
-        'go.mod': 'Go',
-        'pom.xml': 'Java',
-        'build.gradle': 'Java/Kotlin',
-        'Gemfile': 'Ruby',
-        'composer.json': 'PHP',
-        'Dockerfile': 'Docker',
-        'docker-compose.yml': 'Docker',
-        '.cursorrules': 'Cursor',
-    }
-    
-    found_files = []
-    for filename, tech in files_to_check.items():
-        if (project_path / filename).exists():
-            found_files.append((filename, tech))
-    
-    # Analyze package.json if it exists
-    package_json = project_path / 'package.json'
-    if package_json.exists():
-        try:
-            with open(package_json, 'r', encoding='utf-8') as f:
-                pkg_data = json.load(f)
-                deps = {**pkg_data.get('dependencies', {}), **pkg_data.get('devDependencies', {})}
-                
-                # Detect framework
-                if 'next' in deps:
-                    stack_info['framework'] = 'Next.js'
-                    stack_info['categories'].append('Web/Frontend')
-                elif 'react' in deps:
-                    stack_info['framework'] = 'React'
-                    stack_info['categories'].append('Web/Frontend')
-                elif 'vue' in deps:
-                    stack_info['framework'] = 'Vue'
-                    stack_info['categories'].append('Web/Frontend')
-                elif 'astro' in deps:
-                    stack_info['framework'] = 'Astro'
-                    stack_info['categories'].append('Web/Frontend')
-                elif 'express' in deps:
-                    stack_info['framework'] = 'Express'
-                    stack_info['categories'].append('Backend/API')
-                
-                # Detect build tools
-                if 'vite' in deps:
-                    stack_info['build_tools'].append('Vite')
-                if 'webpack' in deps:
-                    stack_info['build_tools'].append('Webpack')
-                if 'typescript' in deps:
-                    stack_info['primary_language'] = 'TypeScript'
-                else:
-                    stack_info['primary_language'] = 'JavaScript'
-                
-                # Package manager
-                if (project_path / 'pnpm-lock.yaml').exists():
-                    stack_info['package_manager'] = 'pnpm'
-                elif (project_path / 'yarn.lock').exists():
-                    stack_info['package_manager'] = 'yarn'
-                elif (project_path / 'package-lock.json').exists():
-                    stack_info['package_manager'] = 'npm'
-                    
-        except Exception as e:
-            pass
+    listing = listing or ProjectListing(project_path)
     
-    # Check for Python
-    if (project_path / 'requirements.txt').exists() or (project_path / 'pyproject.toml').exists():
-        stack_info['primary_language'] = 'Python'
-        # Check for common frameworks
-        if (project_path / 'manage.py').exists():
-            stack_info['framework'] = 'Django'
-            stack_info['categories'].append('Backend/API')
-        elif any((project_path / f).exists() for f in ['app.py', 'main.py']):
-            # Could be Flask, FastAPI, etc.
-            stack_info['categories'].append('Backend/API')
+    for rule in TECH_STACK_RULES:
+        present = [m for m in rule['manifests'] if listing.has_file(m)]
+        parsed = [deps for deps in map(listing.dependencies, present) if deps is not None]
+        if not parsed and not (present and rule.get('active_on_presence')):
+            continue
+        deps = set().union(*parsed)
+        
+        stack_info['primary_language'] = rule['language']
+        for dependency, language in rule.get('language_if_dependency', {}).items():
+            if dependency in deps:
+                stack_info['primary_language'] = language
+        
+        for kind, value, framework, category in rule.get('frameworks', []):
+            if _rule_matches(kind, value, deps, listing):
+                if framework:
+                    stack_info['framework'] = framework
+                stack_info['categories'].append(category)
+                break
+        
+        for dependency, tool in rule.get('build_tools', {}).items():
+            if dependency in deps:
+                stack_info['build_tools'].append(tool)
+        
+        for lockfile, manager in rule.get('package_managers', []):
+            if listing.has_file(lockfile):
+                stack_info['package_manager'] = manager
+                break
     
     # Check for Jupyter notebooks
-    if list(project_path.glob('*.ipynb')):
+    if listing.has_suffix('.ipynb'):
         stack_info['categories'].append('Data Science')
     
     # Default to experimental if no clear category
     if not stack_info['categories']:
         stack_info['categories'].append('Experiments')
     
-    stack_info['found_files'] = [f[0] for f in found_files]
+    stack_info['found_files'] = [f for f in MARKER_FILES if listing.has(f)]
     
     return stack_info
 
 
-def assess_maturity(project_path: Path, git_info: Dict, tech_stack: Dict, github_repo: Optional[Dict] = None) -> Dict[str, Any]:
-    """Assess project maturity based on various criteria"""
-    
-    score = 0
-    max_score = 10
-    details = []
+def extract_maturity_features(project_path: Path, git_info: Dict, github_repo: Optional[Dict] = None,
+                              budget: Optional[WalkBudget] = None) -> Dict[str, Any]:
+    """Probe the project for the raw inputs of the maturity model (see maturity_model.FEATURES)"""
     
-    # Documentation (0-2 points)
+    # Documentation
     readme = project_path / 'README.md'
-    if readme.exists():
-        readme_size = readme.stat().st_size
-        if readme_size > 2000:  # Substantial README
-            score += 2
-            details.append("Has comprehensive README (2 pts)")
-        elif readme_size > 500:
-            score += 1
-            details.append("Has basic README (1 pt)")
-    
-    # Check for additional docs
+    readme_bytes = readme.stat().st_size if readme.exists() else 0
+    
     docs_dir = project_path / 'docs'
-    if docs_dir.exists() and list(docs_dir.glob('*.md')):
-        score += 0.5
-        details.append("Has additional documentation (0.5 pts)")
+    has_docs = docs_dir.exists() and bool(list(docs_dir.glob('*.md')))
     
-    # Testing (0-2 points)
+    # Testing
     test_indicators = [
         'jest.config.js', 'jest.config.ts', 'vitest.config.ts',
         'pytest.ini', 'tests/', '__tests__/', 'test/',
         'playwright.config.ts', '.spec.ts', '.test.ts'
     ]
     
-    has_tests = False
-    for indicator in test_indicators:
-        if '*' in indicator or '.' in indicator:
-            if list(project_path.glob(f"**/{indicator}")):
-                has_tests = True
-                break
-        else:
-            if (project_path / indicator).exists():
+    # One pruned, budgeted walk instead of recursive globs, which would
+    # also crawl node_modules and the other EXCLUDE_DIRS
+    file_indicators = {i for i in test_indicators if '.' in i and not i.endswith('/')}
+    has_tests = any((project_path / i).exists() for i in test_indicators if i not in file_indicators)
+    test_files = 0
+    for _, _, files in walk_project(project_path, budget):
+        for entry in files:
+            if entry.name in file_indicators:
                 has_tests = True
-                break
+            if '.test.' in entry.name or '.spec.' in entry.name:
+                test_files += 1
+    if not has_tests:
+        test_files = 0
     
-    if has_tests:
-        # Check if tests directory has substantial content
-        test_files = list(project_path.glob('**/*.test.*')) + list(project_path.glob('**/*.spec.*'))
-        if len(test_files) > 10:
-            score += 2
-            details.append("Has comprehensive test suite (2 pts)")
-        elif len(test_files) > 0:
-            score += 1
-            details.append("Has tests (1 pt)")
-    
-    # Configuration & Build Setup (0-2 points)
+    # Configuration & Build Setup
     config_files = [
         'tsconfig.json', 'eslint.config.js', '.eslintrc.js',
         'prettier.config.js', 'tailwind.config.js', 'vite.config.ts',
         'next.config.ts', 'astro.config.mjs', 'Dockerfile'
     ]
-    
     config_count = sum(1 for cf in config_files if (project_path / cf).exists())
-    if config_count >= 5:
-        score += 2
-        details.append("Well-configured build setup (2 pts)")
-    elif config_count >= 3:
-        score += 1
-        details.append("Basic build configuration (1 pt)")
-    
-    # CI/CD (0-1 point)
+    
+    # CI/CD
     ci_files = [
         '.github/workflows', 'azure-pipelines.yml',
         '.gitlab-ci.yml', 'Jenkinsfile'
     ]
-    if any((project_path / cf).exists() for cf in ci_files):
-        score += 1
-        details.append("Has CI/CD setup (1 pt)")
+    has_ci = any((project_path / cf).exists() for cf in ci_files)
     
-    # Recent Activity (0-1 point)
+    # Recent Activity
+    last_commit_ts = None
     if git_info.get('last_commit'):
         try:
-            last_commit_date = datetime.fromisoformat(git_info['last_commit'].replace(' +', '+'))
-            days_since = (datetime.now(last_commit_date.tzinfo) - last_commit_date).days
-            
-            if days_since < 30:
-                score += 1
-                details.append("Recently active (< 30 days) (1 pt)")
-            elif days_since < 90:
-                score += 0.5
-                details.append("Moderately active (< 90 days) (0.5 pts)")
-        except:
+            last_commit_ts = datetime.fromisoformat(git_info['last_commit'].replace(' +', '+')).timestamp()
+        except ValueError:
             pass
     
-    # Completeness (0-1 point)
+    commits_90d = (git_info.get('history') or {}).get('commits_90d', 0)
+    
+    # Completeness
     completeness_items = [
         'LICENSE', '.gitignore', '.env.example',
         'CHANGELOG.md', 'CONTRIBUTING.md'
     ]
     completeness_count = sum(1 for item in completeness_items if (project_path / item).exists())
-    if completeness_count >= 3:
-        score += 1
-        details.append("Project completeness indicators (1 pt)")
-    elif completeness_count >= 1:
-        score += 0.5
-        details.append("Some completeness indicators (0.5 pts)")
-    
-    # Production Readiness (0-1 point)
+    
+    # Production Readiness
     prod_indicators = [
         'docker-compose.yml', '.env.production', 
         'infra/', 'k8s/', 'terraform/'
     ]
-    if any((project_path / pi).exists() for pi in prod_indicators):
-        score += 1
-        details.append("Production deployment setup (1 pt)")
-    
-    # GitHub metrics (bonus if available)
-    if github_repo:
-        if github_repo['stargazers_count'] > 0:
-            score += 0.5
-            details.append("Has GitHub stars (0.5 bonus)")
-        if github_repo.get('has_issues') and github_repo['open_issues_count'] > 0:
-            details.append(f"Active issues: {github_repo['open_issues_count']}")
-    
-    # Determine maturity level
-    normalized_score = (score / max_score) * 10
-    
-    if normalized_score >= 8:
-        maturity_level = "Mature"
-    elif normalized_score >= 5:
-        maturity_level = "Developing"
-    elif normalized_score >= 2:
-        maturity_level = "Experimental"
-    else:
-        maturity_level = "Archived"
+    has_prod_indicators = any((project_path / pi).exists() for pi in prod_indicators)
+    
+    # GitHub metrics
+    stars = github_repo['stargazers_count'] if github_repo else 0
+    open_issues = github_repo['open_issues_count'] if github_repo and github_repo.get('has_issues') else 0
     
     return {
-        'score': round(normalized_score, 1),
-        'level': maturity_level,
-        'details': details,
-        'raw_score': round(score, 1),
-        'max_score': max_score
+        'readme_bytes': readme_bytes,
+        'has_docs': int(has_docs),
+        'has_test_indicator': int(has_tests),
+        'test_files': test_files,
+        'config_count': config_count,
+        'has_ci': int(has_ci),
+        'last_commit_ts': last_commit_ts,
+        'commits_90d': commits_90d,
+        'completeness_count': completeness_count,
+        'has_prod_indicators': int(has_prod_indicators),
+        'stars': stars,
+        'open_issues': open_issues
     }
 
 
-def compare_local_remote() -> Dict[str, Any]:
-    """Compare local projects with remote repositories"""
+def assess_maturity(project_path: Path, git_info: Dict, tech_stack: Dict, github_repo: Optional[Dict] = None) -> Dict[str, Any]:
+    """Assess project maturity based on various criteria"""
+    from maturity_model import score_vector
     
-    print("Loading GitHub repositories...")
-    github_repos = load_github_repos()
-    github_repos_map = {repo['name'].lower(): repo for repo in github_repos}
+    features = extract_maturity_features(project_path, git_info, github_repo)
+    return {**score_vector(features), 'features': features}
+
+
+def match_github_repo(local_name: str, github_repos_map: Dict[str, Dict]) -> Optional[Dict]:
+    """Find the GitHub repo for a local project, treating '-' and '_' as equivalent"""
+    for gh_name, gh_repo in github_repos_map.items():
+        if gh_name == local_name or gh_name.replace('-', '_') == local_name or local_name.replace('-', '_') == gh_name:
+            return gh_repo
+    return None
+
+
+def shard_of(proj: Dict[str, Any], shards: int) -> int:
+    """Shard (1..shards) a project belongs to.
+    
+    Keyed on root name, category and folder name rather than the absolute path,
+    so machines that mount the same export at different paths agree.
+    """
+    key = f"{proj['root']}/{proj['category']}/{proj['name']}"
+    return zlib.crc32(key.encode('utf-8')) % shards + 1
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """'k/N' -> (k, N) with 1 <= k <= N"""
+    try:
+        k, n = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"shard must look like k/N, got {spec!r}") from None
+    if not 1 <= k <= n:
+        raise ValueError(f"shard {spec!r}: k must be between 1 and N")
+    return k, n
+
+
+def shard_file(k: int, n: int) -> Path:
+    return SHARDS_DIR / f"shard-{k}-of-{n}.json"
+
+
+def build_comparison(analysis: List[Any], github_repos_map: Dict[str, Any],
+                     local_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Split analysed projects into both/local_only and find remote-only repos.
     
-    print("Scanning local projects...")
-    local_projects = get_local_projects()
-    local_projects_map = {proj['name'].lower(): proj for proj in local_projects}
+    Remote-only repos are only known once every local project has been seen,
+    so they are skipped when local_names is None (a single shard). Repos of
+    cold-stored projects are never remote-only.
+    """
+    from project_records import RemoteRecord
     
     comparison = {
-        'local_only': [],
+        'local_only': [proj for proj in analysis if not proj.github_repo],
         'remote_only': [],
-        'both': [],
-        'analysis': []
+        'both': [proj for proj in analysis if proj.github_repo],
+        'analysis': analysis
     }
     
-    # Find projects that exist in both
-    for local_name, local_proj in local_projects_map.items():
-        project_path = Path(local_proj['path'])
-        
-        print(f"\nAnalyzing: {local_proj['name']}")
-        
-        # Get git info
-        git_info = get_git_info(project_path)
-        
-        # Detect tech stack
-        tech_stack = detect_tech_stack(project_path)
-        
-        # Find matching GitHub repo
-        github_repo = None
-        for gh_name, gh_repo in github_repos_map.items():
-            if gh_name == local_name or gh_name.replace('-', '_') == local_name or local_name.replace('-', '_') == gh_name:
-                github_repo = gh_repo
-                break
-        
-        # Assess maturity
-        maturity = assess_maturity(project_path, git_info, tech_stack, github_repo)
-        
-        analysis = {
-            'name': local_proj['name'],
-            'path': local_proj['path'],
-            'git_info': git_info,
-            'tech_stack': tech_stack,
-            'maturity': maturity,
-            'github_repo': github_repo,
-            'status': 'both' if github_repo else 'local_only'
-        }
-        
-        if github_repo:
-            comparison['both'].append(analysis)
-        else:
-            comparison['local_only'].append(analysis)
-        
-        comparison['analysis'].append(analysis)
+    if local_names is None:
+        return comparison
+    
+    # Projects in cold storage still have a local copy, just not on disk
+    from cold_storage import cold_names
+    local_names = local_names + cold_names()
     
     # Find remote-only repos
     for gh_name, gh_repo in github_repos_map.items():
-        found_local = False
-        for local_name in local_projects_map.keys():
-            if gh_name == local_name or gh_name.replace('-', '_') == local_name or local_name.replace('-', '_') == gh_name:
-                found_local = True
-                break
+        found_local = any(match_github_repo(local_name, {gh_name: gh_repo}) for local_name in local_names)
         
         if not found_local:
-            comparison['remote_only'].append({
-                'name': gh_repo['name'],
-                'github_repo': gh_repo,
-                'status': 'remote_only'
-            })
+            comparison['remote_only'].append(RemoteRecord(name=gh_repo.name, github_repo=gh_repo))
     
     return comparison
 
 
+def compare_local_remote(shard: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+    """Compare local projects with remote repositories (only shard k of N when given)"""
+    from analyzers import FULL_REPORT, ProjectView, compute_by_root
+    from roots import load_roots
+    from project_records import GitInfo, Maturity, ProjectRecord, TechStack, github_repos_from_list
+    
+    print("Loading GitHub repositories...")
+    github_repos = github_repos_from_list(load_github_repos())
+    github_repos_map = {repo['name'].lower(): repo for repo in github_repos}
+    
+    print("Scanning local projects...")
+    local_projects = get_local_projects()
+    local_names = [proj['name'].lower() for proj in local_projects]
+    
+    roots = load_roots()
+    if shard:
+        k, n = shard
+        local_projects = [proj for proj in local_projects if shard_of(proj, n) == k]
+        print(f"  • shard {k}/{n}: {len(local_projects)} of {len(local_names)} projects")
+        # Shards keep separate caches so concurrent processes never overwrite each other's
+        roots = [{**root, 'cache_tag': f"shard-{k}-of-{n}"} for root in roots]
+    
+    # Every analyzer runs once over all projects (batched where possible),
+    # each root in its own worker with its own concurrency and caches
+    print("Running analyzers...")
+    contexts = {root['name']: {'github_repos_map': github_repos_map, 'root': root} for root in roots}
+    views = [ProjectView(proj['name'], Path(proj['path']), contexts[proj['root']]) for proj in local_projects]
+    timings = compute_by_root(views, FULL_REPORT)
+    if len(timings) > 1:
+        for root_name, seconds in timings.items():
+            count = sum(1 for proj in local_projects if proj['root'] == root_name)
+            print(f"  • {root_name}: {count} projects in {seconds:.1f}s")
+    
+    analysis = []
+    for proj, view in zip(local_projects, views):
+        git_info = GitInfo.from_dict(view['git_info'])
+        if git_info.is_git_repo:
+            git_info.divergence = view['divergence']
+            git_info.history = view['history']
+        
+        analysis.append(ProjectRecord(
+            name=view.name,
+            path=str(view.path),
+            root=proj['root'],
+            category=proj['category'],
+            git_info=git_info,
+            tech_stack=TechStack.from_dict(view['full_tech_stack']),
+            maturity=Maturity.from_dict(view['maturity']),
+            workspace=view['workspace'],
+            languages=view['languages'],
+            github_repo=view['github_repo'],
+            status='both' if view['github_repo'] else 'local_only',
+            truncated=view.budget.report(),
+            disk_usage=view['disk_usage']
+        ))
+    
+    return build_comparison(analysis, github_repos_map, None if shard else local_names)
+
+
+def write_shard(comparison: Dict[str, Any], k: int, n: int) -> Path:
+    """Save one shard's partial analysis for merge_shards()"""
+    from project_records import to_jsonable
+    
+    output_file = shard_file(k, n)
+    json_io.dump({
+        'shard': k,
+        'shards': n,
+        'created': datetime.now().isoformat(),
+        'analysis': comparison['analysis']
+    }, output_file, default=to_jsonable)
+    return output_file
+
+
+def merge_shards(n: Optional[int] = None) -> Dict[str, Any]:
+    """Combine shard files into one comparison, in the order an unsharded run produces"""
+    from project_records import ProjectRecord, github_repos_from_list
+    
+    files = sorted(SHARDS_DIR.glob(f"shard-*-of-{n or '*'}.json"))
+    if not files:
+        raise FileNotFoundError(f"No shard files in {SHARDS_DIR}")
+    
+    shards = [json_io.load(f) for f in files]
+    counts = {shard['shards'] for shard in shards}
+    if len(counts) > 1:
+        raise ValueError(f"Shard files from different shard counts {sorted(counts)}; pass the count to merge")
+    n = counts.pop()
+    missing = sorted(set(range(1, n + 1)) - {shard['shard'] for shard in shards})
+    if missing:
+        raise ValueError(f"Missing shards {missing} of {n}")
+    
+    analysis = [ProjectRecord.from_dict(proj) for shard in shards for proj in shard['analysis']]
+    
+    local_projects = get_local_projects()
+    order = {proj['path']: i for i, proj in enumerate(local_projects)}
+    analysis.sort(key=lambda proj: order.get(proj.path, len(order)))
+    
+    github_repos = github_repos_from_list(load_github_repos())
+    github_repos_map = {repo['name'].lower(): repo for repo in github_repos}
+    print(f"🔗 Merged {len(analysis)} projects from {n} shards")
+    return build_comparison(analysis, github_repos_map, [proj['name'].lower() for proj in local_projects])
+
+
+def spawn_shards(n: int) -> bool:
+    """Run shards 1..n as local processes (standing in for nodes); logs go next to the shard files"""
+    SHARDS_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in SHARDS_DIR.glob('shard-*.json'):
+        stale.unlink()
+    
+    processes = []
+    for k in range(1, n + 1):
+        log = open(SHARDS_DIR / f"shard-{k}-of-{n}.log", 'w')
+        processes.append((k, log, subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), '--shard', f"{k}/{n}"],
+            stdout=log, stderr=subprocess.STDOUT
+        )))
+    
+    ok = True
+    for k, log, process in processes:
+        returncode = process.wait()
+        log.close()
+        if returncode != 0:
+            print(f"❌ Shard {k}/{n} failed (see {log.name})")
+            ok = False
+        else:
+            print(f"  ✓ Shard {k}/{n} done")
+    return ok
+
+
 def generate_reports(comparison: Dict[str, Any]):
     """Generate analysis reports"""
+    from project_records import to_jsonable
     
     # Save full comparison
     output_file = PROJECTS_DIR / 'project_comparison.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(comparison, f, indent=2, ensure_ascii=False)
+    json_io.dump(comparison, output_file, default=to_jsonable)
     
     print(f"\n✅ Saved detailed analysis to: {output_file}")
     
@@ -457,6 +822,16 @@ def generate_reports(comparison: Dict[str, Any]):
     for tech, count in sorted(tech_counts.items(), key=lambda x: x[1], reverse=True):
         print(f"  • {tech}: {count}")
     
+    # Divergence from upstream
+    print(f"\n🔀 Sync State:")
+    sync_counts = {}
+    for proj in comparison['analysis']:
+        state = proj['git_info'].get('divergence', {}).get('state', 'not_git')
+        sync_counts[state] = sync_counts.get(state, 0) + 1
+    
+    for state, count in sorted(sync_counts.items(), key=lambda x: x[1], reverse=True):
+        print(f"  • {state.replace('_', ' ')}: {count}")
+    
     # Top mature projects
     print(f"\n⭐ Top Projects by Maturity:")
     sorted_projects = sorted(comparison['analysis'], 
@@ -480,12 +855,72 @@ def generate_reports(comparison: Dict[str, Any]):
         for proj in comparison['local_only']:
             print(f"  • {proj['name']}: {proj['tech_stack'].get('primary_language', 'Unknown')}")
     
+    # Projects whose scan ran out of budget (results are partial)
+    truncated = [proj for proj in comparison['analysis'] if proj.get('truncated')]
+    if truncated:
+        print(f"\n✂️  Truncated Scans (partial results - consider adding exclusions):")
+        for proj in truncated:
+            t = proj['truncated']
+            print(f"  • {proj['name']}: {t['reason']} budget hit after {t['files_visited']:,} files, {t['seconds']}s")
+    
     print("\n" + "=" * 70)
 
 
-if __name__ == '__main__':
-    print("Starting comprehensive project analysis...\n")
-    comparison = compare_local_remote()
+def finish(comparison: Dict[str, Any]):
+    """Write reports and update the dependency index and metrics history"""
     generate_reports(comparison)
+    
+    print("\n📦 Updating dependency index...")
+    from dependency_index import update_index, projects_from_analysis, save_index
+    index = update_index(projects_from_analysis(comparison['analysis']))
+    save_index(index)
+    print(f"  • {len(index['packages'])} packages across {len(index['projects'])} projects "
+          f"({len(index['last_changed'])} re-parsed)")
+    
+    from metrics_history import record_run
+    run_id = record_run(comparison)
+    print(f"📈 Recorded metrics history run {run_id}")
     print("\n✅ Analysis complete!")
 
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Analyse local projects and compare with GitHub')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--shard', metavar='K/N', help='analyse only shard K of N and write a partial result')
+    mode.add_argument('--merge', nargs='?', const=0, type=int, metavar='N',
+                      help='merge shard results into project_comparison.json')
+    mode.add_argument('--spawn', type=int, metavar='N', help='run N shard processes locally, then merge')
+    args = parser.parse_args()
+    
+    if args.shard:
+        try:
+            k, n = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Starting project analysis for shard {k}/{n}...\n")
+        comparison = compare_local_remote(shard=(k, n))
+        print(f"\n✅ Saved shard {k}/{n} to: {write_shard(comparison, k, n)}")
+        return
+    
+    if args.spawn:
+        print(f"Starting project analysis in {args.spawn} shard processes...\n")
+        if not spawn_shards(args.spawn):
+            sys.exit(1)
+    
+    if args.spawn or args.merge is not None:
+        try:
+            comparison = merge_shards(args.spawn or args.merge or None)
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    else:
+        print("Starting comprehensive project analysis...\n")
+        comparison = compare_local_remote()
+    
+    finish(comparison)
+
+
+if __name__ == '__main__':
+    main()
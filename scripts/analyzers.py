@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Analyzer plugin registry with lazily computed, memoised project fields
+
+Usage:
+    analyzers.py list [--language TypeScript] [--framework Next.js] [--depends-on react]
+    analyzers.py costs
+
+Each analyzer declares its cost and the fields it requires. A ProjectView
+computes a field on first access and remembers it, so a query only pays for
+the analyzers it actually touches. compute() runs a whole set of fields for
+many projects in dependency order, using batch implementations where an
+analyzer has one (git divergence, history, census, scoring).
+
+A view's context may carry its project root (see roots.py); batch analyzers
+then use that root's worker count and caches, and compute_by_root() runs each
+root in its own thread so a slow volume does not hold back a fast one.
+"""
+import argparse
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Iterable, Optional
+
+ANALYZER_WORKERS = 8
+
+# Relative cost of an analyzer, used for ordering and reporting
+CHEAP = 1       # reads a handful of root-level files
+MODERATE = 2    # parses manifests/lockfiles or runs a few quick git commands
+EXPENSIVE = 3   # walks the whole tree or the whole git history
+
+ANALYZERS: Dict[str, Dict[str, Any]] = {}
+
+# Fields the full analysis report needs
+FULL_REPORT = ['git_info', 'divergence', 'history', 'tech_stack', 'workspace',
+               'languages', 'full_tech_stack', 'github_repo', 'maturity', 'disk_usage']
+
+
+def analyzer(name: str, cost: int, requires: Iterable[str] = (), batch: Optional[Callable] = None):
+    """Register a per-project analyzer; `batch` optionally computes many views at once"""
+    def register(func: Callable[['ProjectView'], Any]) -> Callable:
+        ANALYZERS[name] = {'func': func, 'cost': cost, 'requires': tuple(requires), 'batch': batch}
+        return func
+    return register
+
+
+class ProjectView:
+    """A project whose analysis fields are computed on first access"""
+    
+    def __init__(self, name: str, path: Path, context: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.path = Path(path)
+        self.context = context if context is not None else {}
+        self.values: Dict[str, Any] = {}
+        self._budget = None
+    
+    @property
+    def budget(self):
+        """Walk budget shared by every tree walk of this project (limits come from its root)"""
+        if self._budget is None:
+            from tree_walk import BUDGET_FILES, BUDGET_SECONDS, WalkBudget
+            root = _root(self)
+            self._budget = WalkBudget(root.get('budget_seconds', BUDGET_SECONDS),
+                                      root.get('budget_files', BUDGET_FILES))
+        return self._budget
+    
+    def __getitem__(self, field: str) -> Any:
+        if field not in self.values:
+            spec = ANALYZERS[field]
+            if spec['batch']:
+                self.values[field] = spec['batch']([self])[0]
+            else:
+                self.values[field] = spec['func'](self)
+        return self.values[field]
+    
+    def computed(self) -> List[str]:
+        return list(self.values)
+
+
+def resolve_order(fields: Iterable[str]) -> List[str]:
+    """Fields plus their requirements, dependencies first"""
+    order: List[str] = []
+    
+    def visit(field, stack=()):
+        if field in order:
+            return
+        if field in stack:
+            raise ValueError(f"Analyzer dependency cycle: {' -> '.join(stack + (field,))}")
+        for dep in ANALYZERS[field]['requires']:
+            visit(dep, stack + (field,))
+        order.append(field)
+    
+    for field in fields:
+        visit(field)
+    return order
+
+
+def compute(views: List[ProjectView], fields: Iterable[str], max_workers: int = ANALYZER_WORKERS,
+            verbose: bool = True):
+    """Compute fields for all views in one pass, one analyzer at a time"""
+    for field in resolve_order(fields):
+        pending = [v for v in views if field not in v.values]
+        if not pending:
+            continue
+        spec = ANALYZERS[field]
+        if verbose:
+            print(f"  • {field} ({len(pending)} projects)")
+        if spec['batch']:
+            results = spec['batch'](pending)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(spec['func'], pending))
+        for view, value in zip(pending, results):
+            view.values[field] = value
+
+
+def compute_by_root(views: List[ProjectView], fields: Iterable[str],
+                    verbose: Optional[bool] = None) -> Dict[str, float]:
+    """compute() each root's views in its own thread with that root's worker count.
+    
+    Progress is printed when there is a single root unless verbose says
+    otherwise. Returns the wall time in seconds per root name.
+    """
+    groups: Dict[str, List[ProjectView]] = {}
+    for view in views:
+        groups.setdefault(_root(view)['name'], []).append(view)
+    fields = list(fields)
+    
+    def run(group):
+        start = time.perf_counter()
+        compute(group, fields, max_workers=_root(group[0])['workers'],
+                verbose=len(groups) == 1 if verbose is None else verbose)
+        return time.perf_counter() - start
+    
+    with ThreadPoolExecutor(max_workers=max(len(groups), 1)) as executor:
+        return dict(zip(groups, executor.map(run, groups.values())))
+
+
+# ---------------------------------------------------------------------------
+# Built-in analyzers
+# ---------------------------------------------------------------------------
+
+def _root(view: ProjectView) -> Dict[str, Any]:
+    """The view's project root; views without one belong to the main root"""
+    if 'root' not in view.context:
+        from roots import get_root
+        view.context['root'] = get_root(None)
+    return view.context['root']
+
+
+def _batch_divergence(views: List[ProjectView]) -> List[Any]:
+    from analyze_projects import collect_divergence
+    results = collect_divergence([v.path for v in views], _root(views[0])['workers'])
+    return [results[str(v.path)] for v in views]
+
+
+def _batch_history(views: List[ProjectView]) -> List[Any]:
+    from git_history import CACHE_FILE, collect_history
+    from roots import cache_path
+    root = _root(views[0])
+    repos = [v.path for v in views if (v.path / '.git').exists()]
+    results = collect_history(repos, root['workers'], cache_path(root, CACHE_FILE.name)) if repos else {}
+    return [results.get(str(v.path)) for v in views]
+
+
+def _batch_languages(views: List[ProjectView]) -> List[Any]:
+    from language_census import CACHE_FILE, census_projects
+    from roots import cache_path
+    root = _root(views[0])
+    results = census_projects([v.path for v in views], root['workers'], cache_path(root, CACHE_FILE.name),
+                              {str(v.path): v.budget for v in views})
+    return [results[str(v.path)] for v in views]
+
+
+def _batch_disk_usage(views: List[ProjectView]) -> List[Any]:
+    from disk_usage import CACHE_FILE, usage_projects
+    from roots import cache_path
+    root = _root(views[0])
+    results = usage_projects([v.path for v in views], root['workers'], cache_path(root, CACHE_FILE.name))
+    return [results[str(v.path)] for v in views]
+
+
+def _batch_maturity(views: List[ProjectView]) -> List[Any]:
+    from maturity_model import score_vectors
+    features = [v['maturity_features'] for v in views]
+    return [{**score, 'features': f} for score, f in zip(score_vectors(features), features)]
+
+
+@analyzer('listing', CHEAP)
+def _listing(view: ProjectView):
+    from analyze_projects import ProjectListing
+    return ProjectListing(view.path)
+
+
+@analyzer('git_info', MODERATE)
+def _git_info(view: ProjectView):
+    from analyze_projects import get_git_info
+    return get_git_info(view.path)
+
+
+@analyzer('divergence', MODERATE, batch=_batch_divergence)
+def _divergence(view: ProjectView):
+    return _batch_divergence([view])[0]
+
+
+@analyzer('history', EXPENSIVE, batch=_batch_history)
+def _history(view: ProjectView):
+    return _batch_history([view])[0]
+
+
+@analyzer('disk_usage', EXPENSIVE, batch=_batch_disk_usage)
+def _disk_usage(view: ProjectView):
+    return _batch_disk_usage([view])[0]
+
+
+@analyzer('tech_stack', CHEAP, requires=['listing'])
+def _tech_stack(view: ProjectView):
+    """Tech stack from root-level manifests only"""
+    from analyze_projects import detect_tech_stack
+    return detect_tech_stack(view.path, view['listing'])
+
+
+@analyzer('workspace', EXPENSIVE, requires=['listing'])
+def _workspace(view: ProjectView):
+    from workspaces import analyze_workspace
+    return analyze_workspace(view.path, view['listing'], budget=view.budget)
+
+
+@analyzer('languages', EXPENSIVE, batch=_batch_languages)
+def _languages(view: ProjectView):
+    return _batch_languages([view])[0]
+
+
+@analyzer('full_tech_stack', EXPENSIVE, requires=['tech_stack', 'workspace', 'languages'])
+def _full_tech_stack(view: ProjectView):
+    """Root tech stack rolled up over workspace packages, census as the fallback"""
+    from language_census import dominant_language
+    from workspaces import rollup_tech_stack
+    tech_stack = view['tech_stack']
+    if view['workspace']:
+        tech_stack = rollup_tech_stack(tech_stack, view['workspace'])
+    else:
+        tech_stack = dict(tech_stack)
+    if not tech_stack['primary_language']:
+        tech_stack['primary_language'] = dominant_language(view['languages'])
+    return tech_stack
+
+
+def _members_use_typescript(view: ProjectView) -> bool:
+    """True when most declared package.json workspace members are TypeScript (no tree walk)"""
+    from analyze_projects import ProjectListing
+    from workspaces import get_workspace_patterns
+    declared = get_workspace_patterns(view.path, view['listing'])
+    if not declared or declared['manifest'] != 'package.json':
+        return False
+    
+    # Workspace globs are one or two levels deep; '**' would mean a walk
+    members = set()
+    for pattern in declared['patterns']:
+        if '**' in pattern:
+            continue
+        if pattern.startswith('!'):
+            members -= set(view.path.glob(pattern[1:].rstrip('/')))
+        else:
+            members |= set(view.path.glob(pattern.rstrip('/')))
+    
+    votes = Counter()
+    for member in members:
+        listing = ProjectListing(member)
+        deps = listing.dependencies('package.json')
+        if deps is not None:
+            votes[listing.has_file('tsconfig.json') or 'typescript' in deps] += 1
+    return votes[True] > votes[False]
+
+
+@analyzer('primary_language', CHEAP, requires=['tech_stack', 'listing'])
+def _primary_language(view: ProjectView):
+    """Manifest language, settling JavaScript and unknown roots from cheap signals only.
+    
+    A JavaScript root is TypeScript when it has a tsconfig.json or most of its
+    declared workspace members are; a root without a manifest takes the most
+    common programming language among its own files. Unlike full_tech_stack,
+    neither the workspace walk nor the census runs.
+    """
+    from language_census import NON_PROGRAMMING, detect_language
+    language = view['tech_stack']['primary_language']
+    listing = view['listing']
+    if language == 'JavaScript':
+        if listing.has_file('tsconfig.json') or _members_use_typescript(view):
+            return 'TypeScript'
+    elif language is None:
+        counts = Counter(detect_language(name) for name, kind in listing.entries.items() if kind == 'file')
+        counts = [(n, lang) for lang, n in counts.items() if lang and lang not in NON_PROGRAMMING]
+        if counts:
+            return max(counts)[1]
+    return language
+
+
+@analyzer('github_repo', CHEAP)
+def _github_repo(view: ProjectView):
+    from analyze_projects import load_github_repos, match_github_repo
+    from project_records import github_repos_from_list
+    if 'github_repos_map' not in view.context:
+        repos = github_repos_from_list(load_github_repos())
+        view.context['github_repos_map'] = {repo.name.lower(): repo for repo in repos}
+    return match_github_repo(view.name.lower(), view.context['github_repos_map'])
+
+
+@analyzer('dependencies', MODERATE)
+def _dependencies(view: ProjectView):
+    from dependency_index import index_project
+    return index_project(view.path)
+
+
+@analyzer('maturity_features', EXPENSIVE, requires=['git_info', 'history', 'github_repo'])
+def _maturity_features(view: ProjectView):
+    from analyze_projects import extract_maturity_features
+    git_info = {**view['git_info'], 'history': view['history']}
+    return extract_maturity_features(view.path, git_info, view['github_repo'], view.budget)
+
+
+@analyzer('maturity', CHEAP, requires=['maturity_features'], batch=_batch_maturity)
+def _maturity(view: ProjectView):
+    return _batch_maturity([view])[0]
+
+
+def project_views(context: Optional[Dict[str, Any]] = None) -> List[ProjectView]:
+    """One view per local project; views of the same root share a context (e.g. GitHub metadata)"""
+    from analyze_projects import get_local_projects
+    from roots import load_roots
+    roots = {root['name']: root for root in load_roots()}
+    contexts: Dict[str, Dict[str, Any]] = {}
+    views = []
+    for p in get_local_projects():
+        if p['root'] not in contexts:
+            contexts[p['root']] = {**(context or {}), 'root': roots[p['root']]}
+        views.append(ProjectView(p['name'], Path(p['path']), contexts[p['root']]))
+    return views
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query projects through lazily computed analyzers')
+    subparsers = parser.add_subparsers(dest='action', required=True)
+    list_parser = subparsers.add_parser('list', help='List projects matching filters')
+    list_parser.add_argument('--language', help='Primary language, e.g. TypeScript')
+    list_parser.add_argument('--framework', help='Framework, e.g. Next.js')
+    list_parser.add_argument('--depends-on', help='Package used by the project')
+    subparsers.add_parser('costs', help='Show registered analyzers')
+    args = parser.parse_args()
+    
+    if args.action == 'costs':
+        for name, spec in sorted(ANALYZERS.items(), key=lambda x: (x[1]['cost'], x[0])):
+            requires = ', '.join(spec['requires']) or '-'
+            print(f"  {name:<20} cost {spec['cost']}  batch {'yes' if spec['batch'] else 'no ':<3}  requires {requires}")
+        return
+    
+    views = project_views()
+    filters = [
+        (args.language, 'primary_language', lambda v, x: (v['primary_language'] or '').lower() == x.lower()),
+        (args.framework, 'tech_stack', lambda v, x: (v['tech_stack']['framework'] or '').lower() == x.lower()),
+        (args.depends_on, 'dependencies', lambda v, x: x in v['dependencies']),
+    ]
+    
+    # Each filter's field is computed in one batch, only for the projects still matching
+    matches = views
+    for value, field, test in filters:
+        if value:
+            compute_by_root(matches, [field], verbose=False)
+            matches = [v for v in matches if test(v, value)]
+    
+    for view in matches:
+        print(f"  • {view.name:<40} {view.path}")
+    
+    used = sorted({field for v in views for field in v.computed()})
+    print(f"\n✅ {len(matches)} of {len(views)} projects (analyzers run: {', '.join(used) or 'none'})")
+
+
+if __name__ == '__main__':
+    main()
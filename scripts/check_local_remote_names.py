@@ -2,10 +2,12 @@
 """
 Compare local folder names with GitHub repository names
 """
-import json
 import subprocess
 from pathlib import Path
 
+import json_io
+from discovery import discover_projects
+
 PROJECTS_DIR = Path('/Users/dalerogers/Projects')
 GITHUB_REPOS_FILE = PROJECTS_DIR / 'analysis' / 'github_repos_duds.json'
 
@@ -55,83 +57,68 @@ def scan_all_projects():
     print()
     
     # Load GitHub repos for reference
-    with open(GITHUB_REPOS_FILE, 'r') as f:
-        github_repos = json.load(f)
+    github_repos = json_io.load(GITHUB_REPOS_FILE)
     
     github_names = {repo['name'].lower(): repo['name'] for repo in github_repos}
     
     comparisons = []
     
-    # Scan all project locations
-    locations = [
-        PROJECTS_DIR,
-        PROJECTS_DIR / 'active' / 'production',
-        PROJECTS_DIR / 'active' / 'development',
-        PROJECTS_DIR / 'active' / 'experimental',
-        PROJECTS_DIR / 'portfolio',
-        PROJECTS_DIR / 'archived',
-        PROJECTS_DIR / 'learning',
-    ]
-    
-    for location in locations:
-        if not location.exists():
+    # Root-level folders that are not projects yet but should get a remote
+    for special in ['cursor_rules_library', 'templates']:
+        item = PROJECTS_DIR / special
+        if not item.is_dir():
             continue
+        owner, remote_name = get_git_remote_name(item)
+        comparisons.append({
+            'local_path': str(item.relative_to(PROJECTS_DIR)),
+            'local_name': item.name,
+            'remote_owner': owner or 'NOT CONFIGURED',
+            'remote_name': remote_name or 'NOT CONFIGURED',
+            'match': False,
+            'status': 'NEW - Needs remote'
+        })
+    
+    for proj in discover_projects():
+        item = Path(proj['path'])
+        local_path = str(item.relative_to(PROJECTS_DIR)) if item.is_relative_to(PROJECTS_DIR) else str(item)
+        owner, remote_name = get_git_remote_name(item)
         
-        for item in location.iterdir():
-            if not item.is_dir() or item.name.startswith('.'):
-                continue
-            
-            if item.name in ['cursor_rules_library', 'templates']:
-                # Special handling
-                owner, remote_name = get_git_remote_name(item)
-                comparisons.append({
-                    'local_path': str(item.relative_to(PROJECTS_DIR)),
-                    'local_name': item.name,
-                    'remote_owner': owner or 'NOT CONFIGURED',
-                    'remote_name': remote_name or 'NOT CONFIGURED',
-                    'match': False,
-                    'status': 'NEW - Needs remote'
-                })
-                continue
-            
-            owner, remote_name = get_git_remote_name(item)
-            
-            if not remote_name:
-                comparisons.append({
-                    'local_path': str(item.relative_to(PROJECTS_DIR)),
-                    'local_name': item.name,
-                    'remote_owner': 'N/A',
-                    'remote_name': 'Not a git repo',
-                    'match': False,
-                    'status': 'No git repo'
-                })
-                continue
-            
-            # Compare names
-            local_lower = item.name.lower()
-            remote_lower = remote_name.lower()
-            
-            match = local_lower == remote_lower
-            
-            # Check for common variations
-            local_normalized = local_lower.replace('_', '').replace('-', '')
-            remote_normalized = remote_lower.replace('_', '').replace('-', '')
-            
-            if local_normalized == remote_normalized and not match:
-                status = 'MISMATCH - Different case/separators'
-            elif match:
-                status = 'MATCH ✅'
-            else:
-                status = 'MISMATCH - Different names'
-            
+        if not remote_name:
             comparisons.append({
-                'local_path': str(item.relative_to(PROJECTS_DIR)),
+                'local_path': local_path,
                 'local_name': item.name,
-                'remote_owner': owner or 'Unknown',
-                'remote_name': remote_name,
-                'match': match,
-                'status': status
+                'remote_owner': 'N/A',
+                'remote_name': 'Not a git repo',
+                'match': False,
+                'status': 'No git repo'
             })
+            continue
+        
+        # Compare names
+        local_lower = item.name.lower()
+        remote_lower = remote_name.lower()
+        
+        match = local_lower == remote_lower
+        
+        # Check for common variations
+        local_normalized = local_lower.replace('_', '').replace('-', '')
+        remote_normalized = remote_lower.replace('_', '').replace('-', '')
+        
+        if local_normalized == remote_normalized and not match:
+            status = 'MISMATCH - Different case/separators'
+        elif match:
+            status = 'MATCH ✅'
+        else:
+            status = 'MISMATCH - Different names'
+        
+        comparisons.append({
+            'local_path': local_path,
+            'local_name': item.name,
+            'remote_owner': owner or 'Unknown',
+            'remote_name': remote_name,
+            'match': match,
+            'status': status
+        })
     
     # Print results
     print(f"{'LOCAL FOLDER':<40} {'REMOTE REPO':<30} {'STATUS':<30}")
@@ -2,50 +2,148 @@
 """
 Clone all remote repositories that don't exist locally
 """
-import json
+import shutil
 import subprocess
+from datetime import datetime
 from pathlib import Path
 
+import json_io
+
 PROJECTS_DIR = Path('/Users/dalerogers/Projects')
 COMPARISON_FILE = PROJECTS_DIR / 'project_comparison.json'
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+CLONE_POLICIES_FILE = PROJECTS_DIR / 'clone_policies.json'
+CLONE_MANIFEST_FILE = ANALYSIS_DIR / 'clone_manifest.json'
+MIRRORS_DIR = PROJECTS_DIR / '.mirrors'
+
+# Clone policy per categorize_repo() outcome:
+#   full     - complete history (plain git clone)
+#   blobless - full commit history, file contents fetched on demand
+#   shallow  - latest commit only (--depth 1)
+# Repos larger than 'sparse_over_kb' (GitHub size, KB) additionally get a
+# cone-mode sparse checkout limited to the top-level files plus 'sparse_paths'.
+CLONE_POLICIES = {
+    'active/production': {'mode': 'full'},
+    'active/development': {'mode': 'blobless'},
+    'active/experimental': {'mode': 'blobless'},
+    'portfolio': {'mode': 'blobless'},
+    'archived': {'mode': 'shallow'},
+    'learning': {'mode': 'shallow'},
+    'templates': {'mode': 'shallow'},
+}
+DEFAULT_POLICY = {'mode': 'blobless'}
+SPARSE_OVER_KB = 500_000
+SPARSE_PATHS = ['docs', 'src']
 
 
 def load_comparison():
-    with open(COMPARISON_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return json_io.load(COMPARISON_FILE)
+
+
+def load_clone_policies():
+    """Load clone policies, applying overrides from clone_policies.json if present"""
+    policies = {category: dict(policy) for category, policy in CLONE_POLICIES.items()}
+    
+    if CLONE_POLICIES_FILE.exists():
+        overrides = json_io.load(CLONE_POLICIES_FILE)
+        for category, policy in overrides.items():
+            policies.setdefault(category, dict(DEFAULT_POLICY)).update(policy)
+    
+    return policies
+
+
+def resolve_clone_policy(repo_data, category, policies):
+    """Resolve the effective clone policy for a repo in a given category"""
+    policy = {**DEFAULT_POLICY, **policies.get(category, {})}
+    sparse_over_kb = policy.get('sparse_over_kb', SPARSE_OVER_KB)
+    
+    size_kb = repo_data['github_repo'].get('size') or 0
+    policy['sparse'] = bool(sparse_over_kb) and size_kb > sparse_over_kb
+    if policy['sparse']:
+        policy.setdefault('sparse_paths', SPARSE_PATHS)
+    policy.pop('sparse_over_kb', None)
+    
+    return policy
+
+
+def find_mirror(repo_name):
+    """Return the local bare mirror for a repo (see mirror_store.py), if any"""
+    mirror = MIRRORS_DIR / f"{repo_name}.git"
+    return mirror if mirror.exists() else None
+
 
+def build_clone_command(clone_url, target, policy, reference=None):
+    """Build the git clone command line for a clone policy"""
+    command = ['git', 'clone']
+    
+    if reference:
+        # Objects already in the local mirror are copied instead of downloaded;
+        # --dissociate keeps the clone intact when the mirror is later pruned
+        command.extend(['--reference', str(reference), '--dissociate'])
+    
+    if policy['mode'] == 'blobless':
+        command.append('--filter=blob:none')
+    elif policy['mode'] == 'shallow':
+        command.extend(['--depth', '1', '--single-branch'])
+    elif policy['mode'] != 'full':
+        raise ValueError(f"Unknown clone mode: {policy['mode']}")
+    
+    if policy.get('sparse'):
+        command.append('--sparse')
+    
+    command.extend([clone_url, str(target)])
+    return command
 
-def clone_repository(repo_data, destination):
-    """Clone a repository"""
+
+def clone_repository(repo_data, destination, policy=None):
+    """Clone a repository using the given clone policy"""
     clone_url = repo_data['github_repo']['clone_url']
     repo_name = repo_data['name']
+    policy = policy or {'mode': 'full'}
+    target = destination / repo_name
+    existed = target.exists()
+    mirror = find_mirror(repo_name)
     
     print(f"\n📥 Cloning {repo_name}...")
     print(f"   URL: {clone_url}")
     print(f"   Destination: {destination}/{repo_name}")
+    print(f"   Policy: {policy['mode']}{' + sparse' if policy.get('sparse') else ''}")
+    if mirror:
+        print(f"   Mirror: {mirror}")
     
     try:
         # Use subprocess to clone
         result = subprocess.run(
-            ['git', 'clone', clone_url, str(destination / repo_name)],
+            build_clone_command(clone_url, target, policy, reference=mirror),
             capture_output=True,
             text=True,
             timeout=300  # 5 minute timeout
         )
         
+        if result.returncode == 0 and policy.get('sparse'):
+            result = subprocess.run(
+                ['git', '-C', str(target), 'sparse-checkout', 'set', *policy['sparse_paths']],
+                capture_output=True,
+                text=True,
+                timeout=300
+            )
+        
         if result.returncode == 0:
             print(f"   ✅ Successfully cloned {repo_name}")
             return True
         else:
             print(f"   ❌ Failed to clone {repo_name}: {result.stderr}")
-            return False
-            
+    
     except subprocess.TimeoutExpired:
         print(f"   ⏱️  Timeout cloning {repo_name}")
-        return False
     except Exception as e:
         print(f"   ❌ Error cloning {repo_name}: {e}")
-        return False
+    
+    # A half-cloned or half-configured directory would be skipped as
+    # "already exists" on every later run, so remove it to allow a retry
+    if not existed:
+        shutil.rmtree(target, ignore_errors=True)
+    return False
 
 
 def categorize_repo(repo_data):
@@ -57,7 +155,6 @@ def categorize_repo(repo_data):
         return 'learning'
     
     # Check last update
-    from datetime import datetime
     try:
         pushed_date = datetime.fromisoformat(gh_repo['pushed_at'].replace('Z', '+00:00'))
         days_since = (datetime.now(pushed_date.tzinfo) - pushed_date).days
@@ -80,6 +177,19 @@ def categorize_repo(repo_data):
     return 'active/experimental'
 
 
+def load_clone_manifest():
+    """Load the record of previously cloned repos and their clone policies"""
+    if not CLONE_MANIFEST_FILE.exists():
+        return {}
+    return json_io.load(CLONE_MANIFEST_FILE)
+
+
+def save_clone_manifest(manifest):
+    """Save clone policies so generate_documentation can record them in the registry"""
+    ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
+    json_io.dump(manifest, CLONE_MANIFEST_FILE)
+
+
 def main():
     print("=" * 70)
     print("CLONING REMOTE REPOSITORIES")
@@ -90,6 +200,8 @@ def main():
     
     print(f"\n📊 Found {len(remote_only)} repositories to clone\n")
     
+    policies = load_clone_policies()
+    manifest = load_clone_manifest()
     success_count = 0
     failed_count = 0
     
@@ -98,13 +210,22 @@ def main():
         category = categorize_repo(repo)
         destination = PROJECTS_DIR / category
         destination.mkdir(parents=True, exist_ok=True)
+        policy = resolve_clone_policy(repo, category, policies)
         
         # Clone
-        if clone_repository(repo, destination):
+        if clone_repository(repo, destination, policy):
             success_count += 1
+            manifest[repo['name']] = {
+                'category': category,
+                'path': str(destination / repo['name']),
+                'clone_policy': policy,
+                'cloned_at': datetime.now().isoformat()
+            }
         else:
             failed_count += 1
     
+    save_clone_manifest(manifest)
+    
     print("\n" + "=" * 70)
     print("CLONING SUMMARY")
     print("=" * 70)
@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Cold storage for archive candidates
+
+Usage:
+    cold_storage.py                                # list cold projects and high-priority candidates
+    cold_storage.py archive [project ...] [--keep] # pack candidates (or named projects) into tarballs
+    cold_storage.py extract <project> <file> [dest] # pull one file out of an archive
+    cold_storage.py restore <project>              # unpack a project back to its original path
+    cold_storage.py verify [project ...]           # re-check archive and file checksums
+
+`archive` packs the high-priority archive candidates from
+consolidation_analysis.identify_archive_candidates into
+.cold_storage/<name>-<id>.tar.zst (zstd when the zstandard package is
+installed, .tar.xz otherwise), several projects at a time. Each archive is
+verified against its manifest (archive sha256 plus the sha256 of every file)
+before the project directory is removed; --keep leaves it in place.
+
+The tarball is written as a series of independent compressed frames, each
+starting on a tar member boundary, so it is still an ordinary .tar.zst /
+.tar.xz for tar, while the manifest (<archive>.manifest.json) records the
+frame and offset of every member: `extract` decompresses from that frame
+only, instead of the whole archive.
+
+Cold projects are listed in .cold_storage/index.json. Discovery skips them
+(so every scanner does), the analysis does not report their GitHub repos as
+remote-only, and the registry keeps an entry with status 'cold'.
+"""
+import argparse
+import hashlib
+import io
+import lzma
+import os
+import shutil
+import sys
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import json_io
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+COLD_DIR = PROJECTS_DIR / '.cold_storage'
+INDEX_FILE = COLD_DIR / 'index.json'
+
+CODEC = 'zstd' if zstandard is not None else 'xz'
+EXTENSIONS = {'zstd': '.tar.zst', 'xz': '.tar.xz'}
+ZSTD_LEVEL = 19
+XZ_PRESET = 6
+
+# A new compressed frame starts at the first member boundary after this many bytes
+FRAME_SIZE = 8 << 20
+CHUNK = 1 << 20
+ARCHIVE_WORKERS = 4
+HIGH_PRIORITY = 2
+
+
+def load_index() -> Dict[str, Any]:
+    """Cold projects keyed by their original path"""
+    if not INDEX_FILE.exists():
+        return {'projects': {}}
+    return json_io.load(INDEX_FILE)
+
+
+def save_index(index: Dict[str, Any]):
+    json_io.dump(index, INDEX_FILE, pretty=True)
+
+
+def cold_paths() -> set:
+    return set(load_index()['projects'])
+
+
+def cold_names() -> List[str]:
+    return [entry['name'].lower() for entry in load_index()['projects'].values()]
+
+
+def _compressor(codec: str):
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    return lzma.LZMACompressor(preset=XZ_PRESET)
+
+
+def _decompressor(codec: str):
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("this archive needs the zstandard package")
+        return zstandard.ZstdDecompressor().decompressobj()
+    return lzma.LZMADecompressor()
+
+
+class FrameWriter(io.RawIOBase):
+    """Write-only file object that compresses into independent frames and hashes the output"""
+    
+    def __init__(self, raw, codec: str):
+        self.raw = raw
+        self.codec = codec
+        self.sha256 = hashlib.sha256()
+        self.position = 0        # uncompressed bytes written
+        self.frame_offset = 0    # compressed offset where the current frame starts
+        self.frame_start = 0     # uncompressed offset where the current frame starts
+        self._compressor = _compressor(codec)
+        self._written = 0        # compressed bytes written
+    
+    def writable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self.position
+    
+    def _emit(self, data: bytes):
+        if data:
+            self.raw.write(data)
+            self.sha256.update(data)
+            self._written += len(data)
+    
+    def write(self, data) -> int:
+        self._emit(self._compressor.compress(bytes(data)))
+        self.position += len(data)
+        return len(data)
+    
+    def new_frame(self):
+        """End the current frame if it holds enough data; the next member starts a new one"""
+        if self.position - self.frame_start < FRAME_SIZE:
+            return
+        self._emit(self._compressor.flush())
+        self._compressor = _compressor(self.codec)
+        self.frame_offset = self._written
+        self.frame_start = self.position
+    
+    def close(self):
+        if not self.closed:
+            self._emit(self._compressor.flush())
+        super().close()
+
+
+class FrameReader(io.RawIOBase):
+    """Read-only stream decompressing consecutive frames from the current position of raw"""
+    
+    def __init__(self, raw, codec: str):
+        self.raw = raw
+        self.codec = codec
+        self._decompressor = _decompressor(codec)
+        self._buffer = b''
+    
+    def readable(self) -> bool:
+        return True
+    
+    def _fill(self) -> bool:
+        leftover = b''
+        if self._decompressor.eof:
+            leftover = self._decompressor.unused_data
+            self._decompressor = _decompressor(self.codec)
+        data = leftover or self.raw.read(CHUNK)
+        if not data:
+            return False
+        self._buffer += self._decompressor.decompress(data)
+        return True
+    
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            if not self._fill():
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+class HashingReader:
+    """File wrapper that hashes what tarfile copies out of it"""
+    
+    def __init__(self, f):
+        self.f = f
+        self.sha256 = hashlib.sha256()
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.f.read(size)
+        self.sha256.update(data)
+        return data
+
+
+def _member_type(info: tarfile.TarInfo) -> str:
+    if info.isdir():
+        return 'dir'
+    if info.issym():
+        return 'symlink'
+    return 'file' if info.isreg() else 'other'
+
+
+def registry_snapshot(record: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The analysed metadata a cold project keeps in the registry once it is no longer scanned"""
+    if record is None:
+        return {}
+    gh = record.get('github_repo')
+    return {
+        'tech_stack': {
+            'primary_language': record['tech_stack'].get('primary_language'),
+            'framework': record['tech_stack'].get('framework'),
+            'categories': record['tech_stack'].get('categories', [])
+        },
+        'maturity': {'score': record['maturity']['score'], 'level': record['maturity']['level']},
+        'git': {
+            'has_repo': record['git_info']['is_git_repo'],
+            'remote_url': record['git_info'].get('remote_url'),
+            'last_commit': record['git_info'].get('last_commit')
+        },
+        'github': {
+            'url': gh['html_url'],
+            'description': gh.get('description'),
+            'stars': gh.get('stargazers_count', 0),
+            'language': gh.get('language'),
+            'archived': gh.get('archived', False)
+        } if gh else None
+    }
+
+
+def archive_project(project: Dict[str, Any], codec: str = CODEC) -> Dict[str, Any]:
+    """Pack one project into the store; returns its manifest"""
+    import zlib
+    
+    source = Path(project['path'])
+    stem = f"{project['name']}-{zlib.crc32(str(source).encode()):08x}"
+    archive = COLD_DIR / f"{stem}{EXTENSIONS[codec]}"
+    tmp = archive.with_name(archive.name + '.tmp')
+    COLD_DIR.mkdir(parents=True, exist_ok=True)
+    
+    members = []
+    total_bytes = 0
+    try:
+        with open(tmp, 'wb') as raw:
+            writer = FrameWriter(raw, codec)
+            with tarfile.open(fileobj=writer, mode='w', format=tarfile.PAX_FORMAT) as tar:
+                # Symlinked directories are archived as links, not followed
+                for dirpath, dirnames, filenames in os.walk(source):
+                    dirnames.sort()
+                    rel_dir = os.path.relpath(dirpath, source)
+                    for name in [''] + sorted(filenames) + [d for d in dirnames if os.path.islink(os.path.join(dirpath, d))]:
+                        path = os.path.join(dirpath, name) if name else dirpath
+                        rel = os.path.normpath(os.path.join(rel_dir, name)) if name else rel_dir
+                        info = tar.gettarinfo(path, arcname=os.path.normpath(os.path.join(source.name, rel)))
+                        if info is None:  # sockets, fifos
+                            continue
+                        writer.new_frame()
+                        entry = {'name': rel.replace(os.sep, '/'), 'type': _member_type(info), 'size': info.size,
+                                 'frame': writer.frame_offset, 'offset': writer.tell() - writer.frame_start}
+                        if info.isreg():
+                            with open(path, 'rb') as f:
+                                reader = HashingReader(f)
+                                tar.addfile(info, reader)
+                            entry['sha256'] = reader.sha256.hexdigest()
+                            total_bytes += info.size
+                        else:
+                            tar.addfile(info)
+                        members.append(entry)
+            writer.close()
+        os.replace(tmp, archive)
+    except BaseException:
+        # Never leave a partial archive behind in the store
+        tmp.unlink(missing_ok=True)
+        raise
+    
+    return {
+        'name': project['name'],
+        'path': str(source),
+        'root': project.get('root'),
+        'category': project.get('category'),
+        'archive': archive.name,
+        'codec': codec,
+        'archive_bytes': archive.stat().st_size,
+        'archive_sha256': writer.sha256.hexdigest(),
+        'bytes': total_bytes,
+        'files': sum(1 for m in members if m['type'] == 'file'),
+        'archived_at': datetime.now().isoformat(),
+        'registry': project.get('registry', {}),
+        'members': members
+    }
+
+
+def manifest_file(archive_name: str) -> Path:
+    return COLD_DIR / f"{archive_name}.manifest.json"
+
+
+def discard_archive(archive_name: str):
+    """Remove an archive and its manifest from the store"""
+    (COLD_DIR / archive_name).unlink(missing_ok=True)
+    manifest_file(archive_name).unlink(missing_ok=True)
+
+
+def verify_archive(manifest: Dict[str, Any]) -> List[str]:
+    """Problems found re-reading an archive against its manifest (empty when it is intact)"""
+    archive = COLD_DIR / manifest['archive']
+    problems = []
+    
+    h = hashlib.sha256()
+    with open(archive, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK), b''):
+            h.update(chunk)
+    if h.hexdigest() != manifest['archive_sha256']:
+        return [f"{archive.name}: archive checksum mismatch"]
+    
+    expected = {m['name']: m['sha256'] for m in manifest['members'] if m['type'] == 'file'}
+    seen = set()
+    prefix = Path(manifest['path']).name
+    with open(archive, 'rb') as raw, tarfile.open(fileobj=FrameReader(raw, manifest['codec']), mode='r|') as tar:
+        for info in tar:
+            if not info.isreg():
+                continue
+            name = os.path.relpath(info.name, prefix).replace(os.sep, '/')
+            h = hashlib.sha256()
+            f = tar.extractfile(info)
+            for chunk in iter(lambda: f.read(CHUNK), b''):
+                h.update(chunk)
+            if expected.get(name) != h.hexdigest():
+                problems.append(f"{name}: checksum mismatch")
+            seen.add(name)
+    problems.extend(f"{name}: missing from archive" for name in sorted(set(expected) - seen))
+    return problems
+
+
+def archive_and_verify(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Archive and verify one project; the caller indexes it before removing anything"""
+    try:
+        manifest = archive_project(project)
+    except (OSError, tarfile.TarError) as e:
+        return {'project': project, 'error': str(e)}
+    
+    try:
+        json_io.dump(manifest, manifest_file(manifest['archive']))
+        problems = verify_archive(manifest)
+    except (OSError, tarfile.TarError) as e:
+        problems = [str(e)]
+    if problems:
+        # Unindexed leftovers would be invisible to retries and `status`
+        discard_archive(manifest['archive'])
+        return {'project': project, 'error': '; '.join(problems[:3])}
+    return {'project': project, 'manifest': manifest}
+
+
+def _find_cold(index: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+    return next((entry for path, entry in index['projects'].items()
+                 if entry['name'] == name or path == name), None)
+
+
+def extract_file(entry: Dict[str, Any], member_name: str, dest: Path) -> bool:
+    """Extract one file, decompressing only from the frame that holds it"""
+    manifest = json_io.load(manifest_file(entry['archive']))
+    member = next((m for m in manifest['members'] if m['name'] == member_name and m['type'] == 'file'), None)
+    if member is None:
+        return False
+    
+    with open(COLD_DIR / entry['archive'], 'rb') as raw:
+        raw.seek(member['frame'])
+        stream = io.BufferedReader(FrameReader(raw, manifest['codec']), CHUNK)
+        skip = member['offset']
+        while skip:
+            skipped = len(stream.read(min(skip, CHUNK)))
+            if not skipped:
+                return False
+            skip -= skipped
+        with tarfile.open(fileobj=stream, mode='r|') as tar:
+            info = tar.next()
+            f = tar.extractfile(info)
+            h = hashlib.sha256()
+            with open(dest, 'wb') as out:
+                for chunk in iter(lambda: f.read(CHUNK), b''):
+                    h.update(chunk)
+                    out.write(chunk)
+    
+    if h.hexdigest() != member['sha256']:
+        dest.unlink()
+        raise ValueError(f"{member_name}: checksum mismatch")
+    return True
+
+
+def restore_project(entry: Dict[str, Any]) -> List[str]:
+    """Unpack a cold project back to its original path after verifying the archive"""
+    manifest = json_io.load(manifest_file(entry['archive']))
+    target = Path(entry['path'])
+    if target.exists():
+        return [f"{target} already exists"]
+    
+    problems = verify_archive(manifest)
+    if problems:
+        return problems
+    
+    staging = target.with_name(target.name + '.cold-restore')
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    with open(COLD_DIR / entry['archive'], 'rb') as raw, \
+            tarfile.open(fileobj=FrameReader(raw, manifest['codec']), mode='r|') as tar:
+        if hasattr(tarfile, 'tar_filter'):
+            tar.extractall(staging, filter='tar')
+        else:
+            tar.extractall(staging)
+    os.replace(staging / target.name, target)
+    staging.rmdir()
+    return []
+
+
+def high_priority_candidates() -> List[Dict[str, Any]]:
+    """Local high-priority archive candidates that still exist on disk"""
+    from consolidation_analysis import identify_archive_candidates, load_comparison
+    
+    candidates = identify_archive_candidates(load_comparison())
+    return [{'name': c['name'], 'path': c['project_data']['path'],
+             'root': c['project_data'].get('root'), 'category': c['project_data'].get('category'),
+             'reasons': c['reasons'], 'registry': registry_snapshot(c['project_data'])}
+            for c in candidates
+            if c['priority'] == HIGH_PRIORITY and not c.get('remote_only') and Path(c['project_data']['path']).is_dir()]
+
+
+def run_archive(names: List[str], keep: bool, max_workers: int = ARCHIVE_WORKERS):
+    from disk_usage import format_bytes
+    
+    if names:
+        from consolidation_analysis import load_comparison
+        from discovery import discover_projects
+        records = {record['path']: record for record in load_comparison()['analysis']}
+        projects = [{**proj, 'registry': registry_snapshot(records.get(proj['path']))}
+                    for proj in discover_projects() if proj['name'] in names]
+        missing = set(names) - {proj['name'] for proj in projects}
+        for name in sorted(missing):
+            print(f"  ⚠️  {name}: no such project (or already cold)")
+    else:
+        projects = high_priority_candidates()
+    
+    if not projects:
+        print("✅ Nothing to archive")
+        return
+    
+    print(f"\n🧊 Archiving {len(projects)} projects ({CODEC}, {max_workers} at a time)...")
+    index = load_index()
+    archived = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(archive_and_verify, projects):
+            name = result['project']['name']
+            if 'error' in result:
+                print(f"  ❌ {name}: {result['error']} (project left in place)")
+                continue
+            manifest = result['manifest']
+            index['projects'][manifest['path']] = {k: v for k, v in manifest.items() if k != 'members'}
+            ratio = manifest['archive_bytes'] / manifest['bytes'] if manifest['bytes'] else 0
+            print(f"  ✅ {name}: {manifest['files']:,} files, {format_bytes(manifest['bytes'])} → "
+                  f"{format_bytes(manifest['archive_bytes'])} ({ratio:.0%}), verified")
+            # Indexed before the directory goes, so an interrupted run never
+            # leaves a removed project that restore and discovery cannot see
+            save_index(index)
+            if not keep:
+                shutil.rmtree(manifest['path'])
+            archived += 1
+    
+    if archived and not keep:
+        print("\n🗑️  Archived project directories removed (restore with `cold_storage.py restore <project>`)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold storage for archive candidates')
+    parser.add_argument('action', nargs='?', default='status', choices=['status', 'archive', 'extract', 'restore', 'verify'])
+    parser.add_argument('args', nargs='*')
+    parser.add_argument('--keep', action='store_true', help='keep project directories after archiving')
+    parser.add_argument('--workers', type=int, default=ARCHIVE_WORKERS)
+    args = parser.parse_args()
+    index = load_index()
+    
+    if args.action == 'archive':
+        run_archive(args.args, args.keep, args.workers)
+    
+    elif args.action == 'extract':
+        if len(args.args) < 2:
+            print("❌ Usage: cold_storage.py extract <project> <file> [dest]")
+            sys.exit(1)
+        entry = _find_cold(index, args.args[0])
+        if entry is None:
+            print(f"❌ {args.args[0]} is not in cold storage")
+            sys.exit(1)
+        dest = Path(args.args[2]) if len(args.args) > 2 else Path(Path(args.args[1]).name)
+        if not extract_file(entry, args.args[1], dest):
+            print(f"❌ {args.args[1]} is not a file in {entry['archive']}")
+            sys.exit(1)
+        print(f"✅ Extracted {args.args[1]} → {dest}")
+    
+    elif args.action == 'restore':
+        if not args.args:
+            print("❌ Usage: cold_storage.py restore <project>")
+            sys.exit(1)
+        entry = _find_cold(index, args.args[0])
+        if entry is None:
+            print(f"❌ {args.args[0]} is not in cold storage")
+            sys.exit(1)
+        problems = restore_project(entry)
+        if problems:
+            print(f"❌ Not restored: {'; '.join(problems[:3])}")
+            sys.exit(1)
+        del index['projects'][entry['path']]
+        save_index(index)
+        (COLD_DIR / entry['archive']).unlink()
+        manifest_file(entry['archive']).unlink()
+        print(f"✅ Restored {entry['name']} → {entry['path']}")
+    
+    elif args.action == 'verify':
+        entries = [e for e in index['projects'].values() if not args.args or e['name'] in args.args]
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(lambda e: verify_archive(json_io.load(manifest_file(e['archive']))), entries))
+        for entry, problems in zip(entries, results):
+            print(f"  {'✅' if not problems else '❌'} {entry['name']}: {'; '.join(problems[:3]) or 'intact'}")
+        if any(results):
+            sys.exit(1)
+    
+    else:
+        from disk_usage import format_bytes
+        print(f"\n🧊 Cold storage ({len(index['projects'])} projects in {COLD_DIR})\n")
+        for entry in index['projects'].values():
+            print(f"  {entry['name']:<32} {format_bytes(entry['archive_bytes']):>10}  {entry['archived_at'][:10]}  {entry['archive']}")
+        candidates = high_priority_candidates()
+        print(f"\n📦 High-priority archive candidates: {len(candidates)}")
+        for candidate in candidates:
+            print(f"  • {candidate['name']}: {'; '.join(candidate['reasons'])}")
+
+
+if __name__ == '__main__':
+    main()
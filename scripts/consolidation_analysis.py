@@ -2,11 +2,12 @@
 """
 Consolidation Analysis - Identify duplicates, overlapping projects, and archive candidates
 """
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
-import difflib
+
+import json_io
+from project_records import comparison_from_dict, to_jsonable
 
 PROJECTS_DIR = Path('/Users/dalerogers/Projects')
 COMPARISON_FILE = PROJECTS_DIR / 'project_comparison.json'
@@ -14,12 +15,12 @@ COMPARISON_FILE = PROJECTS_DIR / 'project_comparison.json'
 
 def load_comparison() -> Dict[str, Any]:
     """Load project comparison data"""
-    with open(COMPARISON_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return comparison_from_dict(json_io.load(COMPARISON_FILE))
 
 
 def calculate_name_similarity(name1: str, name2: str) -> float:
     """Calculate similarity between two project names"""
+    import difflib
     return difflib.SequenceMatcher(None, name1.lower(), name2.lower()).ratio()
 
 
@@ -278,8 +279,7 @@ def generate_report(duplicates: List[Dict[str, Any]],
         'recommendations': recommendations
     }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    json_io.dump(report, output_file, default=to_jsonable)
     
     print(f"\n✅ Saved consolidation analysis to: {output_file}")
     
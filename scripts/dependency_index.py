@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Cross-project dependency inventory with an inverted index (package -> projects)
+
+Usage:
+    dependency_index.py build                    # (re)index projects from project_comparison.json
+    dependency_index.py query react "<18"        # which projects use react below 18
+    dependency_index.py query requests           # every project using requests
+
+Parses package.json, package-lock.json, pnpm-lock.yaml, yarn.lock,
+requirements.txt and pyproject.toml. Lockfiles are read line by line so
+memory stays flat, and projects whose manifests are unchanged are not
+re-parsed. Projects are keyed by directory, so same-named projects in
+different categories or roots are indexed separately.
+"""
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+import json_io
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+COMPARISON_FILE = PROJECTS_DIR / 'project_comparison.json'
+INDEX_FILE = ANALYSIS_DIR / 'dependency_index.json'
+
+# Manifest -> ecosystem; manifests declare ranges, lockfiles pin versions
+MANIFESTS = {
+    'package.json': 'npm',
+    'package-lock.json': 'npm',
+    'pnpm-lock.yaml': 'npm',
+    'yarn.lock': 'npm',
+    'requirements.txt': 'pypi',
+    'pyproject.toml': 'pypi',
+}
+
+# package-lock.json object keys that are never package names
+LOCK_CONTAINER_KEYS = {'', 'packages', 'dependencies', 'devDependencies', 'peerDependencies',
+                       'optionalDependencies', 'requires', 'engines', 'bin', 'funding', 'license'}
+
+LOCK_KEY = re.compile(r'^\s*"([^"]*)":\s*\{\s*$')
+LOCK_VERSION = re.compile(r'^\s*"version":\s*"([^"]+)"')
+VERSION_NUMBER = re.compile(r'\d+(?:\.\d+)*')
+# A declared spec naming one version (optionally caret/tilde/== prefixed), not a range
+DECLARED_VERSION = re.compile(r'^\s*(?:[\^~v]|==|~=|=)?\s*v?(\d+(?:\.\d+)*)(?:[-+]?[A-Za-z][\w.+-]*)?\s*$')
+# pnpm lockfile v5 key: 'name/1.2.3' or '@scope/name/1.2.3', optionally with '_peer@x'
+PNPM_V5_KEY = re.compile(r'^((?:@[^/@]+/)?[^/@]+)/(\d[^/_]*)(?:_.*)?$')
+REQUIREMENT = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._\-]*)\s*(\[[^\]]*\])?\s*([^;#]*)')
+
+
+def normalise_python_name(name: str) -> str:
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+def parse_package_json(path: Path) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Yield (name, declared range, resolved version) from package.json"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    for section in ('dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies'):
+        for name, spec in (data.get(section) or {}).items():
+            yield name, spec, None
+
+
+def parse_package_lock(path: Path) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Stream resolved versions from package-lock.json (v1 nested or v2/v3 'packages')"""
+    current = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            key = LOCK_KEY.match(line)
+            if key:
+                name = key.group(1).rsplit('node_modules/', 1)[-1]
+                current = None if name in LOCK_CONTAINER_KEYS else name
+                continue
+            version = LOCK_VERSION.match(line)
+            if version and current:
+                yield current, None, version.group(1)
+                current = None
+
+
+def split_name_version(spec: str) -> Tuple[str, str]:
+    """Split 'name@version' where name may be scoped ('@types/node@20.1.0')"""
+    at = spec.rfind('@')
+    if at <= 0:
+        return spec, ''
+    return spec[:at], spec[at + 1:]
+
+
+def parse_pnpm_lock(path: Path) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Stream package keys from the 'packages:' section of pnpm-lock.yaml"""
+    in_packages = False
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if not line[0].isspace():
+                in_packages = line.startswith('packages:')
+                continue
+            if not in_packages or not line.startswith('  ') or line[2] == ' ' or not line.rstrip().endswith(':'):
+                continue
+            key = line.strip()[:-1].strip('\'"').lstrip('/')
+            key = key.split('(', 1)[0]  # drop v6+ peer-dependency suffixes
+            # Lockfile v5 ('/name/version_peer@x') first: its peer suffix holds an '@' too
+            v5 = PNPM_V5_KEY.match(key)
+            if v5:
+                name, version = v5.group(1), v5.group(2)
+            else:
+                name, version = split_name_version(key)
+            if name and version:
+                yield name, None, version
+
+
+def parse_yarn_lock(path: Path) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Stream entries from yarn.lock (classic and berry formats)"""
+    names = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            if not line[0].isspace() and line.rstrip().endswith(':'):
+                names = []
+                for part in line.rstrip()[:-1].split(','):
+                    name, spec = split_name_version(part.strip().strip('"'))
+                    if name and name not in names and name != '__metadata':
+                        names.append(name)
+                continue
+            stripped = line.strip()
+            if names and (stripped.startswith('version ') or stripped.startswith('version:')):
+                version = stripped[len('version'):].lstrip(' :').strip('"')
+                for name in names:
+                    yield name, None, version
+                names = []
+
+
+def parse_requirements_txt(path: Path) -> Iterator[Tuple[str, str, Optional[str]]]:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line or line.startswith('-'):
+                continue
+            match = REQUIREMENT.match(line)
+            if match:
+                spec = match.group(3).strip()
+                pinned = spec[2:].strip() if spec.startswith('==') else None
+                yield normalise_python_name(match.group(1)), spec or '*', pinned
+
+
+def parse_pyproject_toml(path: Path) -> Iterator[Tuple[str, str, Optional[str]]]:
+    if tomllib is None:
+        return
+    with open(path, 'rb') as f:
+        data = tomllib.load(f)
+    project = data.get('project', {})
+    specs = list(project.get('dependencies', []))
+    for extra in project.get('optional-dependencies', {}).values():
+        specs.extend(extra)
+    for spec in specs:
+        match = REQUIREMENT.match(spec)
+        if match:
+            declared = match.group(3).strip()
+            pinned = declared[2:].strip() if declared.startswith('==') else None
+            yield normalise_python_name(match.group(1)), declared or '*', pinned
+    for name, spec in data.get('tool', {}).get('poetry', {}).get('dependencies', {}).items():
+        if name.lower() != 'python':
+            yield normalise_python_name(name), spec if isinstance(spec, str) else spec.get('version', '*'), None
+
+
+PARSERS = {
+    'package.json': parse_package_json,
+    'package-lock.json': parse_package_lock,
+    'pnpm-lock.yaml': parse_pnpm_lock,
+    'yarn.lock': parse_yarn_lock,
+    'requirements.txt': parse_requirements_txt,
+    'pyproject.toml': parse_pyproject_toml,
+}
+
+
+def manifest_signatures(project_path: Path) -> Dict[str, int]:
+    """mtime of each dependency manifest present in a project directory"""
+    signatures = {}
+    for manifest in MANIFESTS:
+        try:
+            signatures[manifest] = (project_path / manifest).stat().st_mtime_ns
+        except OSError:
+            continue
+    return signatures
+
+
+def index_project(project_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Parse all manifests of one project into {package: entry}"""
+    entries: Dict[str, Dict[str, Any]] = {}
+    for manifest, ecosystem in MANIFESTS.items():
+        path = project_path / manifest
+        if not path.is_file():
+            continue
+        try:
+            for name, declared, resolved in PARSERS[manifest](path):
+                entry = entries.setdefault(name, {'ecosystem': ecosystem, 'declared': None, 'resolved': []})
+                if declared and not entry['declared']:
+                    entry['declared'] = declared
+                if resolved and resolved not in entry['resolved']:
+                    entry['resolved'].append(resolved)
+        except Exception as e:
+            print(f"  ⚠️  Could not parse {path}: {e}")
+    return entries
+
+
+def load_index() -> Dict[str, Any]:
+    if not INDEX_FILE.exists():
+        return {'projects': {}, 'packages': {}}
+    return json_io.load(INDEX_FILE)
+
+
+def save_index(index: Dict[str, Any]):
+    ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
+    index['generated_at'] = datetime.now().isoformat()
+    json_io.dump(index, INDEX_FILE)
+
+
+def update_index(projects: Dict[str, Tuple[str, Path]], index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Re-index projects whose manifests changed; drop projects that disappeared.
+    
+    projects maps a project key (its directory path) to its display name
+    (name, or name/package for workspace members) and directory.
+    """
+    index = index or load_index()
+    changed = set()
+    
+    for key, (name, path) in projects.items():
+        signatures = manifest_signatures(path)
+        known = index['projects'].get(key, {})
+        if known.get('manifests') != signatures:
+            changed.add(key)
+        index['projects'][key] = {'name': name, 'path': str(path), 'manifests': signatures}
+    removed = set(index['projects']) - set(projects)
+    for key in removed:
+        del index['projects'][key]
+    
+    stale = changed | removed
+    if stale:
+        for name in list(index['packages']):
+            users = index['packages'][name]
+            for key in stale & set(users):
+                del users[key]
+            if not users:
+                del index['packages'][name]
+    
+    for key in changed:
+        for name, entry in index_project(projects[key][1]).items():
+            index['packages'].setdefault(name, {})[key] = entry
+    
+    index['last_changed'] = sorted(changed)
+    return index
+
+
+def version_tuple(version: str) -> Tuple[int, ...]:
+    """Leading numeric release of a version ('18.2.0-rc.1' -> (18, 2, 0), '>=16 <19' -> (16,))"""
+    match = VERSION_NUMBER.search(version)
+    return tuple(int(part) for part in match.group().split('.')[:3]) if match else ()
+
+
+def declared_version(spec: Optional[str]) -> Optional[str]:
+    """The version a declared spec pins or starts from ('^18.2.0', '==4.2'); None for ranges"""
+    match = DECLARED_VERSION.match(spec or '')
+    return match.group(1) if match else None
+
+
+def satisfies(version: str, constraint: str) -> bool:
+    """Check a version against constraints like '<18', '>=1.2,<2', '==4.2'.
+    
+    Only as many components as the constraint gives are compared, so 18.2.0
+    satisfies '<=18' and '==18' but not '<18'.
+    """
+    for clause in filter(None, (c.strip() for c in constraint.split(','))):
+        match = re.match(r'(<=|>=|==|!=|<|>|=)?\s*(.+)', clause)
+        op, target = match.group(1) or '==', version_tuple(match.group(2))
+        have = version_tuple(version)[:len(target)]
+        if op in ('==', '='):
+            ok = have == target
+        elif op == '!=':
+            ok = have != target
+        else:
+            ok = {'<': have < target, '<=': have <= target, '>': have > target, '>=': have >= target}[op]
+        if not ok:
+            return False
+    return True
+
+
+def query(index: Dict[str, Any], package: str, constraint: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Projects using a package, optionally filtered by a version constraint.
+    
+    Pinned lockfile versions are checked when known; otherwise the declared
+    spec is used when it names a single version ('18.2.0', '^18.2.0', '==4.2').
+    Projects that only declare a range ('>=16 <19') never match a constraint.
+    """
+    users = index['packages'].get(package) or index['packages'].get(normalise_python_name(package), {})
+    matches = []
+    for key, entry in sorted(users.items()):
+        versions = entry['resolved'] or list(filter(None, [declared_version(entry['declared'])]))
+        versions = [v for v in versions if version_tuple(v)]
+        if constraint and not any(satisfies(v, constraint) for v in versions):
+            continue
+        project = index['projects'].get(key, {}).get('name', key)
+        matches.append({'project': project, 'path': key, **entry})
+    return matches
+
+
+def projects_from_analysis(analysis: List[Dict[str, Any]]) -> Dict[str, Tuple[str, Path]]:
+    """Project (and workspace package) names and directories from analyze_projects results, keyed by path"""
+    projects = {}
+    for proj in analysis:
+        projects[proj['path']] = (proj['name'], Path(proj['path']))
+        for package in (proj.get('workspace') or {}).get('packages', []):
+            path = Path(proj['path']) / package['path']
+            projects[str(path)] = (f"{proj['name']}/{package['path']}", path)
+    return projects
+
+
+def main():
+    action = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    
+    if action == 'query':
+        if len(sys.argv) < 3:
+            print("❌ Usage: dependency_index.py query <package> [constraint]")
+            sys.exit(1)
+        package = sys.argv[2]
+        constraint = sys.argv[3] if len(sys.argv) > 3 else None
+        matches = query(load_index(), package, constraint)
+        print(f"\n🔎 {package} {constraint or ''}: {len(matches)} projects\n")
+        for m in matches:
+            resolved = ', '.join(m['resolved']) or '-'
+            print(f"  • {m['project']:<32} declared: {m['declared'] or '-':<15} resolved: {resolved:<20} {m['path']}")
+        return
+    
+    print("=" * 70)
+    print("DEPENDENCY INDEX")
+    print("=" * 70)
+    comparison = json_io.load(COMPARISON_FILE)
+    index = update_index(projects_from_analysis(comparison['analysis']))
+    save_index(index)
+    print(f"\n📦 Packages indexed: {len(index['packages'])}")
+    print(f"📁 Projects indexed: {len(index['projects'])}")
+    print(f"🔄 Re-parsed this run: {len(index['last_changed'])}")
+    print(f"✅ Saved: {INDEX_FILE}")
+
+
+if __name__ == '__main__':
+    main()
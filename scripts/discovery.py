@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Project discovery over the organisational layout, cached as a snapshot
+
+Usage:
+    discovery.py            # print discovered projects (uses the snapshot when valid)
+    discovery.py --refresh  # force a rescan
+
+Projects live at the root or one level inside a category directory
+(active/production, portfolio, archived, ...) of each configured root (see
+roots.py). The layout is walked once and written to analysis/discovery.json
+(one snapshot per root) with each project's root, category, inode and mtime.
+A container directory is only rescanned when its own mtime changes, which
+happens whenever a project is added, removed or renamed inside it.
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any
+
+import json_io
+from roots import cache_path, load_roots
+from tree_walk import EXCLUDE_DIRS
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+SNAPSHOT_FILE = ANALYSIS_DIR / 'discovery.json'
+
+CATEGORY_DIRS = ['active/production', 'active/development', 'active/experimental',
+                 'portfolio', 'archived', 'templates', 'learning']
+
+# Root-level directories that are not projects
+NON_PROJECT_DIRS = {'active', 'portfolio', 'archived', 'templates', 'learning',
+                    'analysis', 'docs', 'scripts', 'work', 'cursor_rules_library'}
+
+ROOT_CATEGORY = 'root'
+
+
+def _container_dirs(root_path: Path) -> Dict[str, Path]:
+    """Category name -> directory whose children are projects"""
+    containers = {ROOT_CATEGORY: root_path}
+    containers.update({category: root_path / category for category in CATEGORY_DIRS})
+    return containers
+
+
+def scan_container(category: str, container: Path) -> List[Dict[str, Any]]:
+    """List the projects directly inside one container directory"""
+    projects = []
+    try:
+        entries = list(os.scandir(container))
+    except OSError:
+        return projects
+    
+    for entry in sorted(entries, key=lambda e: e.name):
+        if entry.name.startswith('.') or entry.name in EXCLUDE_DIRS:
+            continue
+        if category == ROOT_CATEGORY and entry.name in NON_PROJECT_DIRS:
+            continue
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        projects.append({
+            'name': entry.name,
+            'path': entry.path,
+            'category': category,
+            'inode': st.st_ino,
+            'mtime': st.st_mtime_ns
+        })
+    return projects
+
+
+def load_snapshot(snapshot_file: Path, root_path: str) -> Dict[str, Any]:
+    if snapshot_file.exists():
+        try:
+            snapshot = json_io.load(snapshot_file)
+            if snapshot.get('root') == root_path:
+                return snapshot
+        except (OSError, ValueError):
+            pass
+    return {'root': root_path, 'containers': {}}
+
+
+def discover_root(root: Dict[str, Any], refresh: bool = False) -> List[Dict[str, Any]]:
+    """Projects of one root, rescanning only the container directories whose mtime changed"""
+    snapshot_file = cache_path(root, SNAPSHOT_FILE.name)
+    snapshot = {'root': root['path'], 'containers': {}} if refresh else load_snapshot(snapshot_file, root['path'])
+    containers = _container_dirs(Path(root['path']))
+    changed = False
+    
+    for category, container in containers.items():
+        try:
+            mtime = os.stat(container).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = snapshot['containers'].get(category)
+        if cached and cached['mtime'] == mtime:
+            continue
+        snapshot['containers'][category] = {
+            'mtime': mtime,
+            'projects': scan_container(category, container) if mtime is not None else []
+        }
+        changed = True
+    
+    if changed:
+        json_io.dump(snapshot, snapshot_file)
+    
+    return [{**proj, 'root': root['name']}
+            for category in containers for proj in snapshot['containers'][category]['projects']]
+
+
+def discover_projects(refresh: bool = False) -> List[Dict[str, Any]]:
+    """All projects across the configured roots; each root is listed by its own worker.
+    
+    Projects in cold storage (see cold_storage.py) are left out.
+    """
+    from cold_storage import cold_paths
+    
+    roots = load_roots()
+    with ThreadPoolExecutor(max_workers=len(roots)) as executor:
+        per_root = list(executor.map(lambda root: discover_root(root, refresh), roots))
+    cold = cold_paths()
+    return [proj for projects in per_root for proj in projects if proj['path'] not in cold]
+
+
+def main():
+    projects = discover_projects(refresh='--refresh' in sys.argv)
+    print(f"\n📁 {len(projects)} projects\n")
+    for proj in projects:
+        print(f"  {proj['root']:<12} {proj['category']:<22} {proj['name']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Disk usage per project, broken down into regenerable bloat and the rest
+
+Usage:
+    disk_usage.py              # all projects, ranked by reclaimable space
+    disk_usage.py <path> ...   # specific projects
+
+Bytes are allocated blocks (as `du` reports), and each hard-linked file is
+counted once per project by (device, inode), so pnpm/uv link farms are not
+double counted. Directories are scanned level by level with a thread pool.
+Each directory's direct totals are cached under its mtime, so an unchanged
+directory costs one stat; the mtime only moves when entries are added,
+removed or renamed, so a file growing in place is picked up on the next
+change to its directory.
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import json_io
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+CACHE_FILE = ANALYSIS_DIR / 'disk_usage_cache.json'
+
+USAGE_WORKERS = 8
+
+# Directory name -> category for it and everything below it
+CATEGORY_OF = {
+    'node_modules': 'node_modules',
+    '.venv': 'virtualenv',
+    'venv': 'virtualenv',
+    '.next': 'build_output',
+    '.git': 'git',
+}
+
+# Only at the project top level; deeper build/ or dist/ directories
+# (src/build, docs/dist) are as often kept source as generated output
+TOP_LEVEL_CATEGORY_OF = {
+    **CATEGORY_OF,
+    'dist': 'build_output',
+    'build': 'build_output',
+}
+CATEGORIES = ['node_modules', 'virtualenv', 'build_output', 'git', 'source']
+
+# Categories that can be deleted and regenerated
+RECLAIMABLE = ('node_modules', 'virtualenv', 'build_output')
+
+
+def _allocated(st: os.stat_result) -> int:
+    blocks = getattr(st, 'st_blocks', None)
+    return blocks * 512 if blocks is not None else st.st_size
+
+
+def format_bytes(n: int) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} TB"
+
+
+def load_cache(cache_file: Path = CACHE_FILE) -> Dict[str, List[Any]]:
+    """Per-directory results keyed by path: [mtime_ns, bytes, files, links, subdirs]"""
+    if not cache_file.exists():
+        return {}
+    try:
+        return json_io.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: Dict[str, List[Any]], cache_file: Path = CACHE_FILE):
+    json_io.dump(cache, cache_file)
+
+
+def scan_directory(path: str, cache: Dict[str, List[Any]]) -> Optional[List[Any]]:
+    """Direct totals of one directory; hard-linked files are listed as [dev, ino, bytes]"""
+    try:
+        st = os.stat(path, follow_symlinks=False)
+    except OSError:
+        return None
+    cached = cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns:
+        return cached
+    
+    total, files, links, subdirs = _allocated(st), 0, [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                        continue
+                    est = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                files += 1
+                if est.st_nlink > 1:
+                    links.append([est.st_dev, est.st_ino, _allocated(est)])
+                else:
+                    total += _allocated(est)
+    except OSError:
+        return None
+    
+    result = [st.st_mtime_ns, total, files, links, subdirs]
+    cache[path] = result
+    return result
+
+
+def usage_project(project_path: Path, cache: Dict[str, List[Any]], seen: Optional[set] = None,
+                  max_workers: int = USAGE_WORKERS) -> Dict[str, Any]:
+    """Total bytes and files of a project, per category"""
+    seen = seen if seen is not None else set()
+    totals = {category: {'bytes': 0, 'files': 0} for category in CATEGORIES}
+    linked_inodes = set()
+    linked_bytes = 0
+    
+    root = str(project_path)
+    frontier = [(root, 'source')]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while frontier:
+            results = executor.map(lambda item: scan_directory(item[0], cache), frontier)
+            next_frontier = []
+            for (path, category), result in zip(frontier, results):
+                if result is None:
+                    continue
+                seen.add(path)
+                _, total, files, links, subdirs = result
+                stats = totals[category]
+                stats['bytes'] += total
+                stats['files'] += files
+                for dev, ino, size in links:
+                    if (dev, ino) not in linked_inodes:
+                        linked_inodes.add((dev, ino))
+                        stats['bytes'] += size
+                        linked_bytes += size
+                category_of = TOP_LEVEL_CATEGORY_OF if path == root else CATEGORY_OF
+                for name in subdirs:
+                    sub_category = category_of.get(name, category) if category == 'source' else category
+                    next_frontier.append((os.path.join(path, name), sub_category))
+            frontier = next_frontier
+    
+    return {
+        'bytes': sum(stats['bytes'] for stats in totals.values()),
+        'files': sum(stats['files'] for stats in totals.values()),
+        'reclaimable_bytes': sum(totals[category]['bytes'] for category in RECLAIMABLE),
+        'hardlinked_bytes': linked_bytes,
+        'categories': totals
+    }
+
+
+def usage_projects(project_paths: List[Path], max_workers: int = USAGE_WORKERS,
+                   cache_file: Path = CACHE_FILE) -> Dict[str, Dict[str, Any]]:
+    """Disk usage for several projects with a shared, persisted directory cache"""
+    cache = load_cache(cache_file)
+    seen = set()
+    results = {str(path): usage_project(path, cache, seen, max_workers) for path in project_paths}
+    
+    # Drop directories that have gone from the scanned projects
+    prefixes = tuple(str(path) + os.sep for path in project_paths)
+    roots = {str(path) for path in project_paths}
+    for path in [p for p in cache if (p.startswith(prefixes) or p in roots) and p not in seen]:
+        del cache[path]
+    
+    save_cache(cache, cache_file)
+    return results
+
+
+def main():
+    if len(sys.argv) > 1:
+        paths = [Path(p).resolve() for p in sys.argv[1:]]
+    else:
+        from discovery import discover_projects
+        paths = [Path(p['path']) for p in discover_projects()]
+    
+    results = usage_projects(paths)
+    ranked = sorted(results.items(), key=lambda x: x[1]['reclaimable_bytes'], reverse=True)
+    
+    print(f"\n💾 Disk usage ({len(ranked)} projects, ranked by reclaimable space)\n")
+    print(f"  {'PROJECT':<32} {'TOTAL':>10} {'FILES':>9} {'RECLAIMABLE':>12}  BIGGEST BLOAT")
+    for path, usage in ranked:
+        bloat = max(RECLAIMABLE, key=lambda c: usage['categories'][c]['bytes'])
+        bloat_bytes = usage['categories'][bloat]['bytes']
+        biggest = f"{bloat} {format_bytes(bloat_bytes)}" if bloat_bytes else '-'
+        print(f"  {Path(path).name:<32} {format_bytes(usage['bytes']):>10} {usage['files']:>9,} "
+              f"{format_bytes(usage['reclaimable_bytes']):>12}  {biggest}")
+    
+    total = sum(u['bytes'] for u in results.values())
+    reclaimable = sum(u['reclaimable_bytes'] for u in results.values())
+    print(f"\n✅ {format_bytes(total)} in total, {format_bytes(reclaimable)} reclaimable")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Duplicate files across projects (images, datasets, PDFs, ...)
+
+Usage:
+    duplicate_files.py [--min-size BYTES]            # report duplicate groups
+    duplicate_files.py link [--min-size BYTES]       # replace duplicates with hard links
+    duplicate_files.py reflink [--min-size BYTES]    # replace duplicates with copy-on-write clones
+
+Candidates are narrowed in stages so most files are never read in full:
+  1. files are bucketed by size (one stat each, from the walk); a size held
+     by a single file cannot have a duplicate
+  2. files sharing a size are hashed over their first and last 64 KB
+  3. only files that still collide get a full streaming sha256
+Hard links of one file count as one physical copy. Hashes are cached under
+each file's size and mtime in analysis/duplicate_files_cache.json.
+
+Every file under a project is considered, including gitignored assets such
+as datasets; dependency and build directories (node_modules, .venv, dist,
+...) are pruned as in every other walk (see node_modules_dedup.py for those).
+
+`link` makes every copy share one inode, so editing one copy in place
+changes them all; `reflink` (cp -c on APFS, cp --reflink on Btrfs/XFS)
+shares blocks copy-on-write and keeps copies independent. Both only touch
+files whose size and mtime still match the scan, with the same permissions
+as the kept copy and on the same filesystem. Reflinked copies keep their own
+inodes, so later reports still list them.
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import json_io
+from tree_walk import walk_project
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+CACHE_FILE = ANALYSIS_DIR / 'duplicate_files_cache.json'
+REPORT_FILE = ANALYSIS_DIR / 'duplicate_files.json'
+
+MIN_SIZE = 1 << 20
+EDGE = 64 * 1024
+CHUNK = 1 << 20
+HASH_WORKERS = 8
+
+
+def collect_files(projects: List[Dict[str, Any]], min_size: int) -> Dict[int, Dict[Tuple[int, int], Dict[str, Any]]]:
+    """Size -> physical file (dev, ino) -> its stat details and every path linking it"""
+    by_size: Dict[int, Dict[Tuple[int, int], Dict[str, Any]]] = {}
+    for proj in projects:
+        for _, _, files in walk_project(Path(proj['path']), ignore=False):
+            for entry in files:
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if st.st_size < min_size:
+                    continue
+                inode = by_size.setdefault(st.st_size, {}).setdefault((st.st_dev, st.st_ino), {
+                    'size': st.st_size, 'mtime': st.st_mtime_ns, 'mode': st.st_mode & 0o7777, 'paths': []
+                })
+                inode['paths'].append({'path': entry.path, 'project': proj['name']})
+    return by_size
+
+
+def partial_digest(path: str, size: int) -> str:
+    """sha256 of the first and last 64 KB (the whole file when it is smaller than both)"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        h.update(f.read(EDGE))
+        if size > EDGE:
+            f.seek(max(EDGE, size - EDGE))
+            h.update(f.read(EDGE))
+    return h.hexdigest()
+
+
+def full_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cached_digest(cache: Dict[str, List[Any]], inode: Dict[str, Any], slot: int) -> Optional[str]:
+    """Cached digest for a physical file; slot 2 is the partial hash, 3 the full hash"""
+    for entry in inode['paths']:
+        cached = cache.get(entry['path'])
+        if cached and cached[0] == inode['size'] and cached[1] == inode['mtime'] and cached[slot]:
+            return cached[slot]
+    return None
+
+
+def _hash_stage(inodes: List[Dict[str, Any]], cache: Dict[str, List[Any]], slot: int, max_workers: int) -> int:
+    """Fill inode['partial'] or inode['full']; returns the number of bytes actually read"""
+    key = 'partial' if slot == 2 else 'full'
+    todo = []
+    for inode in inodes:
+        inode[key] = _cached_digest(cache, inode, slot)
+        if inode[key] is None:
+            todo.append(inode)
+    
+    def digest(inode):
+        path, size = inode['paths'][0]['path'], inode['size']
+        try:
+            return partial_digest(path, size) if slot == 2 else full_digest(path)
+        except OSError:
+            return None
+    
+    read = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for inode, value in zip(todo, executor.map(digest, todo)):
+            inode[key] = value
+            if value is None:
+                continue
+            size = inode['size']
+            read += min(size, 2 * EDGE) if slot == 2 else size
+            for entry in inode['paths']:
+                cached = cache.setdefault(entry['path'], [size, inode['mtime'], None, None])
+                if cached[:2] != [size, inode['mtime']]:
+                    cached[:] = [size, inode['mtime'], None, None]
+                cached[slot] = value
+    return read
+
+
+def _colliding(groups: Dict[Any, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return [inode for group in groups.values() if len(group) > 1 for inode in group]
+
+
+def find_duplicates(projects: List[Dict[str, Any]], min_size: int = MIN_SIZE,
+                    max_workers: int = HASH_WORKERS, cache_file: Path = CACHE_FILE) -> Dict[str, Any]:
+    """Duplicate groups across projects, found by size, then edge hash, then full hash"""
+    cache = {}
+    if cache_file.exists():
+        try:
+            cache = json_io.load(cache_file)
+        except (OSError, ValueError):
+            cache = {}
+    
+    by_size = collect_files(projects, min_size)
+    
+    # Stage 1: only sizes held by more than one physical file
+    same_size = _colliding({size: list(inodes.values()) for size, inodes in by_size.items()})
+    
+    # Stage 2: first + last 64 KB
+    partial_read = _hash_stage(same_size, cache, 2, max_workers)
+    by_partial: Dict[Tuple[int, str], List[Dict[str, Any]]] = {}
+    for inode in same_size:
+        if inode['partial'] is not None:
+            by_partial.setdefault((inode['size'], inode['partial']), []).append(inode)
+    
+    # Stage 3: full hash; files no bigger than both edges were already read whole
+    survivors = _colliding(by_partial)
+    needs_full = [inode for inode in survivors if inode['size'] > 2 * EDGE]
+    full_read = _hash_stage(needs_full, cache, 3, max_workers)
+    by_full: Dict[Tuple[int, str], List[Dict[str, Any]]] = {}
+    for inode in survivors:
+        digest = inode['full'] if inode['size'] > 2 * EDGE else inode['partial']
+        if digest is not None:
+            by_full.setdefault((inode['size'], digest), []).append(inode)
+    
+    scanned = {entry['path'] for inode in same_size for entry in inode['paths']}
+    json_io.dump({path: entry for path, entry in cache.items() if path in scanned}, cache_file)
+    
+    groups = []
+    for (size, digest), inodes in by_full.items():
+        if len(inodes) < 2:
+            continue
+        paths = [entry for inode in inodes for entry in inode['paths']]
+        groups.append({
+            'size': size,
+            'sha256': digest,
+            'copies': len(paths),
+            'physical_copies': len(inodes),
+            'wasted_bytes': size * (len(inodes) - 1),
+            'projects': sorted({entry['project'] for entry in paths}),
+            'files': [{'path': entry['path'], 'mtime': inode['mtime'], 'mode': inode['mode']}
+                      for inode in inodes for entry in inode['paths']]
+        })
+    groups.sort(key=lambda g: g['wasted_bytes'], reverse=True)
+    
+    files = sum(len(inode['paths']) for inodes in by_size.values() for inode in inodes.values())
+    return {
+        'min_size': min_size,
+        'files_considered': files,
+        'bytes_considered': sum(size * len(inodes) for size, inodes in by_size.items()),
+        'same_size_files': len(same_size),
+        'full_hashed': len(needs_full),
+        'bytes_read': partial_read + full_read,
+        'duplicate_groups': len(groups),
+        'wasted_bytes': sum(g['wasted_bytes'] for g in groups),
+        'groups': groups
+    }
+
+
+def _reflink(source: str, dest: str):
+    flag = '-c' if sys.platform == 'darwin' else '--reflink=always'
+    subprocess.run(['cp', flag, source, dest], check=True, capture_output=True)
+    shutil.copystat(source, dest)
+
+
+def link_group(group: Dict[str, Any], mode: str) -> Tuple[int, int]:
+    """Point every copy at the first one (hard link or reflink); returns (files replaced, bytes freed)"""
+    keep = group['files'][0]
+    try:
+        keep_st = os.stat(keep['path'])
+    except OSError:
+        return 0, 0
+    if keep_st.st_size != group['size'] or keep_st.st_mtime_ns != keep['mtime']:
+        return 0, 0
+    
+    replaced = freed = 0
+    for copy in group['files'][1:]:
+        path = copy['path']
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if (st.st_dev, st.st_ino) == (keep_st.st_dev, keep_st.st_ino):
+            continue
+        # Changed since the scan, on another filesystem or with other permissions
+        if (st.st_size != group['size'] or st.st_mtime_ns != copy['mtime'] or st.st_dev != keep_st.st_dev
+                or (mode == 'link' and st.st_mode & 0o7777 != keep['mode'])):
+            continue
+        
+        tmp = f"{path}.dedup-tmp"
+        try:
+            if mode == 'link':
+                os.link(keep['path'], tmp)
+            else:
+                _reflink(keep['path'], tmp)
+            os.replace(tmp, path)
+        except (OSError, subprocess.CalledProcessError) as e:
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+            print(f"  ⚠️  Could not {mode} {path}: {e}")
+            continue
+        replaced += 1
+        if st.st_nlink == 1:
+            freed += group['size']
+    return replaced, freed
+
+
+def main():
+    from discovery import discover_projects
+    from disk_usage import format_bytes
+    
+    parser = argparse.ArgumentParser(description='Duplicate files across projects')
+    parser.add_argument('action', nargs='?', default='report', choices=['report', 'link', 'reflink'])
+    parser.add_argument('--min-size', type=int, default=MIN_SIZE, help='smallest file considered (bytes)')
+    args = parser.parse_args()
+    
+    projects = discover_projects()
+    print(f"\n🔍 Looking for duplicate files of {format_bytes(args.min_size)} or more in {len(projects)} projects...")
+    report = find_duplicates(projects, args.min_size)
+    json_io.dump(report, REPORT_FILE, pretty=True)
+    
+    print(f"  • {report['files_considered']:,} files ({format_bytes(report['bytes_considered'])})")
+    print(f"  • {report['same_size_files']:,} share a size, {report['full_hashed']:,} needed a full hash")
+    print(f"  • {format_bytes(report['bytes_read'])} read")
+    
+    print(f"\n  {'FILE':<48} {'COPIES':>6} {'SIZE':>10} {'WASTED':>10}")
+    for group in report['groups'][:20]:
+        name = Path(group['files'][0]['path']).name
+        print(f"  {name[:48]:<48} {group['copies']:>6} {format_bytes(group['size']):>10} "
+              f"{format_bytes(group['wasted_bytes']):>10}")
+        print(f"      {', '.join(group['projects'])}")
+    print(f"\n💾 {report['duplicate_groups']:,} duplicate groups, {format_bytes(report['wasted_bytes'])} wasted")
+    print(f"✅ Saved: {REPORT_FILE}")
+    
+    if args.action in ('link', 'reflink'):
+        total_replaced = total_freed = 0
+        for group in report['groups']:
+            replaced, freed = link_group(group, args.action)
+            total_replaced += replaced
+            total_freed += freed
+        verb = 'Hard-linked' if args.action == 'link' else 'Reflinked'
+        print(f"\n🔗 {verb} {total_replaced:,} files, freeing {format_bytes(total_freed)}")
+
+
+if __name__ == '__main__':
+    main()
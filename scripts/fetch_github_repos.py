@@ -3,14 +3,18 @@
 Fetch all repositories from a GitHub user account
 """
 import json
-import urllib.request
-import urllib.error
 from typing import List, Dict, Any
 
+import json_io
+
+
 def fetch_user_repos(username: str) -> List[Dict[str, Any]]:
     """
     Fetch all public repositories for a given GitHub username
     """
+    import urllib.error
+    import urllib.request
+    
     repos = []
     page = 1
     per_page = 100
@@ -81,7 +85,7 @@ def extract_repo_metadata(repo: Dict[str, Any]) -> Dict[str, Any]:
         'has_issues': repo.get('has_issues', False),
     }
 
-if __name__ == '__main__':
+def main():
     username = 'Duds'
     print(f"Fetching repositories for user: {username}")
     
@@ -94,8 +98,7 @@ if __name__ == '__main__':
     
     # Save to JSON
     output_file = '/Users/dalerogers/Projects/github_repos_duds.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(repos_metadata, f, indent=2, ensure_ascii=False)
+    json_io.dump(repos_metadata, output_file)
     
     print(f"\nSaved repository metadata to: {output_file}")
     
@@ -116,3 +119,6 @@ if __name__ == '__main__':
     for lang, count in sorted(languages.items(), key=lambda x: x[1], reverse=True):
         print(f"{lang}: {count}")
 
+
+if __name__ == '__main__':
+    main()
@@ -2,11 +2,13 @@
 """
 Generate comprehensive documentation and project registry
 """
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+import json_io
+from project_records import comparison_from_dict
+
 PROJECTS_DIR = Path('/Users/dalerogers/Projects')
 DOCS_DIR = PROJECTS_DIR / 'docs'
 ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
@@ -19,26 +21,36 @@ def load_data_files():
     # Load comparison data
     comparison_file = ANALYSIS_DIR / 'project_comparison.json'
     if comparison_file.exists():
-        with open(comparison_file, 'r') as f:
-            data['comparison'] = json.load(f)
+        data['comparison'] = comparison_from_dict(json_io.load(comparison_file))
     
     # Load GitHub repos
     github_file = ANALYSIS_DIR / 'github_repos_duds.json'
     if github_file.exists():
-        with open(github_file, 'r') as f:
-            data['github_repos'] = json.load(f)
+        data['github_repos'] = json_io.load(github_file)
     
     # Load consolidation recommendations
     consolidation_file = ANALYSIS_DIR / 'consolidation_recommendations.json'
     if consolidation_file.exists():
-        with open(consolidation_file, 'r') as f:
-            data['consolidation'] = json.load(f)
+        data['consolidation'] = json_io.load(consolidation_file)
     
     # Load cursor inventory
     cursor_file = ANALYSIS_DIR / 'cursor_files_inventory.json'
     if cursor_file.exists():
-        with open(cursor_file, 'r') as f:
-            data['cursor'] = json.load(f)
+        data['cursor'] = json_io.load(cursor_file)
+    
+    # Load clone policies recorded by clone_remote_repos.py
+    clone_file = ANALYSIS_DIR / 'clone_manifest.json'
+    if clone_file.exists():
+        data['clones'] = json_io.load(clone_file)
+    
+    # Load maturity score history recorded by analyze_projects.py
+    from metrics_history import HISTORY_DB, score_trends
+    if HISTORY_DB.exists():
+        data['trends'] = score_trends()
+    
+    # Load projects packed away by cold_storage.py
+    from cold_storage import load_index
+    data['cold'] = load_index()['projects']
     
     return data
 
@@ -56,8 +68,14 @@ def generate_project_registry(data: Dict) -> Dict[str, Any]:
     comparison = data.get('comparison', {})
     analysis = comparison.get('analysis', [])
     
+    cold = data.get('cold', {})
+    
     # Build registry entries
     for proj in analysis:
+        # Cold projects get their entry from the cold storage index below
+        if proj['path'] in cold:
+            continue
+        
         # Adjust for renamed projects
         project_name = proj['name']
         if project_name == 'Aegrid':
@@ -76,6 +94,8 @@ def generate_project_registry(data: Dict) -> Dict[str, Any]:
             'name': project_name,
             'original_name': proj['name'],
             'path': proj['path'].replace(proj['name'], project_name),
+            'root': proj.get('root'),
+            'category': proj.get('category'),
             'tech_stack': {
                 'primary_language': proj['tech_stack'].get('primary_language'),
                 'framework': proj['tech_stack'].get('framework'),
@@ -88,13 +108,57 @@ def generate_project_registry(data: Dict) -> Dict[str, Any]:
             'git': {
                 'has_repo': proj['git_info']['is_git_repo'],
                 'remote_url': proj['git_info'].get('remote_url'),
-                'last_commit': proj['git_info'].get('last_commit')
+                'last_commit': proj['git_info'].get('last_commit'),
+                'sync_state': proj['git_info'].get('divergence', {}).get('state'),
+                'ahead': proj['git_info'].get('divergence', {}).get('ahead'),
+                'behind': proj['git_info'].get('divergence', {}).get('behind')
             },
             'github': None,
             'status': 'active',
             'last_updated': datetime.now().isoformat()
         }
         
+        # Commit cadence and churn from git_history.py
+        history = proj['git_info'].get('history')
+        if history:
+            entry['git']['activity'] = {
+                'commits_30d': history['commits_30d'],
+                'commits_90d': history['commits_90d'],
+                'commits_365d': history['commits_365d'],
+                'total_commits': history['total_commits'],
+                'active_authors': history['active_authors'],
+                'top_churn': history['top_churn'][:5]
+            }
+        
+        # Bytes and files per category from disk_usage.py
+        if proj.get('disk_usage'):
+            entry['disk_usage'] = proj['disk_usage']
+        
+        # Walk budget report when the scan was cut short
+        if proj.get('truncated'):
+            entry['truncated'] = proj['truncated']
+        
+        # Files, bytes and lines per language from language_census.py
+        if proj.get('languages'):
+            entry['languages'] = proj['languages']
+        
+        # Roll up monorepo packages analysed by workspaces.py
+        if proj.get('workspace'):
+            entry['tech_stack']['package_languages'] = proj['tech_stack'].get('package_languages', {})
+            entry['workspace'] = {
+                'tool': proj['workspace']['tool'],
+                'packages': [
+                    {
+                        'name': pkg['name'],
+                        'path': pkg['path'],
+                        'primary_language': pkg['tech_stack']['primary_language'],
+                        'framework': pkg['tech_stack']['framework'],
+                        'test_files': pkg['test_files']
+                    }
+                    for pkg in proj['workspace']['packages']
+                ]
+            }
+        
         # Add GitHub info if available
         if proj.get('github_repo'):
             gh = proj['github_repo']
@@ -170,6 +234,40 @@ def generate_project_registry(data: Dict) -> Dict[str, Any]:
         
         registry['projects'].append(entry)
     
+    # Add cold-stored projects with the metadata recorded when they were archived
+    for path, archived in cold.items():
+        snapshot = archived.get('registry', {})
+        entry = {
+            'name': archived['name'],
+            'original_name': archived['name'],
+            'path': path,
+            'root': archived.get('root'),
+            'category': archived.get('category'),
+            'tech_stack': snapshot.get('tech_stack', {'primary_language': None, 'framework': None, 'categories': []}),
+            'maturity': snapshot.get('maturity', {'score': None, 'level': 'Unknown'}),
+            'git': snapshot.get('git', {'has_repo': False}),
+            'github': snapshot.get('github'),
+            'status': 'cold',
+            'cold_storage': {
+                'archive': archived['archive'],
+                'codec': archived['codec'],
+                'archive_bytes': archived['archive_bytes'],
+                'bytes': archived['bytes'],
+                'files': archived['files'],
+                'archived_at': archived['archived_at']
+            },
+            'last_updated': datetime.now().isoformat()
+        }
+        
+        registry['projects'].append(entry)
+    
+    # Record how each cloned project was fetched (full, blobless, shallow, sparse)
+    clones = data.get('clones', {})
+    for entry in registry['projects']:
+        clone = clones.get(entry['original_name']) or clones.get(entry['name'])
+        if clone:
+            entry['git']['clone_policy'] = clone['clone_policy']
+    
     return registry
 
 
@@ -222,6 +320,31 @@ This directory contains all projects organised using a structured system with au
         readme_content += f"- **{tech}:** {count} projects\n"
     
     readme_content += """
+### Sync Status
+
+"""
+    
+    # Add ahead/behind summary (as of the last fetch)
+    sync_labels = {
+        'up_to_date': 'Up to date', 'ahead': 'Ahead of upstream', 'behind': 'Behind upstream',
+        'diverged': 'Diverged', 'no_upstream': 'No upstream', 'upstream_gone': 'Upstream gone',
+        'detached': 'Detached HEAD'
+    }
+    sync_counts = {}
+    for proj in registry['projects']:
+        state = proj['git'].get('sync_state')
+        if state in sync_labels:
+            sync_counts[state] = sync_counts.get(state, 0) + 1
+    
+    for state, label in sync_labels.items():
+        if sync_counts.get(state):
+            readme_content += f"- **{label}:** {sync_counts[state]} projects\n"
+    
+    needs_attention = [p for p in registry['projects'] if p['git'].get('sync_state') in ('behind', 'diverged')]
+    for proj in needs_attention:
+        readme_content += f"  - `{proj['name']}`: ↑{proj['git']['ahead']} ↓{proj['git']['behind']}\n"
+    
+    readme_content += """
 
 ## 📁 Directory Structure
 
@@ -343,6 +466,23 @@ This document provides a comprehensive breakdown of all projects organised by te
 
 """
     
+    # Language census totals across all local projects
+    totals = {}
+    for proj in registry['projects']:
+        for lang, stats in proj.get('languages', {}).items():
+            total = totals.setdefault(lang, {'projects': 0, 'files': 0, 'lines': 0, 'bytes': 0})
+            total['projects'] += 1
+            for key in ('files', 'lines', 'bytes'):
+                total[key] += stats[key]
+    
+    if totals:
+        content += "## Language Census\n\n"
+        content += "| Language | Projects | Files | Lines | Size |\n"
+        content += "|----------|---------:|------:|------:|-----:|\n"
+        for lang, total in sorted(totals.items(), key=lambda x: x[1]['lines'], reverse=True):
+            content += f"| {lang} | {total['projects']} | {total['files']:,} | {total['lines']:,} | {total['bytes'] / 1024:,.0f} KB |\n"
+        content += "\n"
+    
     # Group projects by primary language
     by_language = {}
     for proj in registry['projects']:
@@ -378,6 +518,17 @@ This document provides a comprehensive breakdown of all projects organised by te
                 content += f"\n  - Path: `{proj['path']}`\n"
                 if proj['tech_stack'].get('categories'):
                     content += f"  - Categories: {', '.join(proj['tech_stack']['categories'])}\n"
+                if proj.get('languages'):
+                    total_lines = sum(s['lines'] for s in proj['languages'].values()) or 1
+                    breakdown = [f"{lang} {stats['lines'] * 100 / total_lines:.0f}%"
+                                 for lang, stats in proj['languages'].items()
+                                 if stats['lines'] * 100 / total_lines >= 1]
+                    content += f"  - Languages: {', '.join(breakdown[:6])} ({total_lines:,} lines)\n"
+                if proj.get('workspace'):
+                    content += f"  - Workspace ({proj['workspace']['tool']}): {len(proj['workspace']['packages'])} packages\n"
+                    for pkg in proj['workspace']['packages']:
+                        pkg_stack = ' / '.join(filter(None, [pkg['primary_language'], pkg['framework']])) or 'Unknown'
+                        content += f"    - `{pkg['path']}` ({pkg['name']}): {pkg_stack}\n"
                 content += "\n"
     
     return content
@@ -400,6 +551,7 @@ Projects are scored on a scale of 0-10 based on:
 - **Testing** (0-2 points): Test suite presence and coverage
 - **Configuration** (0-2 points): Build configs, linting, CI/CD
 - **Recent Activity** (0-1 point): Last commit date
+- **Commit Cadence** (0.5 bonus): 12+ commits in the last 90 days
 - **Completeness** (0-1 point): License, .gitignore, etc.
 - **Production Readiness** (0-1 point): Deployment configurations
 
@@ -412,6 +564,59 @@ Projects are scored on a scale of 0-10 based on:
 
 """
     
+    # Score trends from the metrics history store
+    trends = data.get('trends', {})
+    if trends:
+        from metrics_history import label, sparkline
+        content += "## Score Trends\n\n"
+        content += "| Project | Trend | First | Latest | Change | Runs |\n"
+        content += "|---------|-------|-------|--------|--------|------|\n"
+        for key, scores in sorted(trends.items(), key=lambda x: x[1][-1] - x[1][0]):
+            content += (f"| {label(key)} | {sparkline(scores)} | {scores[0]} | {scores[-1]} | "
+                        f"{scores[-1] - scores[0]:+.1f} | {len(scores)} |\n")
+        content += "\n"
+    
+    # Commit cadence and churn from git_history.py
+    active = [p for p in registry['projects'] if p['git'].get('activity')]
+    if active:
+        content += "## Activity\n\n"
+        content += "| Project | 30d | 90d | 365d | Active Authors | Most Churned File |\n"
+        content += "|---------|-----|-----|------|----------------|-------------------|\n"
+        for proj in sorted(active, key=lambda p: p['git']['activity']['commits_90d'], reverse=True):
+            activity = proj['git']['activity']
+            churned = f"`{activity['top_churn'][0]['path']}` ({activity['top_churn'][0]['lines']})" if activity['top_churn'] else '-'
+            content += (f"| {proj['name']} | {activity['commits_30d']} | {activity['commits_90d']} | "
+                        f"{activity['commits_365d']} | {activity['active_authors']} | {churned} |\n")
+        content += "\n"
+    
+    # Projects whose scan hit its walk budget; their scores use partial data
+    truncated = [p for p in registry['projects'] if p.get('truncated')]
+    if truncated:
+        content += "## Truncated Scans\n\n"
+        content += "These projects ran out of their per-project walk budget, so their results are partial. "
+        content += "Add the offending directories to the exclusions or raise the budget for their root.\n\n"
+        content += "| Project | Budget Hit | Files Visited | Seconds | Path |\n"
+        content += "|---------|------------|---------------|---------|------|\n"
+        for proj in sorted(truncated, key=lambda p: p['truncated']['files_visited'], reverse=True):
+            t = proj['truncated']
+            content += f"| {proj['name']} | {t['reason']} | {t['files_visited']:,} | {t['seconds']} | `{proj['path']}` |\n"
+        content += "\n"
+    
+    # Projects packed away by cold_storage.py; no longer scanned
+    cold = [p for p in registry['projects'] if p['status'] == 'cold']
+    if cold:
+        from disk_usage import format_bytes
+        content += "## Cold Storage\n\n"
+        content += "These projects are archived in `.cold_storage/` and skipped by every scan. "
+        content += "Restore one with `scripts/cold_storage.py restore <project>`.\n\n"
+        content += "| Project | Archived | Files | Size | Archive |\n"
+        content += "|---------|----------|-------|------|---------|\n"
+        for proj in sorted(cold, key=lambda p: p['name']):
+            c = proj['cold_storage']
+            content += (f"| {proj['name']} | {c['archived_at'][:10]} | {c['files']:,} | {format_bytes(c['bytes'])} | "
+                        f"`{c['archive']}` ({format_bytes(c['archive_bytes'])}) |\n")
+        content += "\n"
+    
     # Group projects by maturity level
     by_maturity = {'Mature': [], 'Developing': [], 'Experimental': [], 'Archived': [], 'Unknown': []}
     for proj in registry['projects']:
@@ -452,6 +657,39 @@ Projects are scored on a scale of 0-10 based on:
     return content
 
 
+def generate_disk_usage_doc(data: Dict, registry: Dict):
+    """Generate DISK_USAGE.md"""
+    from disk_usage import RECLAIMABLE, format_bytes
+    
+    projects = [p for p in registry['projects'] if p.get('disk_usage')]
+    projects.sort(key=lambda p: p['disk_usage']['reclaimable_bytes'], reverse=True)
+    total = sum(p['disk_usage']['bytes'] for p in projects)
+    reclaimable = sum(p['disk_usage']['reclaimable_bytes'] for p in projects)
+    
+    content = f"""# Disk Usage
+
+**Last Updated:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+
+Local projects use **{format_bytes(total)}**, of which **{format_bytes(reclaimable)}** is
+reclaimable ({', '.join(RECLAIMABLE).replace('_', ' ')}: deleted and regenerated by a reinstall or rebuild).
+Sizes are allocated blocks, with hard-linked files counted once per project.
+
+| Project | Reclaimable | Total | Files | node_modules | virtualenv | build output | .git | source |
+|---------|-------------|-------|-------|--------------|------------|--------------|------|--------|
+"""
+    
+    for proj in projects:
+        usage = proj['disk_usage']
+        categories = usage['categories']
+        content += (f"| {proj['name']} | {format_bytes(usage['reclaimable_bytes'])} | {format_bytes(usage['bytes'])} | "
+                    f"{usage['files']:,} | " +
+                    ' | '.join(format_bytes(categories[c]['bytes']) if categories[c]['bytes'] else '-'
+                               for c in ('node_modules', 'virtualenv', 'build_output', 'git', 'source')) +
+                    " |\n")
+    
+    return content
+
+
 def main():
     print("=" * 70)
     print("GENERATING DOCUMENTATION")
@@ -465,8 +703,7 @@ def main():
     
     # Save registry
     registry_file = PROJECTS_DIR / '.project-registry.json'
-    with open(registry_file, 'w', encoding='utf-8') as f:
-        json.dump(registry, f, indent=2, ensure_ascii=False)
+    json_io.dump(registry, registry_file, pretty=True)
     print(f"✅ Saved: {registry_file}")
     
     # Generate README (keep in root for GitHub)
@@ -493,6 +730,14 @@ def main():
         f.write(maturity_content)
     print(f"✅ Saved: {maturity_file}")
     
+    # Generate DISK_USAGE.md
+    print("📄 Generating DISK_USAGE.md...")
+    disk_content = generate_disk_usage_doc(data, registry)
+    disk_file = DOCS_DIR / 'DISK_USAGE.md'
+    with open(disk_file, 'w', encoding='utf-8') as f:
+        f.write(disk_content)
+    print(f"✅ Saved: {disk_file}")
+    
     print("\n" + "=" * 70)
     print("DOCUMENTATION SUMMARY")
     print("=" * 70)
@@ -500,6 +745,7 @@ def main():
     print(f"✅ Created README.md")
     print(f"✅ Created TECH_STACKS.md")
     print(f"✅ Created MATURITY_REPORT.md")
+    print(f"✅ Created DISK_USAGE.md")
     print(f"✅ Created .project-registry.json")
     print("\n" + "=" * 70)
 
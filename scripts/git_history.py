@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Git history analytics - commit cadence, active authors and file churn
+
+`git log --numstat` is streamed line by line from a subprocess, so memory
+stays bounded by the aggregates (commits per day, per-author and per-file
+counters) rather than the size of the log. The aggregates are persisted with
+the last processed commit, so later runs only ingest `last_seen..HEAD`.
+
+Partial (blobless) clones are logged without --numstat: diff stats would
+make git fetch every historical blob from the promisor remote one at a time,
+so those repos report cadence and authors but no churn. Each log is killed
+after LOG_TIMEOUT seconds.
+"""
+import subprocess
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import json_io
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+CACHE_FILE = ANALYSIS_DIR / 'git_history_cache.json'
+
+HISTORY_WORKERS = 8
+LOG_TIMEOUT = 300
+WINDOWS = (30, 90, 365)
+ACTIVE_AUTHOR_DAYS = 90
+TOP_CHURN = 10
+
+# NUL-prefixed header per commit, followed by its numstat lines
+LOG_FORMAT = '%x00%H%x09%at%x09%ae'
+
+
+def new_state() -> Dict[str, Any]:
+    """Empty aggregate state for one repository"""
+    return {
+        'head': None,
+        'commits': 0,
+        'days': {},      # 'YYYY-MM-DD' -> commits
+        'authors': {},   # email -> [commits, last commit timestamp]
+        'churn': {}      # path -> lines added + deleted
+    }
+
+
+def is_partial_clone(project_path: Path) -> bool:
+    """True for blobless/treeless clones, whose missing objects git fetches on demand"""
+    result = subprocess.run(
+        ['git', '-C', str(project_path), 'config', '--get-regexp',
+         r'^(extensions\.partialclone|remote\..*\.promisor)$'],
+        capture_output=True, text=True, timeout=5
+    )
+    return result.returncode == 0 and bool(result.stdout.strip())
+
+
+def ingest_log(project_path: Path, state: Dict[str, Any], revision: str = 'HEAD',
+               numstat: bool = True, timeout: float = LOG_TIMEOUT) -> Dict[str, Any]:
+    """Stream `git log --numstat <revision>` into the aggregate state.
+    
+    Raises subprocess.TimeoutExpired when the log takes longer than timeout.
+    """
+    process = subprocess.Popen(
+        ['git', '-C', str(project_path), 'log', '--no-renames']
+        + (['--numstat'] if numstat else []) + [f'--format={LOG_FORMAT}', revision],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, encoding='utf-8', errors='replace'
+    )
+    # Reading blocks, so the deadline is enforced by killing the process
+    expired = threading.Event()
+    
+    def expire():
+        expired.set()
+        process.kill()
+    
+    timer = threading.Timer(timeout, expire)
+    timer.start()
+    
+    days = Counter(state['days'])
+    churn = Counter(state['churn'])
+    authors = state['authors']
+    
+    try:
+        for line in process.stdout:
+            if line.startswith('\0'):
+                _, timestamp, email = line[1:].rstrip('\n').split('\t', 2)
+                timestamp = int(timestamp)
+                days[datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d')] += 1
+                commits, last = authors.get(email, (0, 0))
+                authors[email] = [commits + 1, max(last, timestamp)]
+                state['commits'] += 1
+            elif line.strip():
+                added, deleted, path = line.rstrip('\n').split('\t', 2)
+                if added != '-':  # binary files have no line counts
+                    churn[path] += int(added) + int(deleted)
+    finally:
+        timer.cancel()
+        if process.poll() is None:
+            process.kill()
+        returncode = process.wait()
+        process.stdout.close()
+    
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(process.args, timeout)
+    if returncode != 0:
+        raise RuntimeError(f"git log failed for {project_path}")
+    
+    state['days'] = dict(days)
+    state['churn'] = dict(churn)
+    return state
+
+
+def get_head(project_path: Path) -> Optional[str]:
+    result = subprocess.run(
+        ['git', '-C', str(project_path), 'rev-parse', '--verify', '-q', 'HEAD'],
+        capture_output=True, text=True, timeout=5
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def is_ancestor(project_path: Path, old: str, new: str) -> bool:
+    """True if `old` is still in the history of `new` (i.e. nothing was rewritten)"""
+    result = subprocess.run(
+        ['git', '-C', str(project_path), 'merge-base', '--is-ancestor', old, new],
+        capture_output=True, timeout=30
+    )
+    return result.returncode == 0
+
+
+def load_cache(cache_file: Path = CACHE_FILE) -> Dict[str, Dict[str, Any]]:
+    """Load persisted aggregate state keyed by repository path"""
+    if not cache_file.exists():
+        return {}
+    try:
+        return json_io.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: Dict[str, Dict[str, Any]], cache_file: Path = CACHE_FILE):
+    json_io.dump(cache, cache_file)
+
+
+def summarize(state: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Reduce the aggregate state to windowed cadence, authors and churn"""
+    now = now or datetime.now(timezone.utc)
+    summary = {'head': state['head'], 'total_commits': state['commits']}
+    
+    for window in WINDOWS:
+        since = (now - timedelta(days=window)).strftime('%Y-%m-%d')
+        summary[f'commits_{window}d'] = sum(n for day, n in state['days'].items() if day > since)
+    
+    active_since = (now - timedelta(days=ACTIVE_AUTHOR_DAYS)).timestamp()
+    summary['authors'] = len(state['authors'])
+    summary['active_authors'] = sum(1 for _, last in state['authors'].values() if last >= active_since)
+    summary['top_churn'] = [{'path': path, 'lines': lines}
+                            for path, lines in Counter(state['churn']).most_common(TOP_CHURN)]
+    summary['churn_tracked'] = state.get('churn_tracked', True)
+    
+    return summary
+
+
+def refresh_state(project_path: Path, cached: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Bring a repository's aggregate state up to HEAD.
+    
+    Only `last_seen..HEAD` is ingested when the cached commit is still an
+    ancestor of HEAD; a rewritten history (rebase, force-push) falls back to
+    a full rebuild. Returns (state, mode) with mode 'cached', 'incremental'
+    or 'full'; state is None with mode 'empty' (no commits) or 'error'
+    (git failed or timed out), and the caller keeps its cache on 'error'.
+    """
+    try:
+        head = get_head(project_path)
+    except subprocess.TimeoutExpired:
+        return None, 'error'
+    if not head:
+        return None, 'empty'
+    
+    if cached and cached.get('head') == head:
+        return cached, 'cached'
+    
+    try:
+        numstat = not is_partial_clone(project_path)
+        if cached and cached.get('head') and is_ancestor(project_path, cached['head'], head):
+            state = ingest_log(project_path, cached, f"{cached['head']}..{head}", numstat)
+            mode = 'incremental'
+        else:
+            state = ingest_log(project_path, new_state(), head, numstat)
+            mode = 'full'
+    except (RuntimeError, ValueError, subprocess.TimeoutExpired):
+        return None, 'error'
+    
+    state['head'] = head
+    state['churn_tracked'] = numstat
+    return state, mode
+
+
+def analyze_history(project_path: Path, cached: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """History summary for one repository, or None if it has no commits"""
+    state, mode = refresh_state(project_path, cached)
+    if not state:
+        return None
+    
+    summary = summarize(state)
+    summary['refresh'] = mode
+    return summary
+
+
+def collect_history(project_paths: List[Path], max_workers: int = HISTORY_WORKERS,
+                    cache_file: Path = CACHE_FILE) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Analyse many repositories concurrently, keyed by path, reusing the persisted state"""
+    cache = load_cache(cache_file)
+    
+    def refresh(path):
+        # Work on a copy so a failed ingest never leaves half-updated counters cached
+        cached = cache.get(str(path))
+        return refresh_state(path, json_io.loads(json_io.dumps(cached)) if cached else None)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(zip(map(str, project_paths), executor.map(refresh, project_paths)))
+    
+    summaries = {}
+    for path, (state, mode) in results.items():
+        if state:
+            cache[path] = state
+            summaries[path] = {**summarize(state), 'refresh': mode}
+        else:
+            # A timeout or git failure keeps the cached counters for the next
+            # run; only a repository with no history drops its entry
+            if mode == 'empty':
+                cache.pop(path, None)
+            summaries[path] = None
+    
+    save_cache(cache, cache_file)
+    return summaries
+
+
+def main():
+    paths = [Path(p).resolve() for p in sys.argv[1:]] or [Path.cwd()]
+    for path, summary in collect_history(paths).items():
+        print(f"\n📜 {path}")
+        if not summary:
+            print("  (no history)")
+            continue
+        print(f"  Commits: {summary['commits_30d']} (30d) / {summary['commits_90d']} (90d) / "
+              f"{summary['commits_365d']} (365d) / {summary['total_commits']} total")
+        print(f"  Authors: {summary['active_authors']} active of {summary['authors']}")
+        print(f"  Refresh: {summary['refresh']}")
+        for item in summary['top_churn'][:5]:
+            print(f"  {item['lines']:>8}  {item['path']}")
+
+
+if __name__ == '__main__':
+    main()
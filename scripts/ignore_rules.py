@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+.gitignore / .projectignore matching for project tree walks
+
+Usage:
+    ignore_rules.py <project> [path ...]   # show which paths the rules ignore
+
+Rules follow gitignore semantics: a pattern without a slash matches a name at
+any depth below its ignore file, a pattern containing a slash is anchored to
+the directory holding the file, a trailing slash matches directories only,
+`**` spans directories, and `!` re-includes. .git/info/exclude applies to the
+whole project, and .projectignore (same syntax) adds project-specific rules
+that should not live in the repo's own .gitignore.
+
+Each pattern is translated once into a regex over the path relative to the
+project root. A directory that adds ignore files compiles the rules in effect
+into one matcher; directories without ignore files reuse their parent's.
+"""
+import re
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+IGNORE_FILES = ('.gitignore', '.projectignore')
+
+# (regex over the project-relative path, negated, directories only)
+Rule = Tuple[str, bool, bool]
+
+
+def translate(pattern: str) -> str:
+    """Translate a gitignore glob (without anchoring) into a regex body"""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            at_segment_start = i == 0 or pattern[i - 1] == '/'
+            if pattern.startswith('**', i) and at_segment_start:
+                if i + 2 == n:          # trailing '**': everything inside
+                    out.append('.*')
+                    i += 2
+                    continue
+                if pattern[i + 2] == '/':  # '**/': zero or more directories
+                    out.append('(?:.*/)?')
+                    i += 3
+                    continue
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                out.append('\\[')
+            else:
+                chars = pattern[i + 1:end].replace('\\', '\\\\')
+                if chars.startswith('!'):
+                    chars = '^' + chars[1:]
+                out.append(f'[{chars}]')
+                i = end + 1
+                continue
+        elif c == '\\' and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+def parse_rules(lines: Iterable[str], base: str = '') -> List[Rule]:
+    """Rules from ignore-file lines; base is the file's directory relative to the project root"""
+    prefix = re.escape(base + '/') if base else ''
+    rules = []
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if not line or line.startswith('#'):
+            continue
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        # Trailing spaces are ignored unless escaped
+        stripped = line.rstrip(' ')
+        if stripped.endswith('\\') and len(stripped) < len(line):
+            stripped += ' '
+        line = stripped
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+        anchored = '/' in line
+        body = translate(line.lstrip('/'))
+        rules.append((prefix + body if anchored else prefix + '(?:.*/)?' + body, negated, dir_only))
+    return rules
+
+
+def read_rules(path: Path, base: str = '') -> List[Rule]:
+    try:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            return parse_rules(f, base)
+    except OSError:
+        return []
+
+
+class IgnoreMatcher:
+    """The ignore rules in effect for one directory, compiled for matching"""
+    __slots__ = ('rules', '_ordered', '_any', '_files')
+    
+    def __init__(self, rules: Optional[List[Rule]] = None):
+        self.rules = rules or []
+        self._ordered = None
+        self._any = self._files = None
+        if any(negated for _, negated, _ in self.rules):
+            # Re-includes need gitignore's last-match-wins order
+            self._ordered = [(re.compile(regex), negated, dir_only)
+                             for regex, negated, dir_only in reversed(self.rules)]
+        elif self.rules:
+            # Without re-includes, one alternation per entry kind decides
+            self._any = re.compile('|'.join(f'(?:{regex})' for regex, _, _ in self.rules))
+            file_rules = [regex for regex, _, dir_only in self.rules if not dir_only]
+            self._files = re.compile('|'.join(f'(?:{regex})' for regex in file_rules)) if file_rules else None
+    
+    def extend(self, rules: List[Rule]) -> 'IgnoreMatcher':
+        """Matcher for a subdirectory that adds rules (deeper rules take precedence)"""
+        return IgnoreMatcher(self.rules + rules) if rules else self
+    
+    def ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Whether a project-relative posix path is ignored"""
+        if self._ordered is not None:
+            for regex, negated, dir_only in self._ordered:
+                if (is_dir or not dir_only) and regex.fullmatch(rel_path):
+                    return not negated
+            return False
+        regex = self._any if is_dir else self._files
+        return regex is not None and regex.fullmatch(rel_path) is not None
+
+
+def project_matcher(project_root: Path) -> IgnoreMatcher:
+    """Project-wide rules (.git/info/exclude); per-directory files are added during the walk"""
+    return IgnoreMatcher(read_rules(Path(project_root) / '.git' / 'info' / 'exclude'))
+
+
+def directory_rules(dirpath: str, rel: str, names: Iterable[str]) -> List[Rule]:
+    """Rules from the ignore files present among a directory's file names"""
+    rules = []
+    for filename in IGNORE_FILES:
+        if filename in names:
+            rules.extend(read_rules(Path(dirpath) / filename, rel))
+    return rules
+
+
+def path_ignored(project_root: Path, rel: str) -> bool:
+    """Whether a project-relative path is ignored, directly or through a parent directory"""
+    matcher = project_matcher(project_root)
+    parts = rel.split('/')
+    for depth in range(len(parts)):
+        base = '/'.join(parts[:depth])
+        matcher = matcher.extend(directory_rules(str(project_root / base), base, IGNORE_FILES))
+        path = '/'.join(parts[:depth + 1])
+        is_dir = depth < len(parts) - 1 or (project_root / path).is_dir()
+        if matcher.ignored(path, is_dir):
+            return True
+    return False
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("❌ Usage: ignore_rules.py <project> [path ...]")
+        sys.exit(1)
+    
+    from tree_walk import walk_project
+    project = Path(sys.argv[1]).resolve()
+    
+    if len(sys.argv) > 2:
+        for arg in sys.argv[2:]:
+            rel = Path(arg).as_posix().strip('/')
+            print(f"  {'ignored' if path_ignored(project, rel) else 'kept':<8} {rel}")
+        return
+    
+    kept = sum(len(files) for _, _, files in walk_project(project))
+    total = sum(len(files) for _, _, files in walk_project(project, ignore=False))
+    print(f"📁 {project}: {kept:,} of {total:,} files kept ({total - kept:,} ignored)")
+
+
+if __name__ == '__main__':
+    main()
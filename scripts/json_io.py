@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+JSON I/O for analysis artefacts and the registry
+
+Usage:
+    json_io.py bench [file.json ...]   # compare load/dump speed of available backends
+
+Uses orjson or msgspec when installed and falls back to the standard library.
+Output is compact by default (pretty=True for files people read), and every
+write goes to a temporary file in the same directory that is then renamed
+over the target, so readers never see a half-written artefact.
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+BACKENDS = ['orjson', 'msgspec', 'json']
+AVAILABLE = [name for name, module in zip(BACKENDS, (orjson, msgspec, json)) if module is not None]
+BACKEND = os.environ.get('PROJECTS_JSON_BACKEND') or AVAILABLE[0]
+
+
+def loads(data: bytes, backend: Optional[str] = None) -> Any:
+    backend = backend or BACKEND
+    if backend == 'orjson':
+        return orjson.loads(data)
+    if backend == 'msgspec':
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:  # match json/orjson, which raise ValueError
+            raise ValueError(str(e)) from e
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False, default: Optional[Callable] = None,
+          backend: Optional[str] = None) -> bytes:
+    backend = backend or BACKEND
+    if backend == 'orjson':
+        # Dataclasses go through `default` so records control their own encoding
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    if backend == 'msgspec':
+        data = msgspec.json.encode(obj, enc_hook=default)
+        return msgspec.json.format(data, indent=2) if pretty else data
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=default).encode('utf-8')
+
+
+def load(path: Path, backend: Optional[str] = None) -> Any:
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        return loads(f.read(), backend)
+
+
+def dump(obj: Any, path: Path, pretty: bool = False, default: Optional[Callable] = None,
+         backend: Optional[str] = None):
+    """Atomically write obj as JSON: temp file in the same directory, then rename"""
+    import tempfile
+    
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = dumps(obj, pretty, default, backend)
+    if pretty:
+        data += b'\n'
+    
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates files private to the owner
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def bench(paths: List[Path], rounds: int = 5) -> List[Dict[str, Any]]:
+    """Time load and compact/pretty dump for each available backend"""
+    results = []
+    for path in paths:
+        raw = Path(path).read_bytes()
+        obj = json.loads(raw)
+        for backend in AVAILABLE:
+            timings = {}
+            for label, fn in (('load', lambda: loads(raw, backend)),
+                              ('dump', lambda: dumps(obj, False, None, backend)),
+                              ('dump_pretty', lambda: dumps(obj, True, None, backend))):
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    fn()
+                timings[label] = (time.perf_counter() - start) / rounds * 1000
+            results.append({'file': str(path), 'bytes': len(raw), 'backend': backend, **timings})
+    return results
+
+
+def main():
+    action = sys.argv[1] if len(sys.argv) > 1 else 'bench'
+    if action != 'bench':
+        print("❌ Usage: json_io.py bench [file.json ...]")
+        sys.exit(1)
+    
+    paths = [Path(p) for p in sys.argv[2:]]
+    if not paths:
+        from analyze_projects import PROJECTS_DIR
+        paths = [p for p in (PROJECTS_DIR / 'project_comparison.json', PROJECTS_DIR / '.project-registry.json')
+                 if p.exists()]
+    
+    print(f"Backends available: {', '.join(AVAILABLE)} (using {BACKEND})\n")
+    print(f"  {'FILE':<30} {'BACKEND':<8} {'LOAD ms':>9} {'DUMP ms':>9} {'PRETTY ms':>10}")
+    for row in bench(paths):
+        print(f"  {Path(row['file']).name:<30} {row['backend']:<8} {row['load']:>9.2f} "
+              f"{row['dump']:>9.2f} {row['dump_pretty']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Language census - files, bytes and lines per language for each project
+
+Lines are counted as newlines over memory-mapped buffers, binaries are skipped
+by sniffing the first block, and per-file results are cached by
+(size, mtime, inode) so unchanged files are never re-read.
+"""
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import json_io
+from tree_walk import WalkBudget, walk_project
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+CACHE_FILE = ANALYSIS_DIR / 'language_census_cache.json'
+
+CENSUS_WORKERS = 8
+SNIFF_BYTES = 8192
+MMAP_THRESHOLD = 1024 * 1024
+MMAP_WINDOW = 16 * 1024 * 1024
+
+EXTENSION_LANGUAGES = {
+    '.py': 'Python', '.pyi': 'Python', '.ipynb': 'Jupyter Notebook',
+    '.ts': 'TypeScript', '.tsx': 'TypeScript', '.mts': 'TypeScript', '.cts': 'TypeScript',
+    '.js': 'JavaScript', '.jsx': 'JavaScript', '.mjs': 'JavaScript', '.cjs': 'JavaScript',
+    '.astro': 'Astro', '.vue': 'Vue', '.svelte': 'Svelte',
+    '.html': 'HTML', '.htm': 'HTML', '.css': 'CSS', '.scss': 'SCSS', '.sass': 'SCSS', '.less': 'Less',
+    '.md': 'Markdown', '.mdx': 'MDX',
+    '.json': 'JSON', '.yml': 'YAML', '.yaml': 'YAML', '.toml': 'TOML', '.xml': 'XML',
+    '.rs': 'Rust', '.go': 'Go', '.java': 'Java', '.kt': 'Kotlin', '.kts': 'Kotlin',
+    '.rb': 'Ruby', '.php': 'PHP', '.cs': 'C#', '.swift': 'Swift',
+    '.c': 'C', '.h': 'C', '.cpp': 'C++', '.cc': 'C++', '.hpp': 'C++',
+    '.sh': 'Shell', '.bash': 'Shell', '.zsh': 'Shell', '.ps1': 'PowerShell',
+    '.sql': 'SQL', '.r': 'R', '.R': 'R', '.prisma': 'Prisma', '.graphql': 'GraphQL',
+}
+
+FILENAME_LANGUAGES = {
+    'Dockerfile': 'Dockerfile', 'Makefile': 'Makefile', 'Jenkinsfile': 'Groovy',
+}
+
+# Data formats are counted but don't say much about what a project is written in
+NON_PROGRAMMING = {'JSON', 'YAML', 'TOML', 'XML', 'Markdown', 'MDX'}
+
+
+def detect_language(filename: str) -> Optional[str]:
+    """Map a filename to a language, or None if it isn't tracked"""
+    if filename in FILENAME_LANGUAGES:
+        return FILENAME_LANGUAGES[filename]
+    return EXTENSION_LANGUAGES.get(os.path.splitext(filename)[1])
+
+
+def count_lines(path: str, size: int) -> Optional[int]:
+    """Count lines in a text file; returns None for binaries"""
+    if size == 0:
+        return 0
+    
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+        if b'\0' in head:
+            return None
+        
+        if size <= MMAP_THRESHOLD:
+            data = head + f.read()
+            newlines = data.count(b'\n')
+            last = data[-1:]
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                newlines = sum(mm[i:i + MMAP_WINDOW].count(b'\n') for i in range(0, len(mm), MMAP_WINDOW))
+                last = mm[-1:]
+    
+    # A final line without a trailing newline still counts
+    return newlines + (0 if last == b'\n' else 1)
+
+
+def load_cache(cache_file: Path = CACHE_FILE) -> Dict[str, List[Any]]:
+    """Load per-file results keyed by path: [size, mtime_ns, inode, lines]"""
+    if not cache_file.exists():
+        return {}
+    try:
+        return json_io.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: Dict[str, List[Any]], cache_file: Path = CACHE_FILE):
+    json_io.dump(cache, cache_file)
+
+
+def census_project(project_path: Path, cache: Dict[str, List[Any]], seen: Optional[set] = None,
+                   max_workers: int = CENSUS_WORKERS, budget: Optional[WalkBudget] = None) -> Dict[str, Dict[str, int]]:
+    """Count files, bytes and lines per language over the pruned project tree"""
+    seen = seen if seen is not None else set()
+    pending: List[Tuple[str, str, int, List[Any]]] = []
+    results: List[Tuple[str, int, Optional[int]]] = []
+    
+    for _, _, files in walk_project(project_path, budget):
+        for entry in files:
+            language = detect_language(entry.name)
+            if not language:
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            seen.add(entry.path)
+            signature = [st.st_size, st.st_mtime_ns, st.st_ino]
+            cached = cache.get(entry.path)
+            if cached and cached[:3] == signature:
+                results.append((language, st.st_size, cached[3]))
+            else:
+                pending.append((entry.path, language, st.st_size, signature))
+    
+    def measure(item):
+        path, language, size, signature = item
+        try:
+            lines = count_lines(path, size)
+        except (OSError, ValueError):
+            return None
+        cache[path] = signature + [lines]
+        return language, size, lines
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results.extend(r for r in executor.map(measure, pending) if r)
+    
+    languages: Dict[str, Dict[str, int]] = {}
+    for language, size, lines in results:
+        if lines is None:  # binary
+            continue
+        stats = languages.setdefault(language, {'files': 0, 'bytes': 0, 'lines': 0})
+        stats['files'] += 1
+        stats['bytes'] += size
+        stats['lines'] += lines
+    
+    return dict(sorted(languages.items(), key=lambda x: x[1]['bytes'], reverse=True))
+
+
+def dominant_language(languages: Dict[str, Dict[str, int]]) -> Optional[str]:
+    """Programming language with the most bytes, ignoring data/doc formats"""
+    for language in languages:
+        if language not in NON_PROGRAMMING:
+            return language
+    return None
+
+
+def census_projects(project_paths: List[Path], max_workers: int = CENSUS_WORKERS,
+                    cache_file: Path = CACHE_FILE,
+                    budgets: Optional[Dict[str, WalkBudget]] = None) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Run the census for several projects with a shared, persisted cache"""
+    budgets = budgets or {}
+    cache = load_cache(cache_file)
+    seen = set()
+    results = {str(path): census_project(path, cache, seen, max_workers, budgets.get(str(path)))
+               for path in project_paths}
+    
+    # Drop entries for files that have gone from the scanned projects
+    # (a truncated walk did not see every file, so its entries are kept)
+    prefixes = tuple(str(path) + os.sep for path in project_paths
+                     if not (str(path) in budgets and budgets[str(path)].truncated))
+    for path in [p for p in cache if p.startswith(prefixes) and p not in seen]:
+        del cache[path]
+    
+    save_cache(cache, cache_file)
+    return results
+
+
+def main():
+    paths = [Path(p).resolve() for p in sys.argv[1:]] or [Path.cwd()]
+    for path, languages in census_projects(paths).items():
+        print(f"\n📊 {path}")
+        print(f"  {'LANGUAGE':<20} {'FILES':>8} {'LINES':>12} {'BYTES':>14}")
+        for language, stats in languages.items():
+            print(f"  {language:<20} {stats['files']:>8} {stats['lines']:>12} {stats['bytes']:>14}")
+
+
+if __name__ == '__main__':
+    main()
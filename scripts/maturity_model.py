@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Maturity scoring model - turns persisted feature vectors into scores and levels
+
+Usage:
+    maturity_model.py rescore [weights.json]   # re-score project_comparison.json without rescanning
+
+Feature extraction (filesystem/git probing) lives in analyze_projects.py and
+produces one feature vector per project. Scoring is a matrix operation over
+all vectors, so changing a weight or threshold only needs a re-score.
+"""
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import json_io
+
+try:
+    import numpy as np
+except ImportError:  # scoring falls back to plain Python
+    np = None
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+COMPARISON_FILE = PROJECTS_DIR / 'project_comparison.json'
+MODEL_FILE = PROJECTS_DIR / 'maturity_model.json'
+
+# Order of the persisted feature vector
+FEATURES = [
+    'readme_bytes',          # size of README.md (0 if missing)
+    'has_docs',              # docs/*.md present
+    'has_test_indicator',    # test config/dirs/spec files present
+    'test_files',            # *.test.* + *.spec.* files
+    'config_count',          # build/lint/framework config files
+    'has_ci',                # CI pipeline definitions
+    'last_commit_ts',        # last commit as a unix timestamp (None if unknown)
+    'commits_90d',           # commits in the last 90 days (git_history.py)
+    'completeness_count',    # LICENSE, .gitignore, .env.example, CHANGELOG, CONTRIBUTING
+    'has_prod_indicators',   # docker-compose, infra/, k8s/, terraform/, .env.production
+    'stars',                 # GitHub stargazers
+    'open_issues',           # open GitHub issues (0 when issues are disabled)
+]
+
+# Derived at scoring time so persisted vectors never go stale
+DERIVED_FEATURES = ['days_since_commit']
+
+# Each criterion awards the points of its first matching tier.
+# A tier matches when all of its [feature, op, value] conditions hold.
+DEFAULT_MODEL = {
+    'max_score': 10,
+    'levels': [[8, 'Mature'], [5, 'Developing'], [2, 'Experimental'], [0, 'Archived']],
+    'criteria': {
+        'documentation': [
+            {'when': [['readme_bytes', '>', 2000]], 'points': 2, 'detail': 'Has comprehensive README (2 pts)'},
+            {'when': [['readme_bytes', '>', 500]], 'points': 1, 'detail': 'Has basic README (1 pt)'},
+        ],
+        'docs': [
+            {'when': [['has_docs', '>', 0]], 'points': 0.5, 'detail': 'Has additional documentation (0.5 pts)'},
+        ],
+        'testing': [
+            {'when': [['has_test_indicator', '>', 0], ['test_files', '>', 10]], 'points': 2,
+             'detail': 'Has comprehensive test suite (2 pts)'},
+            {'when': [['has_test_indicator', '>', 0], ['test_files', '>', 0]], 'points': 1,
+             'detail': 'Has tests (1 pt)'},
+        ],
+        'configuration': [
+            {'when': [['config_count', '>=', 5]], 'points': 2, 'detail': 'Well-configured build setup (2 pts)'},
+            {'when': [['config_count', '>=', 3]], 'points': 1, 'detail': 'Basic build configuration (1 pt)'},
+        ],
+        'ci': [
+            {'when': [['has_ci', '>', 0]], 'points': 1, 'detail': 'Has CI/CD setup (1 pt)'},
+        ],
+        'activity': [
+            {'when': [['days_since_commit', '<', 30]], 'points': 1, 'detail': 'Recently active (< 30 days) (1 pt)'},
+            {'when': [['days_since_commit', '<', 90]], 'points': 0.5, 'detail': 'Moderately active (< 90 days) (0.5 pts)'},
+        ],
+        'cadence': [
+            {'when': [['commits_90d', '>=', 12]], 'points': 0.5, 'detail': 'Steady commit cadence (0.5 bonus)'},
+        ],
+        'completeness': [
+            {'when': [['completeness_count', '>=', 3]], 'points': 1, 'detail': 'Project completeness indicators (1 pt)'},
+            {'when': [['completeness_count', '>=', 1]], 'points': 0.5, 'detail': 'Some completeness indicators (0.5 pts)'},
+        ],
+        'production': [
+            {'when': [['has_prod_indicators', '>', 0]], 'points': 1, 'detail': 'Production deployment setup (1 pt)'},
+        ],
+        'stars': [
+            {'when': [['stars', '>', 0]], 'points': 0.5, 'detail': 'Has GitHub stars (0.5 bonus)'},
+        ],
+        'issues': [
+            {'when': [['open_issues', '>', 0]], 'points': 0, 'detail': 'Active issues: {open_issues}'},
+        ],
+    }
+}
+
+OPERATORS = {
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '==': lambda a, b: a == b,
+}
+
+
+def load_model(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load the scoring model, merging overrides from maturity_model.json if present"""
+    model = json.loads(json.dumps(DEFAULT_MODEL))
+    path = path or MODEL_FILE
+    if path.exists():
+        overrides = json_io.load(path)
+        model['criteria'].update(overrides.pop('criteria', {}))
+        model.update(overrides)
+    return model
+
+
+def feature_matrix(vectors: List[Dict[str, Any]], now: Optional[float] = None) -> List[List[float]]:
+    """Rows of FEATURES + DERIVED_FEATURES; missing values become +inf/0"""
+    now = now if now is not None else datetime.now(timezone.utc).timestamp()
+    rows = []
+    for vector in vectors:
+        row = [float(vector.get(name) or 0) for name in FEATURES]
+        last_commit = vector.get('last_commit_ts')
+        row.append((now - last_commit) / 86400 if last_commit else float('inf'))
+        rows.append(row)
+    return rows
+
+
+def _tier_masks(matrix, model: Dict[str, Any]):
+    """Yield (criterion, tiers, mask per tier) over all projects at once"""
+    columns = {name: i for i, name in enumerate(FEATURES + DERIVED_FEATURES)}
+    for criterion, tiers in model['criteria'].items():
+        masks = []
+        for tier in tiers:
+            if np is not None:
+                mask = np.ones(len(matrix), dtype=bool)
+                for feature, op, value in tier['when']:
+                    mask &= OPERATORS[op](matrix[:, columns[feature]], value)
+            else:
+                mask = [all(OPERATORS[op](row[columns[f]], value) for f, op, value in tier['when'])
+                        for row in matrix]
+            masks.append(mask)
+        yield criterion, tiers, masks
+
+
+def score_vectors(vectors: List[Dict[str, Any]], model: Optional[Dict[str, Any]] = None,
+                  now: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Score many feature vectors in one pass; returns assess_maturity-shaped dicts"""
+    model = model or load_model()
+    rows = feature_matrix(vectors, now)
+    count = len(rows)
+    if count == 0:
+        return []
+    
+    matrix = np.array(rows, dtype=float) if np is not None else rows
+    raw = np.zeros(count) if np is not None else [0.0] * count
+    chosen = []  # (tiers, index of first matching tier per project)
+    
+    for criterion, tiers, masks in _tier_masks(matrix, model):
+        if np is not None:
+            # First matching tier wins: np.select evaluates conditions in order
+            raw = raw + np.select(masks, [t['points'] for t in tiers], default=0)
+            first = np.select(masks, list(range(len(tiers))), default=-1)
+        else:
+            first = [next((i for i, m in enumerate(masks) if m[row]), -1) for row in range(count)]
+            raw = [r + (tiers[f]['points'] if f >= 0 else 0) for r, f in zip(raw, first)]
+        chosen.append((tiers, first))
+    
+    max_score = model['max_score']
+    results = []
+    for row in range(count):
+        raw_score = float(raw[row])
+        normalized = (raw_score / max_score) * 10
+        level = next((name for threshold, name in model['levels'] if normalized >= threshold),
+                     model['levels'][-1][1])
+        details = []
+        for tiers, first in chosen:
+            index = int(first[row])
+            if index >= 0:
+                details.append(tiers[index]['detail'].format(**vectors[row]))
+        results.append({
+            'score': round(normalized, 1),
+            'level': level,
+            'details': details,
+            'raw_score': round(raw_score, 1),
+            'max_score': max_score
+        })
+    
+    return results
+
+
+def score_vector(vector: Dict[str, Any], model: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Score a single feature vector"""
+    return score_vectors([vector], model)[0]
+
+
+def rescore_comparison(comparison: Dict[str, Any], model: Optional[Dict[str, Any]] = None) -> int:
+    """Re-score every analysed project in place from its persisted features"""
+    projects = [p for p in comparison['analysis'] if p['maturity'].get('features')]
+    scores = score_vectors([p['maturity']['features'] for p in projects], model)
+    for proj, score in zip(projects, scores):
+        proj['maturity'] = {**score, 'features': proj['maturity']['features']}
+    return len(projects)
+
+
+def main():
+    action = sys.argv[1] if len(sys.argv) > 1 else 'rescore'
+    if action != 'rescore':
+        print("❌ Usage: maturity_model.py rescore [model.json]")
+        sys.exit(1)
+    
+    model = load_model(Path(sys.argv[2]) if len(sys.argv) > 2 else None)
+    comparison = json_io.load(COMPARISON_FILE)
+    
+    start = time.perf_counter()
+    count = rescore_comparison(comparison, model)
+    elapsed = (time.perf_counter() - start) * 1000
+    
+    json_io.dump(comparison, COMPARISON_FILE)
+    
+    print(f"✅ Re-scored {count} projects in {elapsed:.1f} ms ({'NumPy' if np is not None else 'pure Python'})")
+    print(f"✅ Saved: {COMPARISON_FILE}")
+
+
+if __name__ == '__main__':
+    main()
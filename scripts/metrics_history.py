@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Append-only history of per-run project metrics
+
+Usage:
+    metrics_history.py record             # append the current project_comparison.json as a run
+    metrics_history.py trend [project]    # score history (all projects, or one by name or path)
+
+Every analysis run adds one row to `runs` and one row per project to
+`project_metrics`; nothing is ever updated or deleted, so trend reports come
+straight from SQLite instead of old JSON snapshots.
+
+Projects are keyed by path, since the same name can appear in several
+categories or roots.
+"""
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import json_io
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+COMPARISON_FILE = PROJECTS_DIR / 'project_comparison.json'
+HISTORY_DB = ANALYSIS_DIR / 'metrics_history.sqlite'
+
+SPARK_CHARS = '▁▂▃▄▅▆▇█'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    recorded_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS projects (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS project_metrics (
+    project_id     INTEGER NOT NULL REFERENCES projects(id),
+    run_id         INTEGER NOT NULL REFERENCES runs(id),
+    score          REAL,
+    level          TEXT,
+    last_commit_ts REAL,
+    test_files     INTEGER,
+    size_bytes     INTEGER,
+    lines          INTEGER,
+    PRIMARY KEY (project_id, run_id)
+) WITHOUT ROWID;
+"""
+
+
+def connect(path: Optional[Path] = None) -> sqlite3.Connection:
+    """Open the history database, creating the schema on first use"""
+    path = path or HISTORY_DB
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def label(key: str) -> str:
+    """Display form of a project key: the path relative to the Projects directory"""
+    try:
+        return str(Path(key).relative_to(PROJECTS_DIR))
+    except ValueError:
+        return key
+
+
+def extract_metrics(proj: Dict[str, Any]) -> Dict[str, Any]:
+    """Pull the tracked metrics out of one analysed project"""
+    maturity = proj.get('maturity', {})
+    features = maturity.get('features', {})
+    languages = proj.get('languages') or {}
+    return {
+        'score': maturity.get('score'),
+        'level': maturity.get('level'),
+        'last_commit_ts': features.get('last_commit_ts'),
+        'test_files': features.get('test_files'),
+        'size_bytes': sum(s['bytes'] for s in languages.values()),
+        'lines': sum(s['lines'] for s in languages.values())
+    }
+
+
+def record_run(comparison: Dict[str, Any], conn: Optional[sqlite3.Connection] = None,
+               recorded_at: Optional[str] = None) -> int:
+    """Append one run with a metrics row per analysed project; returns the run id"""
+    conn = conn or connect()
+    with conn:
+        run_id = conn.execute('INSERT INTO runs (recorded_at) VALUES (?)',
+                              (recorded_at or datetime.now().isoformat(timespec='seconds'),)).lastrowid
+        rows = []
+        for proj in comparison['analysis']:
+            conn.execute('INSERT OR IGNORE INTO projects (name, path) VALUES (?, ?)', (proj['name'], proj['path']))
+            project_id = conn.execute('SELECT id FROM projects WHERE path = ?', (proj['path'],)).fetchone()[0]
+            m = extract_metrics(proj)
+            rows.append((project_id, run_id, m['score'], m['level'], m['last_commit_ts'],
+                         m['test_files'], m['size_bytes'], m['lines']))
+        conn.executemany('INSERT INTO project_metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+    return run_id
+
+
+def score_trends(conn: Optional[sqlite3.Connection] = None, last_runs: int = 12) -> Dict[str, List[float]]:
+    """Scores per project (keyed by path) over its most recent runs, oldest first"""
+    conn = conn or connect()
+    rows = conn.execute("""
+        SELECT key, score FROM (
+            SELECT p.path AS key, m.score, m.run_id,
+                   ROW_NUMBER() OVER (PARTITION BY m.project_id ORDER BY m.run_id DESC) AS recent
+            FROM project_metrics m JOIN projects p ON p.id = m.project_id
+        )
+        WHERE recent <= ? AND score IS NOT NULL
+        ORDER BY key, run_id
+    """, (last_runs,)).fetchall()
+    
+    trends: Dict[str, List[float]] = {}
+    for key, score in rows:
+        trends.setdefault(key, []).append(score)
+    return trends
+
+
+def project_history(project: str, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
+    """Every recorded run for a project path (or every project with that name), oldest first"""
+    conn = conn or connect()
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute("""
+        SELECT p.path AS key, r.recorded_at, m.score, m.level, m.last_commit_ts, m.test_files, m.size_bytes, m.lines
+        FROM project_metrics m
+        JOIN projects p ON p.id = m.project_id
+        JOIN runs r ON r.id = m.run_id
+        WHERE p.path = ? OR p.name = ?
+        ORDER BY key, m.run_id
+    """, (str(Path(project).expanduser().resolve()) if '/' in project else project, project)).fetchall()
+    return [dict(row) for row in rows]
+
+
+def sparkline(values: List[float], low: float = 0, high: float = 10) -> str:
+    """Render values on a fixed scale (maturity scores are 0-10)"""
+    span = (high - low) or 1
+    steps = len(SPARK_CHARS) - 1
+    return ''.join(SPARK_CHARS[round((min(max(v, low), high) - low) / span * steps)] for v in values)
+
+
+def main():
+    action = sys.argv[1] if len(sys.argv) > 1 else 'trend'
+    
+    if action == 'record':
+        comparison = json_io.load(COMPARISON_FILE)
+        run_id = record_run(comparison)
+        print(f"✅ Recorded run {run_id} ({len(comparison['analysis'])} projects) in {HISTORY_DB}")
+        return
+    
+    if action != 'trend':
+        print("❌ Usage: metrics_history.py record | trend [project]")
+        sys.exit(1)
+    
+    if len(sys.argv) > 2:
+        key = None
+        for row in project_history(sys.argv[2]):
+            if row['key'] != key:
+                key = row['key']
+                print(f"\n📈 {label(key)}\n")
+                print(f"  {'RECORDED':<20} {'SCORE':>6} {'LEVEL':<13} {'TESTS':>6} {'LINES':>9}")
+            print(f"  {row['recorded_at']:<20} {row['score']:>6} {row['level']:<13} "
+                  f"{row['test_files'] or 0:>6} {row['lines'] or 0:>9}")
+        return
+    
+    print("\n📈 Maturity score trends\n")
+    for key, scores in sorted(score_trends().items()):
+        change = scores[-1] - scores[0]
+        print(f"  {label(key):<40} {sparkline(scores):<12} {scores[-1]:>5} ({change:+.1f})")
+
+
+if __name__ == '__main__':
+    main()
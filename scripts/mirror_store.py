@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Local bare-mirror store for offline analysis and fast clones
+
+Usage:
+    mirror_store.py update                 # create/fetch mirrors for all GitHub repos
+    mirror_store.py status                 # list mirrors and their object sharing
+    mirror_store.py export <dir>           # write one git bundle per mirror
+    mirror_store.py import <dir>           # create/update mirrors from bundles
+"""
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import json_io
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+GITHUB_REPOS_FILE = ANALYSIS_DIR / 'github_repos_duds.json'
+MIRRORS_DIR = PROJECTS_DIR / '.mirrors'
+
+# Related repos that should share objects: {"member repo": "base repo"}.
+# A member's mirror borrows objects from its base via objects/info/alternates,
+# e.g. a fork in learning/ pointing at its upstream.
+MIRROR_GROUPS_FILE = MIRRORS_DIR / 'groups.json'
+BUNDLE_INDEX = 'bundles.json'
+MAX_WORKERS = 8
+
+
+def run_git(args: List[str], timeout: int = 600) -> subprocess.CompletedProcess:
+    """Run a git command, capturing output"""
+    return subprocess.run(['git', *args], capture_output=True, text=True, timeout=timeout)
+
+
+def mirror_path(name: str) -> Path:
+    """Location of the bare mirror for a repo"""
+    return MIRRORS_DIR / f"{name}.git"
+
+
+def load_mirror_groups() -> Dict[str, str]:
+    """Load member -> base relationships for object sharing"""
+    if not MIRROR_GROUPS_FILE.exists():
+        return {}
+    return json_io.load(MIRROR_GROUPS_FILE)
+
+
+def link_alternates(mirror: Path, base: Path) -> bool:
+    """Let a mirror borrow objects from a base mirror (idempotent)"""
+    alternates_file = mirror / 'objects' / 'info' / 'alternates'
+    base_objects = str((base / 'objects').resolve())
+    
+    existing = alternates_file.read_text().split() if alternates_file.exists() else []
+    if base_objects in existing:
+        return False
+    
+    alternates_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(alternates_file, 'a', encoding='utf-8') as f:
+        f.write(base_objects + '\n')
+    
+    # Objects borrowed by other mirrors must never be pruned from the base
+    run_git(['-C', str(base), 'config', 'gc.pruneExpire', 'never'])
+    return True
+
+
+def ensure_mirror(name: str, clone_url: str, base: Optional[str] = None) -> Dict[str, Any]:
+    """Create a bare mirror, or fetch incrementally if it already exists"""
+    path = mirror_path(name)
+    base_path = mirror_path(base) if base else None
+    if base_path and not base_path.exists():
+        base_path = None
+    
+    if path.exists():
+        action = 'fetched'
+        result = run_git(['-C', str(path), 'fetch', '--prune', '--quiet', 'origin'])
+    else:
+        action = 'created'
+        MIRRORS_DIR.mkdir(parents=True, exist_ok=True)
+        command = ['clone', '--mirror', '--quiet']
+        if base_path:
+            command.extend(['--reference', str(base_path)])
+        result = run_git([*command, clone_url, str(path)])
+    
+    if result.returncode == 0 and base_path:
+        link_alternates(path, base_path)
+    
+    return {
+        'name': name,
+        'path': str(path),
+        'action': action,
+        'ok': result.returncode == 0,
+        'error': result.stderr.strip() if result.returncode != 0 else None
+    }
+
+
+def update_all(repos: List[Dict[str, Any]], max_workers: int = MAX_WORKERS) -> List[Dict[str, Any]]:
+    """Create or fetch mirrors for all repos, bases before the members sharing them"""
+    groups = load_mirror_groups()
+    bases = [r for r in repos if r['name'] not in groups]
+    members = [r for r in repos if r['name'] in groups]
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch in (bases, members):
+            results.extend(executor.map(
+                lambda r: ensure_mirror(r['name'], r['clone_url'], groups.get(r['name'])),
+                batch
+            ))
+    
+    return results
+
+
+def export_bundles(out_dir: Path) -> List[Dict[str, Any]]:
+    """Export every mirror as a git bundle plus an index for air-gapped import"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    index = []
+    
+    for path in sorted(MIRRORS_DIR.glob('*.git')):
+        name = path.name[:-len('.git')]
+        bundle = out_dir / f"{name}.bundle"
+        result = run_git(['-C', str(path), 'bundle', 'create', str(bundle), '--all'])
+        remote = run_git(['-C', str(path), 'config', '--get', 'remote.origin.url'])
+        index.append({
+            'name': name,
+            'bundle': bundle.name,
+            'clone_url': remote.stdout.strip() or None,
+            'ok': result.returncode == 0
+        })
+    
+    json_io.dump({'mirrors': index, 'groups': load_mirror_groups()}, out_dir / BUNDLE_INDEX, pretty=True)
+    
+    return index
+
+
+def import_bundles(in_dir: Path) -> List[Dict[str, Any]]:
+    """Create or update mirrors from bundles written by export_bundles"""
+    index = json_io.load(in_dir / BUNDLE_INDEX)
+    
+    MIRRORS_DIR.mkdir(parents=True, exist_ok=True)
+    groups = {**index.get('groups', {}), **load_mirror_groups()}
+    json_io.dump(groups, MIRROR_GROUPS_FILE, pretty=True)
+    
+    results = []
+    for entry in index['mirrors']:
+        bundle = in_dir / entry['bundle']
+        path = mirror_path(entry['name'])
+        
+        if path.exists():
+            result = run_git(['-C', str(path), 'fetch', '--quiet', str(bundle), '+refs/*:refs/*'])
+        else:
+            result = run_git(['clone', '--mirror', '--quiet', str(bundle), str(path)])
+            if result.returncode == 0 and entry.get('clone_url'):
+                run_git(['-C', str(path), 'remote', 'set-url', 'origin', entry['clone_url']])
+        
+        results.append({'name': entry['name'], 'ok': result.returncode == 0,
+                        'error': result.stderr.strip() if result.returncode != 0 else None})
+    
+    # Re-establish object sharing between imported mirrors
+    for member, base in groups.items():
+        if mirror_path(member).exists() and mirror_path(base).exists():
+            link_alternates(mirror_path(member), mirror_path(base))
+    
+    return results
+
+
+def mirror_status() -> List[Dict[str, Any]]:
+    """Describe each mirror and the mirrors it borrows objects from"""
+    status = []
+    for path in sorted(MIRRORS_DIR.glob('*.git')):
+        alternates_file = path / 'objects' / 'info' / 'alternates'
+        alternates = alternates_file.read_text().split() if alternates_file.exists() else []
+        status.append({
+            'name': path.name[:-len('.git')],
+            'path': str(path),
+            'alternates': [Path(a).parent.stem for a in alternates]
+        })
+    return status
+
+
+def main():
+    action = sys.argv[1] if len(sys.argv) > 1 else 'status'
+    
+    print("=" * 70)
+    print("MIRROR STORE")
+    print("=" * 70)
+    print(f"\nAction: {action}")
+    print(f"Store: {MIRRORS_DIR}\n")
+    
+    if action == 'update':
+        repos = json_io.load(GITHUB_REPOS_FILE)
+        results = update_all(repos)
+        for r in results:
+            icon = '✅' if r['ok'] else '❌'
+            print(f"  {icon} {r['name']}: {r['action']}" + (f" ({r['error']})" if r['error'] else ''))
+        print(f"\n📦 Mirrors up to date: {sum(1 for r in results if r['ok'])}/{len(results)}")
+    
+    elif action in ('export', 'import'):
+        if len(sys.argv) < 3:
+            print(f"❌ Usage: mirror_store.py {action} <dir>")
+            sys.exit(1)
+        bundle_dir = Path(sys.argv[2])
+        if action == 'export':
+            results = export_bundles(bundle_dir)
+        else:
+            results = import_bundles(bundle_dir)
+        for r in results:
+            print(f"  {'✅' if r['ok'] else '❌'} {r['name']}")
+        print(f"\n📦 {action.capitalize()}ed {sum(1 for r in results if r['ok'])} bundles: {bundle_dir}")
+    
+    else:
+        for m in mirror_status():
+            shared = f" (objects shared with: {', '.join(m['alternates'])})" if m['alternates'] else ''
+            print(f"  • {m['name']}{shared}")
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Cross-project node_modules deduplication
+
+Usage:
+    node_modules_dedup.py          # report identical packages across projects
+    node_modules_dedup.py link     # hard-link duplicate files into the store
+
+Node projects (those with a package_manager in project_comparison.json) are
+searched for installed packages, including scoped and nested ones. Packages
+are grouped by name and version, and only versions installed more than once
+are hashed; the content hash covers every file's relative path, executable
+bit and bytes. Copies with the same name, version and hash are duplicates.
+Copies that already share inodes (linked by pnpm or a previous `link`) count
+as one physical copy, so the estimate only shows space that can still be
+freed.
+
+`link` is opt-in. Like pnpm, it keeps one copy of each file in a
+content-addressed store (.node_store/files/<hash>) and replaces every
+duplicate file with a hard link to it. Linked files share their bytes, so a
+package edited in place changes for every project that links it; a fresh
+`npm install` simply replaces the links. Files on another filesystem than
+the store are left alone.
+"""
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+import json_io
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+COMPARISON_FILE = PROJECTS_DIR / 'project_comparison.json'
+CACHE_FILE = ANALYSIS_DIR / 'node_modules_hash_cache.json'
+REPORT_FILE = ANALYSIS_DIR / 'node_modules_dedup.json'
+STORE_DIR = PROJECTS_DIR / '.node_store'
+
+NODE_PACKAGE_MANAGERS = {'npm', 'yarn', 'pnpm'}
+HASH_WORKERS = 8
+CHUNK = 1 << 20
+
+
+def node_projects() -> List[Dict[str, Any]]:
+    """Analysed projects whose tech stack has a Node package manager"""
+    comparison = json_io.load(COMPARISON_FILE)
+    return [proj for proj in comparison['analysis']
+            if proj['tech_stack'].get('package_manager') in NODE_PACKAGE_MANAGERS]
+
+
+def find_packages(node_modules: Path) -> List[Dict[str, Any]]:
+    """Installed package directories below a node_modules (scoped and nested included)"""
+    packages = []
+    stack = [node_modules]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            # .bin, .cache and pnpm's .pnpm virtual store are not packages
+            if entry.name.startswith('.') or not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name.startswith('@'):
+                stack.append(Path(entry.path))
+                continue
+            try:
+                with open(os.path.join(entry.path, 'package.json'), encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(manifest, dict) or not manifest.get('name') or not manifest.get('version'):
+                continue
+            packages.append({'name': manifest['name'], 'version': manifest['version'], 'path': entry.path})
+            nested = os.path.join(entry.path, 'node_modules')
+            if os.path.isdir(nested):
+                stack.append(Path(nested))
+    return packages
+
+
+def package_files(package_dir: str) -> List[Tuple[str, os.stat_result]]:
+    """Regular files of a package (nested node_modules excluded), sorted by relative path"""
+    files = []
+    stack = ['']
+    while stack:
+        rel = stack.pop()
+        try:
+            entries = list(os.scandir(os.path.join(package_dir, rel)))
+        except OSError:
+            continue
+        for entry in entries:
+            entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != 'node_modules':
+                        stack.append(entry_rel)
+                elif entry.is_file(follow_symlinks=False):
+                    files.append((entry_rel, entry.stat(follow_symlinks=False)))
+            except OSError:
+                continue
+    return sorted(files, key=lambda f: f[0])
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _executable(st: os.stat_result) -> bool:
+    return bool(st.st_mode & 0o111)
+
+
+def hash_package(package_dir: str, cache: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Content hash, size and physical identity of one installed package.
+    
+    The hash is reused while every file keeps its size and mtime.
+    """
+    files = package_files(package_dir)
+    signature = hashlib.sha1(''.join(
+        f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n" for rel, st in files
+    ).encode('utf-8', 'surrogateescape')).hexdigest()
+    
+    cached = cache.get(package_dir)
+    if cached and cached[0] == signature:
+        content = cached[1]
+    else:
+        h = hashlib.sha256()
+        for rel, st in files:
+            h.update(f"{rel}\0{int(_executable(st))}\0".encode('utf-8', 'surrogateescape'))
+            h.update(file_digest(os.path.join(package_dir, rel)).encode())
+        content = h.hexdigest()
+        cache[package_dir] = [signature, content]
+    
+    # Copies that already share inodes are one copy on disk
+    physical = hashlib.sha1(''.join(
+        f"{st.st_dev}:{st.st_ino}\n" for _, st in files
+    ).encode()).hexdigest()
+    
+    return {
+        'content': content,
+        'physical': physical,
+        'bytes': sum(st.st_size for _, st in files),
+        'files': len(files)
+    }
+
+
+def analyse(projects: List[Dict[str, Any]], max_workers: int = HASH_WORKERS) -> Dict[str, Any]:
+    """Group installed packages by (name, version, content hash) across projects"""
+    cache = {}
+    if CACHE_FILE.exists():
+        try:
+            cache = json_io.load(CACHE_FILE)
+        except (OSError, ValueError):
+            cache = {}
+    
+    copies = []
+    for proj in projects:
+        node_modules = Path(proj['path']) / 'node_modules'
+        if node_modules.is_dir():
+            for package in find_packages(node_modules):
+                copies.append({**package, 'project': proj['name']})
+    
+    # Only versions installed more than once can have duplicates
+    by_version: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for copy in copies:
+        by_version.setdefault((copy['name'], copy['version']), []).append(copy)
+    candidates = [copy for group in by_version.values() if len(group) > 1 for copy in group]
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for copy, info in zip(candidates, executor.map(lambda c: hash_package(c['path'], cache), candidates)):
+            copy.update(info)
+    
+    scanned = {copy['path'] for copy in candidates}
+    json_io.dump({path: entry for path, entry in cache.items() if path in scanned}, CACHE_FILE)
+    
+    groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+    for copy in candidates:
+        groups.setdefault((copy['name'], copy['version'], copy['content']), []).append(copy)
+    
+    duplicates = []
+    for (name, version, content), group in groups.items():
+        if len(group) < 2:
+            continue
+        physical = len({copy['physical'] for copy in group})
+        duplicates.append({
+            'name': name,
+            'version': version,
+            'content': content,
+            'bytes': group[0]['bytes'],
+            'files': group[0]['files'],
+            'copies': len(group),
+            'physical_copies': physical,
+            'reclaimable_bytes': group[0]['bytes'] * (physical - 1),
+            'projects': sorted({copy['project'] for copy in group}),
+            'paths': sorted(copy['path'] for copy in group)
+        })
+    duplicates.sort(key=lambda d: d['reclaimable_bytes'], reverse=True)
+    
+    return {
+        'projects': len(projects),
+        'packages_installed': len(copies),
+        'packages_hashed': len(candidates),
+        'duplicate_groups': len(duplicates),
+        'reclaimable_bytes': sum(d['reclaimable_bytes'] for d in duplicates),
+        'duplicates': duplicates
+    }
+
+
+def store_object(digest: str, executable: bool) -> Path:
+    """Content-addressed store path; executables are stored apart so modes never clash"""
+    return STORE_DIR / 'files' / digest[:2] / (digest[2:] + ('-exec' if executable else ''))
+
+
+def link_group(group: Dict[str, Any], verified: Dict[Path, bool]) -> Tuple[int, int]:
+    """Replace every copy's files with hard links into the store; returns (files linked, bytes freed)"""
+    store_dev = os.stat(STORE_DIR).st_dev
+    linked = freed = 0
+    for package_dir in group['paths']:
+        for rel, st in package_files(package_dir):
+            if st.st_dev != store_dev:
+                continue
+            path = os.path.join(package_dir, rel)
+            digest = file_digest(path)
+            target = store_object(digest, _executable(st))
+            
+            # A linked file edited in place changes the store object too; such
+            # an object no longer matches its name and is dropped from the store
+            if target.exists() and target not in verified:
+                verified[target] = file_digest(str(target)) == digest
+                if not verified[target]:
+                    target.unlink()
+            
+            if not target.exists():
+                # The first copy seen becomes the store object; nothing is copied
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.link(path, target)
+                verified[target] = True
+                continue
+            target_st = os.stat(target)
+            if (target_st.st_dev, target_st.st_ino) == (st.st_dev, st.st_ino):
+                continue
+            
+            tmp = f"{path}.dedup-tmp"
+            try:
+                os.link(target, tmp)
+                os.replace(tmp, path)
+            except OSError as e:
+                if os.path.lexists(tmp):
+                    os.unlink(tmp)
+                print(f"  ⚠️  Could not link {path}: {e}")
+                continue
+            linked += 1
+            if st.st_nlink == 1:
+                freed += st.st_size
+    return linked, freed
+
+
+def main():
+    from disk_usage import format_bytes
+    
+    action = sys.argv[1] if len(sys.argv) > 1 else 'report'
+    if action not in ('report', 'link'):
+        print("❌ Usage: node_modules_dedup.py [report | link]")
+        sys.exit(1)
+    
+    projects = node_projects()
+    print(f"\n📦 Scanning node_modules of {len(projects)} Node projects...")
+    report = analyse(projects)
+    json_io.dump(report, REPORT_FILE, pretty=True)
+    
+    print(f"  • {report['packages_installed']:,} installed packages, {report['packages_hashed']:,} hashed")
+    print(f"  • {report['duplicate_groups']:,} packages duplicated across locations")
+    print(f"\n  {'PACKAGE':<40} {'COPIES':>6} {'SIZE':>10} {'RECLAIMABLE':>12}")
+    for dup in report['duplicates'][:20]:
+        print(f"  {dup['name'] + '@' + dup['version']:<40} {dup['copies']:>6} "
+              f"{format_bytes(dup['bytes']):>10} {format_bytes(dup['reclaimable_bytes']):>12}")
+    print(f"\n💾 Reclaimable by hard-linking duplicates: {format_bytes(report['reclaimable_bytes'])}")
+    print(f"✅ Saved: {REPORT_FILE}")
+    
+    if action == 'link':
+        STORE_DIR.mkdir(parents=True, exist_ok=True)
+        total_linked = total_freed = 0
+        verified: Dict[Path, bool] = {}
+        for dup in report['duplicates']:
+            if dup['physical_copies'] < 2:
+                continue
+            linked, freed = link_group(dup, verified)
+            total_linked += linked
+            total_freed += freed
+        print(f"\n🔗 Linked {total_linked:,} files into {STORE_DIR}, freeing {format_bytes(total_freed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Typed, memory-efficient project records shared by the analysis scripts
+
+Records are slotted dataclasses, and strings that repeat across thousands of
+projects (languages, frameworks, levels, branches, categories) are interned.
+Records still support read-only dict-style access (`proj['maturity']['level']`,
+`proj.get('github_repo')`) so report code works unchanged on either form. Keys
+a record has no field for are kept aside and written back by to_dict.
+"""
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [sys.intern(v) if isinstance(v, str) else v for v in value]
+    return value
+
+
+class Record:
+    """Dict-style access plus fast to_dict/from_dict for slotted dataclasses"""
+    __slots__ = ('_extra',)  # keys from_dict found no field for
+    
+    # Subclasses may set these
+    _nested: ClassVar[Dict[str, type]] = {}      # field -> record type
+    _interned: ClassVar[Tuple[str, ...]] = ()    # fields whose strings are interned
+    _omit_none: ClassVar[Tuple[str, ...]] = ()   # fields left out of to_dict when None
+    
+    def _extras(self) -> Dict[str, Any]:
+        return getattr(self, '_extra', None) or {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_names():
+            return getattr(self, key)
+        try:
+            return self._extras()[key]
+        except KeyError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key: str) -> bool:
+        """True when to_dict() would have the key, as for the dict the record replaces"""
+        if key in self._field_names():
+            return key not in self._omit_none or getattr(self, key) is not None
+        return key in self._extras()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Like dict.get; unset (None) fields return the default"""
+        value = getattr(self, key, None) if key in self._field_names() else self._extras().get(key)
+        return default if value is None else value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        result = {}
+        for name in self._field_names():
+            value = getattr(self, name)
+            if value is None and name in self._omit_none:
+                continue
+            result[name] = value.to_dict() if isinstance(value, Record) else value
+        result.update(self._extras())
+        return result
+    
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]):
+        """Build a record from a dict; unknown keys are kept for to_dict"""
+        if data is None or isinstance(data, cls):
+            return data
+        names = cls._field_names()
+        values = {}
+        for name in names:
+            if name not in data:
+                continue
+            value = data[name]
+            if name in cls._nested:
+                value = cls._nested[name].from_dict(value)
+            elif name in cls._interned:
+                value = _intern(value)
+            values[name] = value
+        record = cls(**values)
+        if len(values) < len(data):
+            record._extra = {key: value for key, value in data.items() if key not in names}
+        return record
+    
+    @classmethod
+    def _field_names(cls) -> Tuple[str, ...]:
+        names = cls.__dict__.get('_names')
+        if names is None:
+            names = tuple(f.name for f in fields(cls))
+            setattr(cls, '_names', names)
+        return names
+
+
+@dataclass(slots=True)
+class GitHubRepo(Record):
+    name: str
+    full_name: Optional[str] = None
+    description: Optional[str] = None
+    html_url: Optional[str] = None
+    clone_url: Optional[str] = None
+    ssh_url: Optional[str] = None
+    language: Optional[str] = None
+    size: int = 0
+    stargazers_count: int = 0
+    watchers_count: int = 0
+    forks_count: int = 0
+    open_issues_count: int = 0
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    pushed_at: Optional[str] = None
+    archived: bool = False
+    disabled: bool = False
+    fork: bool = False
+    private: bool = False
+    default_branch: Optional[str] = None
+    topics: List[str] = field(default_factory=list)
+    visibility: Optional[str] = None
+    has_wiki: bool = False
+    has_pages: bool = False
+    has_downloads: bool = False
+    has_issues: bool = False
+    
+    _interned: ClassVar[Tuple[str, ...]] = ('language', 'default_branch', 'visibility', 'topics')
+
+
+@dataclass(slots=True)
+class GitInfo(Record):
+    is_git_repo: bool = False
+    last_commit: Optional[str] = None
+    remote_url: Optional[str] = None
+    branch: Optional[str] = None
+    has_uncommitted: bool = False
+    divergence: Optional[Dict[str, Any]] = None
+    history: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None  # set when reading the repository failed
+    
+    _interned: ClassVar[Tuple[str, ...]] = ('branch',)
+    _omit_none: ClassVar[Tuple[str, ...]] = ('divergence', 'history', 'error')
+
+
+@dataclass(slots=True)
+class TechStack(Record):
+    primary_language: Optional[str] = None
+    framework: Optional[str] = None
+    build_tools: List[str] = field(default_factory=list)
+    package_manager: Optional[str] = None
+    categories: List[str] = field(default_factory=list)
+    found_files: List[str] = field(default_factory=list)
+    package_languages: Optional[Dict[str, int]] = None
+    package_frameworks: Optional[Dict[str, int]] = None
+    
+    _interned: ClassVar[Tuple[str, ...]] = ('primary_language', 'framework', 'build_tools',
+                                            'package_manager', 'categories', 'found_files')
+    _omit_none: ClassVar[Tuple[str, ...]] = ('package_languages', 'package_frameworks')
+
+
+@dataclass(slots=True)
+class Maturity(Record):
+    score: Optional[float] = None
+    level: Optional[str] = None
+    details: List[str] = field(default_factory=list)
+    raw_score: Optional[float] = None
+    max_score: Optional[float] = None
+    features: Optional[Dict[str, Any]] = None
+    
+    _interned: ClassVar[Tuple[str, ...]] = ('level', 'details')
+    _omit_none: ClassVar[Tuple[str, ...]] = ('features',)
+
+
+@dataclass(slots=True)
+class ProjectRecord(Record):
+    """One analysed local project (an entry of project_comparison.json 'analysis')"""
+    name: str
+    path: str
+    root: Optional[str] = None
+    category: Optional[str] = None
+    git_info: GitInfo = field(default_factory=GitInfo)
+    tech_stack: TechStack = field(default_factory=TechStack)
+    maturity: Maturity = field(default_factory=Maturity)
+    workspace: Optional[Dict[str, Any]] = None
+    languages: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    github_repo: Optional[GitHubRepo] = None
+    status: str = 'local_only'
+    truncated: Optional[Dict[str, Any]] = None  # walk budget report when the scan was cut short
+    disk_usage: Optional[Dict[str, Any]] = None
+    
+    _nested: ClassVar[Dict[str, type]] = {'git_info': GitInfo, 'tech_stack': TechStack,
+                                          'maturity': Maturity, 'github_repo': GitHubRepo}
+    _interned: ClassVar[Tuple[str, ...]] = ('root', 'category', 'status')
+    _omit_none: ClassVar[Tuple[str, ...]] = ('truncated', 'disk_usage')
+
+
+@dataclass(slots=True)
+class RemoteRecord(Record):
+    """A GitHub repository with no local checkout"""
+    name: str
+    github_repo: GitHubRepo
+    status: str = 'remote_only'
+    
+    _nested: ClassVar[Dict[str, type]] = {'github_repo': GitHubRepo}
+    _interned: ClassVar[Tuple[str, ...]] = ('status',)
+
+
+def to_jsonable(obj: Any) -> Any:
+    """`default=` hook for JSON encoders: records become plain dicts"""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def comparison_from_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode project_comparison.json into records.
+    
+    'both' and 'local_only' repeat entries of 'analysis' in the file; here they
+    reference the same record objects instead of holding copies.
+    """
+    analysis = [ProjectRecord.from_dict(p) for p in data.get('analysis', [])]
+    by_path = {p.path: p for p in analysis}
+    return {
+        'local_only': [by_path.get(p['path']) or ProjectRecord.from_dict(p) for p in data.get('local_only', [])],
+        'remote_only': [RemoteRecord.from_dict(p) for p in data.get('remote_only', [])],
+        'both': [by_path.get(p['path']) or ProjectRecord.from_dict(p) for p in data.get('both', [])],
+        'analysis': analysis
+    }
+
+
+def github_repos_from_list(repos: List[Dict[str, Any]]) -> List[GitHubRepo]:
+    return [GitHubRepo.from_dict(repo) for repo in repos]
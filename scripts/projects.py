@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unified entry point for the project management scripts
+
+Usage:
+    projects.py <command> [args...]
+    projects.py --help
+
+Each command lives in its own module, which is imported only when that
+command runs, so `--help` and cached queries skip the heavy imports.
+"""
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# command -> (module, function, help); remaining arguments are passed on via sys.argv
+COMMANDS = {
+    'analyze': ('analyze_projects', 'main', 'Analyse local projects and compare with GitHub'),
+    'scan-cursor': ('scan_cursor_rules', 'main', 'Inventory .cursor rules across projects'),
+    'consolidate': ('consolidation_analysis', 'main', 'Find duplicates and archive candidates'),
+    'docs': ('generate_documentation', 'main', 'Regenerate README, docs/ and the registry'),
+    'fetch': ('fetch_github_repos', 'main', 'Fetch GitHub repository metadata'),
+    'clone': ('clone_remote_repos', 'main', 'Clone remote-only repositories'),
+    'names': ('check_local_remote_names', 'scan_all_projects', 'Check local vs remote naming'),
+    'rename': ('rename_to_snake_case', 'main', 'Rename project folders to snake_case'),
+    'refresh': ('update_registry', 'main', 'Run analyze, consolidate, scan-cursor and docs'),
+    'sync': ('sync_engine', 'main', 'Parallel fetch/fast-forward of changed repos'),
+    'list': ('analyzers', 'main', 'Query projects via lazy analyzers (list --language TypeScript)'),
+    'deps': ('dependency_index', 'main', 'Dependency index (build | query <package> [constraint])'),
+    'trend': ('metrics_history', 'main', 'Maturity score history (trend [project])'),
+    'mirror': ('mirror_store', 'main', 'Local bare mirrors (update | status | export | import)'),
+    'node-dedup': ('node_modules_dedup', 'main', 'Duplicate node_modules packages (report | link)'),
+    'dupes': ('duplicate_files', 'main', 'Duplicate files across projects (report | link | reflink)'),
+    'cold': ('cold_storage', 'main', 'Cold storage for archive candidates (archive | extract | restore | verify)'),
+    'startup-check': (None, None, 'Check interpreter + import time stays within budget'),
+}
+
+# Commands whose own CLI expects its action word in argv[1]
+ACTION_PREFIX = {'list': 'list', 'trend': 'trend'}
+
+STARTUP_BUDGET_MS = 100
+STARTUP_SAMPLES = 5
+
+
+def startup_check(budget_ms: float = STARTUP_BUDGET_MS) -> bool:
+    """Time `projects.py --help` and the lazy-import path of each command module.
+    
+    Reports the best of several runs for the full process, and the cumulative
+    import time of each command module measured with -X importtime.
+    """
+    import subprocess
+    import time
+    
+    def best_wall_ms(args):
+        timings = []
+        for _ in range(STARTUP_SAMPLES):
+            start = time.perf_counter()
+            subprocess.run([sys.executable] + args, capture_output=True, cwd=SCRIPTS_DIR)
+            timings.append((time.perf_counter() - start) * 1000)
+        return min(timings)
+    
+    def import_ms(module):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                capture_output=True, text=True, cwd=SCRIPTS_DIR)
+        for line in result.stderr.splitlines():
+            parts = [p.strip() for p in line.split('|')]
+            if len(parts) == 3 and parts[2] == module:
+                return int(parts[1]) / 1000
+        return None
+    
+    ok = True
+    help_ms = best_wall_ms([str(SCRIPTS_DIR / 'projects.py'), '--help'])
+    status = '✅' if help_ms <= budget_ms else '❌'
+    ok &= help_ms <= budget_ms
+    print(f"{status} projects.py --help: {help_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+    
+    for command, (module, _, _) in COMMANDS.items():
+        if not module:
+            continue
+        ms = import_ms(module)
+        if ms is None:
+            print(f"❌ {command:<14} import {module} failed")
+            ok = False
+            continue
+        status = '✅' if ms <= budget_ms else '❌'
+        ok &= ms <= budget_ms
+        print(f"{status} {command:<14} import {module}: {ms:.1f} ms")
+    
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='projects',
+        description='Project management tooling',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='\n'.join(f"  {name:<14} {help_text}" for name, (_, _, help_text) in COMMANDS.items())
+    )
+    parser.add_argument('command', choices=COMMANDS, metavar='command', help='one of the commands below')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='arguments for the command')
+    args = parser.parse_args()
+    
+    if args.command == 'startup-check':
+        sys.exit(0 if startup_check() else 1)
+    
+    module_name, function, _ = COMMANDS[args.command]
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    
+    # Present the command's own CLI with the argv it expects
+    prefix = [ACTION_PREFIX[args.command]] if args.command in ACTION_PREFIX else []
+    sys.argv = [f"projects {args.command}"] + prefix + args.args
+    getattr(importlib.import_module(module_name), function)()
+
+
+if __name__ == '__main__':
+    main()
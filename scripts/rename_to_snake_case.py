@@ -4,7 +4,6 @@ Rename all project folders to snake_case
 """
 import re
 from pathlib import Path
-import shutil
 
 PROJECTS_DIR = Path('/Users/dalerogers/Projects')
 
@@ -24,28 +23,9 @@ def to_snake_case(name: str) -> str:
 
 def get_all_projects() -> list:
     """Get all project directories that need renaming"""
-    projects = []
+    from discovery import discover_projects
     
-    # Root level projects
-    exclude_dirs = {'active', 'portfolio', 'archived', 'templates', 'learning', 
-                   '.git', 'node_modules', '__pycache__', 'cursor_rules_library'}
-    
-    for item in PROJECTS_DIR.iterdir():
-        if item.is_dir() and not item.name.startswith('.') and item.name not in exclude_dirs:
-            projects.append(item)
-    
-    # Projects in organizational folders
-    org_dirs = ['active/production', 'active/development', 'active/experimental', 
-                'portfolio', 'archived', 'templates', 'learning']
-    
-    for org_dir in org_dirs:
-        org_path = PROJECTS_DIR / org_dir
-        if org_path.exists():
-            for item in org_path.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    projects.append(item)
-    
-    return projects
+    return [Path(proj['path']) for proj in discover_projects()]
 
 
 def create_rename_plan() -> list:
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Configured project roots (local SSD, mounted volumes, ...)
+
+Usage:
+    roots.py    # show configured roots and whether they are available
+
+The main Projects directory is always a root and holds the analysis output.
+Additional roots are listed in project_roots.json:
+
+    {"roots": [{"name": "archive", "path": "/Volumes/Archive/Projects", "workers": 2}]}
+
+Each root is scanned by its own worker with its own I/O concurrency
+('workers'), and keeps its own caches under analysis/roots/<name>/ so roots
+can be scanned at the same time without sharing cache files.
+'budget_seconds' and 'budget_files' override the per-project walk budget
+(see tree_walk.WalkBudget) for the projects of a root.
+"""
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import json_io
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+ANALYSIS_DIR = PROJECTS_DIR / 'analysis'
+ROOTS_FILE = PROJECTS_DIR / 'project_roots.json'
+
+MAIN_ROOT = 'main'
+DEFAULT_WORKERS = 8
+
+
+def load_roots(available_only: bool = True) -> List[Dict[str, Any]]:
+    """Main root first, then the roots from project_roots.json"""
+    roots = [{'name': MAIN_ROOT, 'path': str(PROJECTS_DIR), 'workers': DEFAULT_WORKERS}]
+    
+    if ROOTS_FILE.exists():
+        for root in json_io.load(ROOTS_FILE).get('roots', []):
+            root = {'workers': DEFAULT_WORKERS, **root}
+            root['path'] = str(Path(root['path']).expanduser())
+            if root['path'] == str(PROJECTS_DIR):
+                roots[0].update(root)  # lets the config name or tune the main root
+            else:
+                root.setdefault('name', Path(root['path']).name)
+                roots.append(root)
+    
+    if available_only:
+        # An unmounted volume is skipped rather than reported as empty
+        roots = [root for root in roots if Path(root['path']).is_dir()]
+    return roots
+
+
+def get_root(name: Optional[str]) -> Dict[str, Any]:
+    """Root by name; None or an unknown name gives the main root"""
+    roots = load_roots(available_only=False)
+    return next((root for root in roots if root['name'] == name), roots[0])
+
+
+def is_main(root: Optional[Dict[str, Any]]) -> bool:
+    return root is None or root['path'] == str(PROJECTS_DIR)
+
+
+def cache_path(root: Optional[Dict[str, Any]], filename: str) -> Path:
+    """Cache file for a root; the main root keeps its caches directly in analysis/.
+    
+    A root tagged with 'cache_tag' (e.g. one shard of a sharded scan) gets its
+    own cache directory under analysis/shards/.
+    """
+    base = ANALYSIS_DIR / 'shards' / root['cache_tag'] if root and root.get('cache_tag') else ANALYSIS_DIR
+    if is_main(root):
+        return base / filename
+    return base / 'roots' / root['name'] / filename
+
+
+def main():
+    print(f"\n📁 Project roots\n")
+    for root in load_roots(available_only=False):
+        status = '✅' if Path(root['path']).is_dir() else '❌ not available'
+        print(f"  {root['name']:<16} {root['workers']:>3} workers  {root['path']}  {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,17 +2,18 @@
 """
 Scan all projects for Cursor rules and commands
 """
-import json
 from pathlib import Path
 from typing import Dict, List, Any
-import hashlib
-import shutil
+
+import json_io
+from tree_walk import walk_project
 
 PROJECTS_DIR = Path('/Users/dalerogers/Projects')
 
 
 def calculate_file_hash(file_path: Path) -> str:
     """Calculate MD5 hash of a file"""
+    import hashlib
     try:
         with open(file_path, 'rb') as f:
             return hashlib.md5(f.read()).hexdigest()
@@ -36,32 +37,24 @@ def scan_project_for_cursor_files(project_path: Path) -> Dict[str, Any]:
     if not cursor_dir.exists():
         return result
     
-    # Scan rules directory
-    rules_dir = cursor_dir / 'rules'
-    if rules_dir.exists():
-        for rule_file in rules_dir.rglob('*'):
-            if rule_file.is_file():
-                result['rules'].append({
-                    'filename': rule_file.name,
-                    'relative_path': str(rule_file.relative_to(cursor_dir)),
-                    'full_path': str(rule_file),
-                    'size': rule_file.stat().st_size,
-                    'hash': calculate_file_hash(rule_file),
-                    'extension': rule_file.suffix
-                })
-    
-    # Scan commands directory
-    commands_dir = cursor_dir / 'commands'
-    if commands_dir.exists():
-        for cmd_file in commands_dir.rglob('*'):
-            if cmd_file.is_file():
-                result['commands'].append({
-                    'filename': cmd_file.name,
-                    'relative_path': str(cmd_file.relative_to(cursor_dir)),
-                    'full_path': str(cmd_file),
-                    'size': cmd_file.stat().st_size,
-                    'hash': calculate_file_hash(cmd_file),
-                    'extension': cmd_file.suffix
+    # Editor config is often gitignored, so ignore files are not applied; a
+    # rules/commands directory symlinked to a shared library is followed
+    for kind in ('rules', 'commands'):
+        kind_dir = cursor_dir / kind
+        if not kind_dir.is_dir():
+            continue
+        for _, _, files in walk_project(kind_dir, ignore=False):
+            for entry in files:
+                if not entry.is_file():
+                    continue
+                cursor_file = Path(entry.path)
+                result[kind].append({
+                    'filename': cursor_file.name,
+                    'relative_path': str(cursor_file.relative_to(cursor_dir)),
+                    'full_path': str(cursor_file),
+                    'size': entry.stat().st_size,
+                    'hash': calculate_file_hash(cursor_file),
+                    'extension': cursor_file.suffix
                 })
     
     return result
@@ -69,31 +62,13 @@ def scan_project_for_cursor_files(project_path: Path) -> Dict[str, Any]:
 
 def scan_all_projects() -> List[Dict[str, Any]]:
     """Scan all projects recursively"""
+    from discovery import discover_projects
     
     results = []
-    exclude_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 
-                   'dist', 'build', '.next', 'uploads', 'test-results',
-                   'storybook-static', 'playwright-report'}
-    
-    # Scan root level
-    for item in PROJECTS_DIR.iterdir():
-        if item.is_dir() and not item.name.startswith('.') and item.name not in exclude_dirs:
-            result = scan_project_for_cursor_files(item)
-            if result['has_cursor_dir']:
-                results.append(result)
-    
-    # Scan organizational subdirectories
-    org_dirs = ['active/production', 'active/development', 'active/experimental', 
-                'portfolio', 'archived', 'templates', 'learning']
-    
-    for org_dir in org_dirs:
-        org_path = PROJECTS_DIR / org_dir
-        if org_path.exists():
-            for item in org_path.iterdir():
-                if item.is_dir() and not item.name.startswith('.') and item.name not in exclude_dirs:
-                    result = scan_project_for_cursor_files(item)
-                    if result['has_cursor_dir']:
-                        results.append(result)
+    for proj in discover_projects():
+        result = scan_project_for_cursor_files(Path(proj['path']))
+        if result['has_cursor_dir']:
+            results.append(result)
     
     return results
 
@@ -174,8 +149,7 @@ def main():
     
     # Save results
     output_file = PROJECTS_DIR / 'cursor_files_inventory.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    json_io.dump(results, output_file)
     
     print(f"\n✅ Saved inventory to: {output_file}")
     
@@ -222,8 +196,7 @@ def main():
     
     # Save duplicate analysis
     dup_output = PROJECTS_DIR / 'cursor_duplicates_analysis.json'
-    with open(dup_output, 'w', encoding='utf-8') as f:
-        json.dump(duplicates, f, indent=2, ensure_ascii=False)
+    json_io.dump(duplicates, dup_output)
     
     print(f"✅ Saved duplicate analysis to: {dup_output}")
     
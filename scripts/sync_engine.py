@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Parallel sync engine - only fetches/pulls repos whose upstream actually changed
+
+Usage:
+    sync_engine.py [status|fetch|pull] [--workers N] [--fetch-workers N]
+
+A cheap ls-remote against each registry remote_url is compared with the local
+remote-tracking ref; only repos with new upstream commits are fetched (and, for
+'pull', fast-forwarded when clean).
+"""
+import argparse
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import json_io
+from analyze_projects import get_divergence
+
+PROJECTS_DIR = Path('/Users/dalerogers/Projects')
+REGISTRY_FILE = PROJECTS_DIR / '.project-registry.json'
+
+LS_REMOTE_WORKERS = 16
+FETCH_WORKERS = 4
+
+
+def run_git(project_path: Path, args: List[str], timeout: int = 30) -> Optional[str]:
+    """Run a git command in a project, returning stdout or None on failure"""
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(project_path), *args],
+            capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def load_sync_targets() -> List[Dict[str, Any]]:
+    """Load git-backed projects with a remote from the registry"""
+    registry = json_io.load(REGISTRY_FILE)
+    
+    targets = []
+    for proj in registry['projects']:
+        git = proj.get('git') or {}
+        path = Path(proj['path'])
+        if proj.get('status') == 'cold':
+            continue
+        if git.get('has_repo') and git.get('remote_url') and (path / '.git').exists():
+            targets.append({'name': proj['name'], 'path': path, 'remote_url': git['remote_url']})
+    
+    return targets
+
+
+def get_tracking(project_path: Path) -> Dict[str, Optional[str]]:
+    """Read the current branch, its upstream ref and the upstream's last known SHA"""
+    branch = run_git(project_path, ['symbolic-ref', '--quiet', '--short', 'HEAD'])
+    if not branch:
+        return {'branch': None, 'remote': None, 'merge_ref': None, 'tracking_sha': None}
+    
+    remote = run_git(project_path, ['config', '--get', f'branch.{branch}.remote'])
+    merge_ref = run_git(project_path, ['config', '--get', f'branch.{branch}.merge'])
+    tracking_sha = run_git(project_path, ['rev-parse', '--verify', '--quiet', '@{u}'])
+    
+    return {'branch': branch, 'remote': remote, 'merge_ref': merge_ref, 'tracking_sha': tracking_sha}
+
+
+def check_upstream(target: Dict[str, Any]) -> Dict[str, Any]:
+    """Compare the remote branch head (via ls-remote) with the local tracking ref"""
+    tracking = get_tracking(target['path'])
+    merge_ref = tracking['merge_ref'] or 'HEAD'
+    
+    output = run_git(target['path'], ['ls-remote', target['remote_url'], merge_ref])
+    remote_sha = output.split()[0] if output else None
+    
+    if output is None:
+        state = 'unreachable'
+    elif not tracking['merge_ref']:
+        state = 'no_upstream'
+    elif remote_sha != tracking['tracking_sha']:
+        state = 'changed'
+    else:
+        state = 'unchanged'
+    
+    return {**target, **tracking, 'remote_sha': remote_sha, 'upstream_state': state}
+
+
+def get_local_state(project_path: Path) -> Dict[str, Any]:
+    """Ahead/behind counts against upstream and working tree dirtiness"""
+    divergence = get_divergence(project_path)
+    status = run_git(project_path, ['status', '--porcelain', '--untracked-files=no'])
+    
+    return {
+        'ahead': divergence.get('ahead'),
+        'behind': divergence.get('behind'),
+        'sync_state': divergence['state'],
+        'dirty': bool(status)
+    }
+
+
+def sync_repo(repo: Dict[str, Any], action: str) -> Dict[str, Any]:
+    """Fetch a changed repo and fast-forward it when safe"""
+    result = {'fetched': False, 'fast_forwarded': False, 'error': None}
+    remote = repo['remote'] or 'origin'
+    
+    if run_git(repo['path'], ['fetch', '--quiet', remote], timeout=300) is None:
+        result['error'] = 'fetch failed'
+        return result
+    result['fetched'] = True
+    
+    if action == 'pull':
+        state = get_local_state(repo['path'])
+        if state['dirty']:
+            result['error'] = 'uncommitted changes, not fast-forwarding'
+        elif state['ahead'] and state['behind']:
+            result['error'] = 'diverged from upstream, not fast-forwarding'
+        elif state['behind']:
+            if run_git(repo['path'], ['merge', '--ff-only', '--quiet', '@{u}'], timeout=120) is None:
+                result['error'] = 'fast-forward failed'
+            else:
+                result['fast_forwarded'] = True
+    
+    return result
+
+
+def run_sync(action: str = 'status', workers: int = LS_REMOTE_WORKERS,
+             fetch_workers: int = FETCH_WORKERS) -> List[Dict[str, Any]]:
+    """Detect changed upstreams in parallel, then sync only those repos"""
+    targets = load_sync_targets()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        repos = list(executor.map(check_upstream, targets))
+    
+    changed = [r for r in repos if r['upstream_state'] == 'changed']
+    if action in ('fetch', 'pull') and changed:
+        with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            for repo, outcome in zip(changed, executor.map(lambda r: sync_repo(r, action), changed)):
+                repo.update(outcome)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for repo, state in zip(repos, executor.map(lambda r: get_local_state(r['path']), repos)):
+            repo.update(state)
+    
+    return repos
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sync all registry projects with their remotes')
+    parser.add_argument('action', nargs='?', default='status', choices=['status', 'fetch', 'pull'])
+    parser.add_argument('--workers', type=int, default=LS_REMOTE_WORKERS,
+                        help='concurrent ls-remote/status checks')
+    parser.add_argument('--fetch-workers', type=int, default=FETCH_WORKERS,
+                        help='concurrent fetches of changed repos')
+    args = parser.parse_args()
+    
+    print("=" * 70)
+    print("PROJECT SYNC ENGINE")
+    print("=" * 70)
+    print(f"\nAction: {args.action}\n")
+    
+    start = time.monotonic()
+    repos = run_sync(args.action, args.workers, args.fetch_workers)
+    elapsed = time.monotonic() - start
+    
+    for repo in sorted(repos, key=lambda r: r['name']):
+        flags = []
+        if repo['upstream_state'] == 'changed':
+            flags.append('📥 upstream changed')
+        elif repo['upstream_state'] in ('unreachable', 'no_upstream'):
+            flags.append(f"⚠️  {repo['upstream_state'].replace('_', ' ')}")
+        if repo.get('fast_forwarded'):
+            flags.append('✅ fast-forwarded')
+        ahead, behind = repo['ahead'], repo['behind']
+        if ahead and behind:
+            flags.append(f"diverged ↑{ahead} ↓{behind}")
+        elif ahead:
+            flags.append(f"ahead ↑{ahead}")
+        elif behind:
+            flags.append(f"behind ↓{behind}")
+        if repo['dirty']:
+            flags.append('✏️  dirty')
+        if repo.get('error'):
+            flags.append(f"❌ {repo['error']}")
+        print(f"  • {repo['name']:<35} {repo['branch'] or '(detached)':<15} {' '.join(flags) or '✓ up to date'}")
+    
+    changed = [r for r in repos if r['upstream_state'] == 'changed']
+    print("\n" + "=" * 70)
+    print("SYNC SUMMARY")
+    print("=" * 70)
+    print(f"📊 Repositories checked: {len(repos)}")
+    print(f"📥 Upstream changed: {len(changed)}")
+    print(f"🔄 Fetched: {sum(1 for r in repos if r.get('fetched'))}")
+    print(f"⏩ Fast-forwarded: {sum(1 for r in repos if r.get('fast_forwarded'))}")
+    print(f"✏️  Dirty: {sum(1 for r in repos if r['dirty'])}")
+    print(f"⏱️  Elapsed: {elapsed:.1f}s")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
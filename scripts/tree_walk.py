@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Shared pruned directory walk used by the analysis scripts
+
+A walk can be given a WalkBudget: a per-project allowance of files visited
+and seconds spent walking, shared by every walk of that project. Once it runs
+out the walk stops early and the budget records why, so callers can keep the
+partial result and flag the project as truncated.
+"""
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ignore_rules import directory_rules, project_matcher
+
+# Directories that never contain project source worth analysing
+EXCLUDE_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv',
+                'dist', 'build', '.next', 'uploads', 'test-results',
+                'storybook-static', 'playwright-report'}
+
+# Default per-project budgets, summed over every walk of the project
+# (override per root in project_roots.json with 'budget_seconds' / 'budget_files')
+BUDGET_SECONDS = 120
+BUDGET_FILES = 1_000_000
+
+
+class WalkBudget:
+    """Files-visited and walking-time allowance for one project"""
+    
+    def __init__(self, seconds: float = BUDGET_SECONDS, files: int = BUDGET_FILES):
+        self.seconds = seconds
+        self.files = files
+        self.spent = 0.0
+        self.visited = 0
+        self.truncated: Optional[str] = None  # 'time' or 'files' once exhausted
+    
+    def charge(self, files: int, seconds: float):
+        self.visited += files
+        self.spent += seconds
+    
+    def stop(self) -> bool:
+        """True when there is work left but no budget; records the reason"""
+        if self.truncated is None:
+            if self.visited >= self.files:
+                self.truncated = 'files'
+            elif self.spent >= self.seconds:
+                self.truncated = 'time'
+        return self.truncated is not None
+    
+    def report(self) -> Optional[Dict[str, Any]]:
+        """Summary for truncated projects, None when the budget held"""
+        if self.truncated is None:
+            return None
+        return {'reason': self.truncated, 'files_visited': self.visited,
+                'seconds': round(self.spent, 1), 'files_budget': self.files,
+                'seconds_budget': self.seconds}
+
+
+def walk_project(root: Path, budget: Optional[WalkBudget] = None,
+                 ignore: bool = True) -> Iterator[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]:
+    """Walk a project tree with one scandir per directory, pruning EXCLUDE_DIRS.
+    
+    Yields (dirpath, subdirs, files) with os.DirEntry objects so callers can
+    reuse the cached stat information. As with os.walk, removing entries from
+    subdirs prunes them. Symlinked directories are not followed.
+    
+    Paths matched by the project's .gitignore / .projectignore rules are left
+    out unless ignore=False (see ignore_rules.py).
+    
+    With a budget, time between directories (including the caller's work)
+    and files seen are charged to it, and the walk ends once it is exhausted.
+    """
+    stack = [(str(root), '', project_matcher(root) if ignore else None)]
+    
+    while stack:
+        # Only a directory left unvisited makes the result partial
+        if budget is not None and budget.stop():
+            return
+        start = time.perf_counter()
+        dirpath, rel, matcher = stack.pop()
+        dirs, files = [], []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in EXCLUDE_DIRS:
+                                dirs.append(entry)
+                        else:
+                            files.append(entry)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        
+        prefix = rel + '/' if rel else ''
+        if matcher is not None:
+            names = [f.name for f in files]
+            matcher = matcher.extend(directory_rules(dirpath, rel, names))
+            if matcher.rules:
+                dirs = [d for d in dirs if not matcher.ignored(prefix + d.name, True)]
+                files = [f for f in files if not matcher.ignored(prefix + f.name, False)]
+        
+        yield dirpath, dirs, files
+        
+        if budget is not None:
+            budget.charge(len(files), time.perf_counter() - start)
+        stack.extend((entry.path, prefix + entry.name, matcher) for entry in reversed(dirs))
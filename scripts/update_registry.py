@@ -1,85 +1,72 @@
 #!/usr/bin/env python3
 """
 Update project registry with latest metadata
+
+Runs the analysis steps in-process (one interpreter, shared imports) instead
+of spawning a Python subprocess per script.
 """
+import contextlib
+import importlib
+import io
 import sys
-import subprocess
 from pathlib import Path
-import os
 
 # Get the project root directory
 PROJECTS_DIR = Path(__file__).parent.parent
 SCRIPTS_DIR = PROJECTS_DIR / 'scripts'
 
-print("=" * 70)
-print("UPDATING PROJECT REGISTRY")
-print("=" * 70)
-
-# Change to scripts directory for execution
-os.chdir(SCRIPTS_DIR)
-
-print("\n🔄 Re-running project analysis...")
-
-# Run the analysis script
-result = subprocess.run(
-    ['python3', 'analyze_projects.py'],
-    capture_output=True,
-    text=True
-)
-
-if result.returncode != 0:
-    print(f"\n❌ Analysis failed: {result.stderr}")
-    sys.exit(1)
-
-print("\n🔄 Re-running consolidation analysis...")
-
-# Run consolidation analysis
-result = subprocess.run(
-    ['python3', 'consolidation_analysis.py'],
-    capture_output=True,
-    text=True
-)
-
-if result.returncode != 0:
-    print(f"\n❌ Consolidation analysis failed: {result.stderr}")
-    sys.exit(1)
-
-print("\n📚 Re-scanning Cursor files...")
-
-# Run cursor scan
-result = subprocess.run(
-    ['python3', 'scan_cursor_rules.py'],
-    capture_output=True,
-    text=True
-)
-
-if result.returncode != 0:
-    print(f"\n❌ Cursor scan failed: {result.stderr}")
-    sys.exit(1)
-
-print("\n📄 Regenerating documentation...")
-
-# Regenerate documentation
-result = subprocess.run(
-    ['python3', 'generate_documentation.py'],
-    capture_output=True,
-    text=True
-)
-
-if result.returncode != 0:
-    print(f"\n❌ Documentation generation failed: {result.stderr}")
-    sys.exit(1)
-
-print("\n" + "=" * 70)
-print("✅ REGISTRY UPDATE COMPLETE")
-print("=" * 70)
-print("\nUpdated files:")
-print("  • .project-registry.json")
-print("  • docs/README.md")
-print("  • docs/TECH_STACKS.md")
-print("  • docs/MATURITY_REPORT.md")
-print("  • analysis/project_comparison.json")
-print("  • analysis/consolidation_recommendations.json")
-print("  • analysis/cursor_files_inventory.json")
-print("=" * 70)
-
+# (message, module, failure label) in the order they must run
+STEPS = [
+    ("🔄 Re-running project analysis...", 'analyze_projects', 'Analysis'),
+    ("🔄 Re-running consolidation analysis...", 'consolidation_analysis', 'Consolidation analysis'),
+    ("📚 Re-scanning Cursor files...", 'scan_cursor_rules', 'Cursor scan'),
+    ("📄 Regenerating documentation...", 'generate_documentation', 'Documentation generation'),
+]
+
+
+def run_step(module_name: str, output: io.StringIO):
+    """Run a script's main() with stdout captured into output; stderr passes through"""
+    try:
+        with contextlib.redirect_stdout(output):
+            importlib.import_module(module_name).main()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            message = e.code if isinstance(e.code, str) else f"exited with status {e.code}"
+            raise RuntimeError(message) from e
+
+
+def main():
+    print("=" * 70)
+    print("UPDATING PROJECT REGISTRY")
+    print("=" * 70)
+    
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    
+    for message, module_name, label in STEPS:
+        print(f"\n{message}")
+        output = io.StringIO()
+        try:
+            run_step(module_name, output)
+        except Exception as e:
+            print(output.getvalue(), end='')
+            print(f"\n❌ {label} failed: {e}")
+            sys.exit(1)
+    
+    print("\n" + "=" * 70)
+    print("✅ REGISTRY UPDATE COMPLETE")
+    print("=" * 70)
+    print("\nUpdated files:")
+    print("  • .project-registry.json")
+    print("  • docs/README.md")
+    print("  • docs/TECH_STACKS.md")
+    print("  • docs/MATURITY_REPORT.md")
+    print("  • docs/DISK_USAGE.md")
+    print("  • analysis/project_comparison.json")
+    print("  • analysis/consolidation_recommendations.json")
+    print("  • analysis/cursor_files_inventory.json")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Monorepo/workspace discovery and per-package analysis
+
+Supports pnpm-workspace.yaml, npm/yarn "workspaces", Cargo and uv workspaces,
+and repos containing several pyproject.toml packages. Member packages are
+found with a single tree walk and analysed from the entries that walk read.
+"""
+import json
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from analyze_projects import ProjectListing, detect_tech_stack, tomllib
+from tree_walk import WalkBudget, walk_project
+
+WORKSPACE_WORKERS = 8
+TEST_FILE_PATTERN = re.compile(r'\.(test|spec)\.')
+
+
+def glob_to_regex(pattern: str) -> re.Pattern:
+    """Compile a workspace glob ('packages/*', 'apps/**') to an anchored regex"""
+    regex = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+        elif pattern[i] == '*':
+            regex += '[^/]*'
+            i += 1
+        elif pattern[i] == '?':
+            regex += '[^/]'
+            i += 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return re.compile(regex.rstrip('/') + '/?$')
+
+
+def parse_pnpm_workspace(path: Path) -> List[str]:
+    """Read the 'packages' list from pnpm-workspace.yaml without a YAML dependency"""
+    patterns = []
+    in_packages = False
+    for line in path.read_text(encoding='utf-8', errors='replace').splitlines():
+        stripped = line.split('#', 1)[0].rstrip()
+        if not stripped:
+            continue
+        if not line[0].isspace():
+            in_packages = stripped.startswith('packages:')
+        elif in_packages and stripped.lstrip().startswith('-'):
+            patterns.append(stripped.lstrip()[1:].strip().strip('\'"'))
+    return patterns
+
+
+def get_workspace_patterns(project_path: Path, listing: ProjectListing) -> Optional[Dict[str, Any]]:
+    """Determine the workspace tool and member globs declared at the project root"""
+    if listing.has_file('pnpm-workspace.yaml'):
+        return {'tool': 'pnpm', 'manifest': 'package.json',
+                'patterns': parse_pnpm_workspace(project_path / 'pnpm-workspace.yaml')}
+    
+    if listing.has_file('package.json'):
+        try:
+            with open(project_path / 'package.json', 'r', encoding='utf-8') as f:
+                workspaces = json.load(f).get('workspaces')
+        except Exception:
+            workspaces = None
+        if isinstance(workspaces, dict):
+            workspaces = workspaces.get('packages')
+        if workspaces:
+            tool = 'yarn' if listing.has_file('yarn.lock') else 'npm'
+            return {'tool': tool, 'manifest': 'package.json', 'patterns': list(workspaces)}
+    
+    for manifest, keys, tool in (('Cargo.toml', ('workspace',), 'cargo'),
+                                 ('pyproject.toml', ('tool', 'uv', 'workspace'), 'uv')):
+        if tomllib is None or not listing.has_file(manifest):
+            continue
+        try:
+            with open(project_path / manifest, 'rb') as f:
+                section = tomllib.load(f)
+        except Exception:
+            continue
+        for key in keys:
+            section = section.get(key, {})
+        if section.get('members'):
+            return {'tool': tool, 'manifest': manifest, 'patterns': list(section['members'])}
+    
+    return None
+
+
+def discover_workspace(project_path: Path, listing: Optional[ProjectListing] = None,
+                       budget: Optional[WalkBudget] = None) -> Optional[Dict[str, Any]]:
+    """Find workspace member packages with one walk of the project tree"""
+    listing = listing or ProjectListing(project_path)
+    declared = get_workspace_patterns(project_path, listing)
+    
+    # One walk: remember every directory holding a manifest, plus its entries
+    # and the test files below it, so members never need rescanning.
+    manifest_dirs = {}
+    test_files = Counter()
+    for dirpath, dirs, files in walk_project(project_path, budget):
+        rel = Path(dirpath).relative_to(project_path).as_posix()
+        names = {f.name for f in files}
+        if rel != '.' and names & {'package.json', 'pyproject.toml', 'Cargo.toml'}:
+            manifest_dirs[rel] = (dirs, files)
+        tests = sum(1 for name in names if TEST_FILE_PATTERN.search(name))
+        if tests:
+            test_files[rel] += tests
+    
+    if declared:
+        include = [glob_to_regex(p) for p in declared['patterns'] if not p.startswith('!')]
+        exclude = [glob_to_regex(p[1:]) for p in declared['patterns'] if p.startswith('!')]
+        members = [rel for rel, (_, files) in manifest_dirs.items()
+                   if any(f.name == declared['manifest'] for f in files)
+                   and any(r.match(rel) for r in include)
+                   and not any(r.match(rel) for r in exclude)]
+        tool = declared['tool']
+    else:
+        # Several independent Python packages in one repo
+        members = [rel for rel, (_, files) in manifest_dirs.items()
+                   if any(f.name == 'pyproject.toml' for f in files)]
+        if len(members) < 2:
+            return None
+        tool = 'python-packages'
+    
+    if not members:
+        return None
+    
+    return {
+        'tool': tool,
+        'members': [
+            {'path': rel, 'entries': manifest_dirs[rel][0] + manifest_dirs[rel][1],
+             'test_files': sum(n for d, n in test_files.items() if d == rel or d.startswith(rel + '/'))}
+            for rel in sorted(members)
+        ]
+    }
+
+
+def analyze_member(project_path: Path, member: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyse one workspace package from the entries read during discovery"""
+    member_path = project_path / member['path']
+    listing = ProjectListing(member_path, member['entries'])
+    tech_stack = detect_tech_stack(member_path, listing)
+    
+    name = member_path.name
+    if listing.has_file('package.json'):
+        try:
+            with open(member_path / 'package.json', 'r', encoding='utf-8') as f:
+                name = json.load(f).get('name') or name
+        except Exception:
+            pass
+    
+    return {
+        'name': name,
+        'path': member['path'],
+        'tech_stack': {
+            'primary_language': tech_stack['primary_language'],
+            'framework': tech_stack['framework'],
+            'categories': tech_stack['categories']
+        },
+        'has_readme': listing.has_file('README.md'),
+        'test_files': member['test_files']
+    }
+
+
+def analyze_workspace(project_path: Path, listing: Optional[ProjectListing] = None,
+                      max_workers: int = WORKSPACE_WORKERS,
+                      budget: Optional[WalkBudget] = None) -> Optional[Dict[str, Any]]:
+    """Discover workspace members and analyse them in parallel"""
+    workspace = discover_workspace(project_path, listing, budget)
+    if not workspace:
+        return None
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        packages = list(executor.map(lambda m: analyze_member(project_path, m), workspace['members']))
+    
+    return {'tool': workspace['tool'], 'packages': packages}
+
+
+def rollup_tech_stack(tech_stack: Dict[str, Any], workspace: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold per-package results into the project's tech stack.
+    
+    A workspace root usually only carries tooling, so the most common member
+    language/framework wins whenever the root has none (or is plain JavaScript
+    while packages are TypeScript).
+    """
+    packages = workspace['packages']
+    languages = Counter(p['tech_stack']['primary_language'] for p in packages if p['tech_stack']['primary_language'])
+    frameworks = Counter(p['tech_stack']['framework'] for p in packages if p['tech_stack']['framework'])
+    
+    rolled = dict(tech_stack)
+    if languages and (not tech_stack['primary_language'] or tech_stack['primary_language'] == 'JavaScript'):
+        rolled['primary_language'] = languages.most_common(1)[0][0]
+    if frameworks and not tech_stack['framework']:
+        rolled['framework'] = frameworks.most_common(1)[0][0]
+    
+    categories = [c for c in tech_stack['categories'] if c != 'Experiments']
+    for package in packages:
+        for category in package['tech_stack']['categories']:
+            if category != 'Experiments' and category not in categories:
+                categories.append(category)
+    rolled['categories'] = categories or ['Experiments']
+    rolled['package_languages'] = dict(languages)
+    rolled['package_frameworks'] = dict(frameworks)
+    
+    return rolled